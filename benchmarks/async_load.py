@@ -0,0 +1,91 @@
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.graph_async import AsyncGraphService
+from core.graph_generators import GraphGenerator
+from core.graph_new import Graph
+
+def build_graph(size: int, degree: int, seed: int) -> Graph:
+    """Builds a weighted Erdős–Rényi graph behind the `Graph` facade."""
+    u, v = GraphGenerator.erdos_renyi(size, size * degree // 2, seed=seed)
+    weights = GraphGenerator.random_weights(len(u), seed=seed)
+    graph = Graph(size, "Adjacency List", weighted=True)
+    for tail, head, weight in zip(u.tolist(), v.tolist(), weights.tolist()):
+        graph.add_edge(tail, head, weight)
+    return graph
+
+def percentile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+async def run_load(service: AsyncGraphService, num_requests: int, clients: int, hot_sources: int, size: int,
+                   seed: int) -> dict:
+    """Fires `num_requests` path queries from `clients` concurrent clients and reports latencies.
+
+    Sources are drawn from a small pool of hot nodes, which is where coalescing pays off.
+    """
+    rng = random.Random(seed)
+    sources = rng.sample(range(1, size + 1), hot_sources)
+    queries = [
+        {"id": index, "op": "path", "source": rng.choice(sources), "target": rng.randint(1, size)}
+        for index in range(num_requests)
+    ]
+    latencies = []
+    next_query = iter(queries)
+
+    async def client():
+        for query in next_query:
+            start_time = time.perf_counter()
+            reply = await service.query(query)
+            latencies.append(time.perf_counter() - start_time)
+            if not reply["ok"]:
+                raise RuntimeError(reply["error"])
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    elapsed = time.perf_counter() - start_time
+
+    return {
+        "requests": num_requests,
+        "seconds": elapsed,
+        "throughput": num_requests / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "computations": service.computations,
+        "coalesced": service.coalesced,
+    }
+
+async def main_async(args) -> None:
+    graph = build_graph(args.size, args.degree, args.seed)
+    for coalesce in (False, True):
+        async with AsyncGraphService(graph, max_concurrency=args.workers, processes=args.processes,
+                                     coalesce=coalesce) as service:
+            report = await run_load(service, args.requests, args.clients, args.hot_sources, args.size, args.seed)
+        label = "coalescing" if coalesce else "no coalescing"
+        print(
+            f"{label:<14} {report['throughput']:8.1f} req/s  p50 {report['p50_ms']:8.2f} ms  "
+            f"p99 {report['p99_ms']:8.2f} ms  computations {report['computations']:5d}  "
+            f"coalesced {report['coalesced']:5d}"
+        )
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Local load generator for AsyncGraphService.")
+    parser.add_argument("--size", type=int, default=5000, help="Number of nodes.")
+    parser.add_argument("--degree", type=int, default=8, help="Average node degree.")
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--clients", type=int, default=32, help="Concurrent clients.")
+    parser.add_argument("--hot-sources", type=int, default=8, help="Distinct sources the clients ask about.")
+    parser.add_argument("--workers", type=int, default=4, help="Executor workers (max concurrency).")
+    parser.add_argument("--processes", action="store_true", help="Use a process pool instead of threads.")
+    parser.add_argument("--seed", type=int, default=42)
+    asyncio.run(main_async(parser.parse_args()))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
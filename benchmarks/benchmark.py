@@ -0,0 +1,190 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import Graph
+from core.graph import Graph as LegacyGraph
+from core.graph_generators import GraphGenerator
+from core.graph_ordering import NodeOrdering
+
+REPRESENTATIONS = ("Adjacency List", "Adjacency Matrix")
+DEFAULT_SIZES = (100, 200, 400, 800)
+
+def write_random_graph(filename: str, size: int, num_edges: int, weighted: bool, seed: int) -> None:
+    """Writes an Erdős–Rényi graph in the data file format.
+
+    Edges are written as (u, v) with u < v, so the same file can be read as an
+    undirected graph or as a directed acyclic flow network.
+    """
+    u, v = GraphGenerator.erdos_renyi(size, num_edges, seed=seed)
+    weights = GraphGenerator.random_weights(len(u), 0.1, 10.0, seed=seed) if weighted else None
+    GraphGenerator.save_to_file(filename, size, u, v, weights)
+
+def build_cases(reorder: str = None) -> list:
+    """Returns the benchmark cases as (name, representations, max_size, setup, run) tuples.
+
+    `setup(files, representation)` prepares the input outside of the measured region
+    and `run(subject)` is the measured call. Facade graphs are relabeled with the
+    `reorder` strategy when one is given.
+    """
+    def facade(kind, directed=False):
+        weighted = kind == "weighted"
+        return lambda files, representation: Graph.from_file(
+            files[kind], representation, weighted, directed, reorder=reorder
+        )
+
+    def weighted_legacy(files, representation):
+        graph = LegacyGraph()
+        graph.initialize_graph_from_txt(files["weighted"], representation=representation, weighted=True, directed=False)
+        return graph
+
+    return [
+        ("load", REPRESENTATIONS, None,
+         lambda files, representation: (files["weighted"], representation),
+         lambda args: Graph.from_file(args[0], args[1], weighted=True, reorder=reorder)),
+        ("bfs", REPRESENTATIONS, None, facade("unweighted"), lambda graph: graph.bfs(1)),
+        ("bfs_frontier", ("Adjacency Matrix",), None, facade("unweighted"), lambda graph: graph.bfs_frontier(1)),
+        ("dfs", REPRESENTATIONS, None, facade("unweighted"), lambda graph: graph.dfs(1)),
+        ("dijkstra_list", ("Adjacency List",), None, weighted_legacy, lambda graph: graph.dijkstra(1)),
+        ("dijkstra_heap", ("Adjacency List",), None, weighted_legacy, lambda graph: graph.dijkstra(1, heap=True)),
+        ("dijkstra_matrix", ("Adjacency Matrix",), None, facade("weighted"), lambda graph: graph.dijkstra(1)),
+        ("diameter", REPRESENTATIONS, None, facade("unweighted"), lambda graph: graph.calculate_diameter()),
+        ("mst", REPRESENTATIONS, None, facade("weighted"), lambda graph: graph.minimum_spanning_forest()),
+        ("components", REPRESENTATIONS, None, facade("unweighted"), lambda graph: graph.find_connected_components()),
+        ("metrics", REPRESENTATIONS, None, facade("unweighted"), lambda graph: graph.get_degree_metrics()),
+        ("ford_fulkerson", REPRESENTATIONS, None, facade("weighted", directed=True),
+         lambda graph: graph.ford_fulkerson(1, graph.size)),
+    ]
+
+def measure(setup, run, repeat: int) -> dict:
+    """Times `run` on a fresh `setup()` result and records its tracemalloc peak separately."""
+    timings = []
+    for _ in range(repeat):
+        subject = setup()
+        gc.collect()
+        start_time = time.perf_counter()
+        run(subject)
+        timings.append(time.perf_counter() - start_time)
+
+    # Tracing slows the call down, so the memory peak gets a run of its own.
+    subject = setup()
+    gc.collect()
+    tracemalloc.start()
+    run(subject)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"seconds": min(timings), "mean_seconds": sum(timings) / len(timings), "peak_bytes": peak}
+
+def run_benchmarks(sizes, degree: int, repeat: int, seed: int, only=None, reorder: str = None) -> dict:
+    """Runs every case on every representation and size, returning a JSON-ready report."""
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for size in sizes:
+            files = {}
+            for kind in ("unweighted", "weighted"):
+                files[kind] = os.path.join(work_dir, f"graph_{size}_{kind}.txt")
+                write_random_graph(files[kind], size, size * degree // 2, kind == "weighted", seed + size)
+
+            for name, representations, max_size, setup, run in build_cases(reorder):
+                if only and name not in only:
+                    continue
+                for representation in representations:
+                    record = {"case": name, "representation": representation, "size": size}
+                    if max_size is not None and size > max_size:
+                        record["status"] = "skipped"
+                    else:
+                        try:
+                            record.update(measure(lambda: setup(files, representation), run, repeat))
+                            record["status"] = "ok"
+                        except NotImplementedError as error:
+                            record["status"] = "unsupported"
+                            record["reason"] = str(error)
+                    results.append(record)
+                    print(_format_record(record), flush=True)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": list(sizes),
+            "degree": degree,
+            "repeat": repeat,
+            "seed": seed,
+            "reorder": reorder,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+def _format_record(record: dict) -> str:
+    label = f"{record['case']:<16} {record['representation']:<17} n={record['size']:<6}"
+    if record["status"] != "ok":
+        return f"{label} {record['status']}"
+    return f"{label} {record['seconds'] * 1000:10.3f} ms  peak {record['peak_bytes'] / 1024:10.1f} KiB"
+
+def compare_reports(baseline: dict, current: dict, threshold: float, min_seconds: float) -> list:
+    """Lists the cases that got slower than `baseline` by more than `threshold` (a fraction).
+
+    Cases faster than `min_seconds` in the baseline are ignored, since their timings are mostly noise.
+    """
+    def key(record):
+        return record["case"], record["representation"], record["size"]
+
+    previous = {key(record): record for record in baseline["results"] if record["status"] == "ok"}
+    regressions = []
+    for record in current["results"]:
+        old = previous.get(key(record))
+        if record["status"] != "ok" or old is None or old["seconds"] < min_seconds:
+            continue
+        ratio = record["seconds"] / old["seconds"]
+        if ratio > 1 + threshold:
+            regressions.append({**record, "baseline_seconds": old["seconds"], "ratio": ratio})
+    return regressions
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks every graph representation and algorithm.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Graph sizes to run.")
+    parser.add_argument("--degree", type=int, default=8, help="Average node degree of the generated graphs.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case; the fastest is reported.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--cases", nargs="+", help="Only run these cases.")
+    parser.add_argument("--reorder", choices=NodeOrdering.STRATEGIES,
+                        help="Relabel nodes at load time, to compare traversal locality against a plain run.")
+    parser.add_argument("--output", help="Write the JSON report to this file.")
+    parser.add_argument("--baseline", help="JSON report to compare against.")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown before failing (0.25 = 25%%).")
+    parser.add_argument("--min-seconds", type=float, default=0.001, help="Ignore baseline cases faster than this.")
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.sizes, args.degree, args.repeat, args.seed, args.cases, args.reorder)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = compare_reports(baseline, report, args.threshold, args.min_seconds)
+        for record in regressions:
+            print(
+                f"REGRESSION {record['case']} {record['representation']} n={record['size']}: "
+                f"{record['baseline_seconds'] * 1000:.3f} ms -> {record['seconds'] * 1000:.3f} ms "
+                f"({record['ratio']:.2f}x)"
+            )
+        if regressions:
+            return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
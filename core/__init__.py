@@ -2,7 +2,10 @@
 from core.graph_algorithms import GraphAlgorithms
 from core.graph_algorithms import GraphFlowNetwork
 from core.graph_algorithms import GraphTraversal
+from core.graph_generators import GraphGenerator
+from core.graph_memory import RepresentationCostModel
 from core.graph_metrics import GraphMetrics
 from core.graph_new import Graph
 from core.graph_representations import AdjacencyList
 from core.graph_representations import AdjacencyMatrix
+from core.graph_stats import AlgorithmStats
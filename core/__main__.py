@@ -0,0 +1,38 @@
+import argparse
+import sys
+import time
+
+from core.graph_new import Graph
+from core.graph_server import GraphQueryServer
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m core",
+        description="Loads a graph once and answers newline-delimited JSON queries.",
+    )
+    parser.add_argument("file", help="Graph data file: the node count, then one edge per line.")
+    parser.add_argument("--representation", default="Adjacency List",
+                        choices=("Adjacency List", "Adjacency Matrix"))
+    parser.add_argument("--weighted", action="store_true", help="Edges carry a third weight column.")
+    parser.add_argument("--directed", action="store_true", help="Also build the flow network.")
+    parser.add_argument("--socket", help="Serve on this Unix socket path instead of stdin/stdout.")
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    graph = Graph.from_file(args.file, args.representation, args.weighted, args.directed)
+    print(f"Loaded {args.file} ({graph.size} nodes) in {time.perf_counter() - start_time:.3f} seconds",
+          file=sys.stderr, flush=True)
+
+    server = GraphQueryServer(graph)
+    if args.socket:
+        print(f"Listening on {args.socket}", file=sys.stderr, flush=True)
+        try:
+            server.serve_unix_socket(args.socket)
+        except KeyboardInterrupt:
+            pass
+    else:
+        server.serve_stream(sys.stdin, sys.stdout)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
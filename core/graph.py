@@ -1,5 +1,6 @@
 import random
 import statistics
+from collections import deque
 from heapq import heapify
 from heapq import heappop
 from heapq import heappush
@@ -172,25 +173,37 @@ class Graph:
             print(f"Start node {start_node} is not in the graph.")
             return []
 
-        visited = set()
-        parents = {start_node: None}
         bfs_order = []
-        queue = [start_node]
+        parents = {}
+        for node, _, parent in self.iter_bfs_adjacency_list(start_node):
+            bfs_order.append(node)
+            parents[node] = parent
 
-        visited.add(start_node)
+        return (bfs_order, parents)
+
+    def iter_bfs_adjacency_list(self, start_node: int, max_depth: int = None):
+        """Lazily performs BFS on the adjacency list, so callers can stop early.
+
+        Args:
+            start_node (int): The starting node for BFS.
+            max_depth (int): Do not expand nodes at this depth, if given.
+
+        Yields:
+            tuple: `(node, depth, parent)`, with a `None` parent for the start node.
+        """
+        visited = {start_node}
+        queue = deque([(start_node, 0, None)])
 
         while queue:
-            current_node = queue[0]
-            queue = queue[1:]
-            bfs_order.append(current_node)
+            current_node, depth, parent = queue.popleft()
+            yield current_node, depth, parent
+            if max_depth is not None and depth >= max_depth:
+                continue
 
             for neighbor in self.adjacency_list[current_node]:
                 if neighbor not in visited:
                     visited.add(neighbor)
-                    queue.append(neighbor)
-                    parents[neighbor] = current_node
-
-        return (bfs_order, parents)
+                    queue.append((neighbor, depth + 1, current_node))
 
     def bfs_adjacency_matrix(self, start_node: int) -> list:
         """Performs BFS on the adjacency matrix representation of the graph.
@@ -334,24 +347,9 @@ class Graph:
         if self.is_weighted:
             print("Graph is weighted, please use Djikstra.")
             return -1
-        if start_node == target_node:
-            return 0
-
-        visited = set()
-        queue = [(start_node, 0)]
-
-        visited.add(start_node)
-
-        while queue:
-            current_node, distance = queue[0]
-            queue = queue[1:]
-
-            for neighbor in self.adjacency_list[current_node]:
-                if neighbor == target_node:
-                    return distance + 1
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, distance + 1))
+        for node, distance, _ in self.iter_bfs_adjacency_list(start_node):
+            if node == target_node:
+                return distance
 
         return -1
 
@@ -2,8 +2,13 @@ import heapq
 from collections import defaultdict
 from collections import deque
 
+import numpy as np
+
 from core.graph_representations import AdjacencyList
 from core.graph_representations import AdjacencyMatrix
+from core.graph_stats import AlgorithmStats
+from core.graph_stats import deep_sizeof
+from core.union_find import UnionFind
 
 class GraphTraversal:
     """Implements traversal algorithms for the graph."""
@@ -11,15 +16,23 @@ class GraphTraversal:
     def __init__(self, representation):
         self.representation = representation
 
-    def bfs(self, start_node: int):
+    def bfs(self, start_node: int, collect_stats: bool = False):
         """Chooses the appropriate BFS method based on the representation type.
 
         Args:
             start_node (int): The node from which to start BFS.
+            collect_stats (bool): Also return an `AlgorithmStats` for the run.
 
         Returns:
             list: A list of nodes in the order they are visited.
         """
+        if collect_stats:
+            stats = AlgorithmStats("bfs")
+            with stats.track_memory(), stats.phase("traversal"):
+                bfs_order = self.bfs(start_node)
+            self._count_scans(stats, bfs_order)
+            return bfs_order, stats
+
         if isinstance(self.representation, AdjacencyList):
             adj_list = self.representation.get_representation()
             visited = set()
@@ -51,16 +64,24 @@ class GraphTraversal:
         else:
             raise ValueError("Unsupported graph representation.")
 
-    def dfs(self, start_node: int):
+    def dfs(self, start_node: int, collect_stats: bool = False):
         """
         Performs DFS based on the graph representation (Adjacency List or Matrix).
 
         Args:
             start_node (int): The node from which to start DFS.
+            collect_stats (bool): Also return an `AlgorithmStats` for the run.
 
         Returns:
             list: A list of nodes in the order they are visited.
         """
+        if collect_stats:
+            stats = AlgorithmStats("dfs")
+            with stats.track_memory(), stats.phase("traversal"):
+                result = self.dfs(start_node)
+            self._count_scans(stats, result[0] if isinstance(result, tuple) else result)
+            return result, stats
+
         if isinstance(self.representation, AdjacencyList):
             adj_list = self.representation.get_representation()
             visited = set()
@@ -96,6 +117,335 @@ class GraphTraversal:
             return dfs_order
         else:
             raise ValueError("Unsupported graph representation.")
+
+    def bfs_frontier(self, start_node: int):
+        """Runs BFS on the adjacency matrix one whole frontier at a time.
+
+        Each level is a boolean matrix-vector product: the rows of the frontier nodes
+        are OR-ed together and masked by the visited set, so the work per level is a
+        few NumPy calls instead of a Python loop over every matrix row.
+
+        Args:
+            start_node (int): The node from which to start BFS.
+
+        Returns:
+            tuple: `(bfs_order, distances)`, where the order lists nodes level by level
+            (ascending ids within a level) and `distances[node - 1]` is the hop count,
+            or -1 when unreachable.
+        """
+        adjacency = self._boolean_adjacency()
+        distances = np.full(self.representation.size, -1, dtype=self._hop_dtype())
+        distances[start_node - 1] = 0
+        visited = np.zeros(self.representation.size, dtype=bool)
+        visited[start_node - 1] = True
+        frontier = np.array([start_node - 1])
+        bfs_order = [start_node]
+        level = 0
+
+        while len(frontier):
+            level += 1
+            reached = adjacency[frontier].any(axis=0)
+            reached &= ~visited
+            frontier = np.flatnonzero(reached)
+            visited[frontier] = True
+            distances[frontier] = level
+            bfs_order.extend((frontier + 1).tolist())
+        return bfs_order, distances
+
+    def multi_source_bfs(self, sources, batch_size: int = 256):
+        """Runs one BFS per source at once as boolean matrix-matrix products.
+
+        The frontiers of a batch of sources form a k x n matrix; each level multiplies it
+        by the adjacency matrix (as float32 GEMM) and masks the result by what every
+        source has already visited.
+
+        Args:
+            sources (list): Start nodes.
+            batch_size (int): Sources per product, to bound the k x n temporaries.
+
+        Returns:
+            numpy.ndarray: A len(sources) x n matrix of hop distances (int32 unless the
+            representation sets a `node_dtype`), -1 when unreachable.
+        """
+        adjacency = self._boolean_adjacency().astype(np.float32)
+        sources = np.asarray(sources, dtype=np.int64)
+        distances = np.full((len(sources), self.representation.size), -1, dtype=self._hop_dtype())
+
+        for start in range(0, len(sources), batch_size):
+            batch = sources[start:start + batch_size]
+            rows = np.arange(len(batch))
+            frontier = np.zeros((len(batch), self.representation.size), dtype=bool)
+            frontier[rows, batch - 1] = True
+            visited = frontier.copy()
+            batch_distances = distances[start:start + batch_size]
+            batch_distances[rows, batch - 1] = 0
+            level = 0
+
+            while frontier.any():
+                level += 1
+                reached = (frontier.astype(np.float32) @ adjacency) > 0
+                reached &= ~visited
+                batch_distances[reached] = level
+                visited |= reached
+                frontier = reached
+        return distances
+
+    def bit_parallel_bfs(self, sources=None):
+        """Runs BFS from many sources at once, 64 per pass, with bitwise NumPy operations.
+
+        Each node keeps one uint64 word per pass whose bit i says "reached from the
+        i-th source of the batch". A level pulls the frontier words of every node's
+        in-neighbors and ORs them together, so one scan of the edges advances all 64
+        searches. Bits that are new in a level give that level's distance counts.
+
+        Args:
+            sources (list): 1-based start nodes; every node when omitted.
+
+        Returns:
+            tuple: `(eccentricities, histogram)`. `eccentricities[i]` is the largest hop
+            distance reached from `sources[i]`, and `histogram[d]` counts the
+            (source, node) pairs at distance `d`, including the sources themselves at 0.
+        """
+        size = self.representation.size
+        sources = np.arange(1, size + 1) if sources is None else np.asarray(sources, dtype=np.int64)
+        indptr, indices = self.representation.to_csr()
+
+        # Pull direction: group the edges by head, so each node ORs the words of its tails.
+        tails = np.repeat(np.arange(size), np.diff(indptr))
+        by_head = np.argsort(indices, kind="stable")
+        pull_tails = tails[by_head]
+        sorted_heads = indices[by_head]
+        starts = np.flatnonzero(np.diff(sorted_heads, prepend=-1))
+        heads_with_edges = sorted_heads[starts]
+
+        eccentricities = np.zeros(len(sources), dtype=self._hop_dtype())
+        histogram = [0]
+        bit_values = np.uint64(1) << np.arange(64, dtype=np.uint64)
+
+        for batch_start in range(0, len(sources), 64):
+            batch = sources[batch_start:batch_start + 64] - 1
+            visited = np.zeros(size, dtype=np.uint64)
+            np.bitwise_or.at(visited, batch, bit_values[:len(batch)])
+            frontier = visited.copy()
+            histogram[0] += len(batch)
+            level = 0
+
+            while len(pull_tails):
+                reached = np.zeros(size, dtype=np.uint64)
+                reached[heads_with_edges] = np.bitwise_or.reduceat(frontier[pull_tails], starts)
+                reached &= ~visited
+                if not reached.any():
+                    break
+                level += 1
+                visited |= reached
+                frontier = reached
+
+                if len(histogram) <= level:
+                    histogram.append(0)
+                histogram[level] += int(np.bitwise_count(reached).sum())
+                active = (np.bitwise_or.reduce(reached) & bit_values[:len(batch)]) != 0
+                eccentricities[batch_start:batch_start + len(batch)][active] = level
+
+        return eccentricities, histogram
+
+    def _hop_dtype(self):
+        """Integer type of hop-distance outputs: the representation's node dtype, int32 by default."""
+        return np.dtype(self.representation.node_dtype or np.int32)
+
+    def _undirected_adjacency(self):
+        """Returns the matrix edge mask made symmetric, so an edge stored one way joins both endpoints."""
+        adjacency = self._boolean_adjacency()
+        return adjacency | adjacency.T
+
+    @staticmethod
+    def _matrix_component(adjacency, start_node: int, unvisited) -> list:
+        """Collects a start node's component a frontier at a time, clearing its nodes in `unvisited`."""
+        unvisited[start_node - 1] = False
+        component = [start_node]
+        frontier = np.array([start_node - 1])
+        while len(frontier):
+            frontier = np.flatnonzero(adjacency[frontier].any(axis=0) & unvisited)
+            unvisited[frontier] = False
+            component.extend((frontier + 1).tolist())
+        return component
+
+    def _boolean_adjacency(self):
+        """Returns the adjacency matrix as a boolean edge mask."""
+        if not isinstance(self.representation, AdjacencyMatrix):
+            raise NotImplementedError("Frontier BFS is only implemented for Adjacency Matrix.")
+        matrix = self.representation.get_representation()
+        return (matrix != float('inf')) & (matrix != 0)
+
+    def bfs_distances(self, start_node: int):
+        """Computes hop distances and the BFS tree from a start node.
+
+        Args:
+            start_node (int): The node from which to start BFS.
+
+        Returns:
+            tuple: `(distances, parents)` dictionaries covering the reachable nodes.
+        """
+        distances = {start_node: 0}
+        parents = {start_node: None}
+        queue = deque([start_node])
+
+        while queue:
+            node = queue.popleft()
+            next_distance = distances[node] + 1
+            for neighbor in self.neighbors(node):
+                if neighbor not in distances:
+                    distances[neighbor] = next_distance
+                    parents[neighbor] = node
+                    queue.append(neighbor)
+        return distances, parents
+
+    def iter_bfs(self, start_node: int, max_depth: int = None):
+        """Lazily walks the graph breadth-first.
+
+        A node's neighbors are only scanned when the caller asks for the next node
+        past it, so stopping early (at a target, or after a visit budget with
+        `itertools.islice`) costs only what was touched.
+
+        Args:
+            start_node (int): The node from which to start BFS.
+            max_depth (int): Do not expand nodes at this depth, if given.
+
+        Yields:
+            tuple: `(node, depth, parent)`, with a `None` parent for the start node.
+        """
+        seen = {start_node}
+        queue = deque([(start_node, 0, None)])
+
+        while queue:
+            node, depth, parent = queue.popleft()
+            yield node, depth, parent
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for neighbor in self.neighbors(node):
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    queue.append((neighbor, depth + 1, node))
+
+    def iter_dfs(self, start_node: int, max_depth: int = None):
+        """Lazily walks the graph depth-first, in preorder.
+
+        Args:
+            start_node (int): The node from which to start DFS.
+            max_depth (int): Do not go deeper than this, if given.
+
+        Yields:
+            tuple: `(node, depth, parent)`, with a `None` parent for the start node.
+        """
+        visited = {start_node}
+        yield start_node, 0, None
+        stack = [(start_node, iter(self.neighbors(start_node)))]
+
+        while stack:
+            node, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if neighbor not in visited:
+                    break
+            else:
+                stack.pop()
+                continue
+
+            visited.add(neighbor)
+            yield neighbor, len(stack), node
+            if max_depth is None or len(stack) < max_depth:
+                stack.append((neighbor, iter(self.neighbors(neighbor))))
+
+    def neighborhood(self, start_node: int, radius: int) -> dict:
+        """Returns the hop distance of every node within `radius` hops of a start node."""
+        return {node: depth for node, depth, _ in self.iter_bfs(start_node, radius)}
+
+    def hop_path(self, start_node: int, target_node: int, max_depth: int = None):
+        """Finds a fewest-hops path, stopping the BFS as soon as the target is reached.
+
+        Returns:
+            tuple: `(path, hops)`, or `([], inf)` when the target is not within reach.
+        """
+        parents = {}
+        for node, depth, parent in self.iter_bfs(start_node, max_depth):
+            parents[node] = parent
+            if node == target_node:
+                return GraphAlgorithms.build_path(parents, start_node, target_node), depth
+        return [], float("inf")
+
+    def connected_components(self):
+        """Finds the connected components, largest first.
+
+        An edge joins its endpoints whichever direction it is stored in: a weighted
+        Adjacency Matrix keeps only u -> v, so its components are the weakly
+        connected ones, and they do not depend on the node numbering.
+
+        Returns:
+            list: One list of nodes per component, in descending order of size.
+        """
+        components = []
+        if isinstance(self.representation, AdjacencyMatrix):
+            adjacency = self._undirected_adjacency()
+            unvisited = np.ones(self.representation.size, dtype=bool)
+            for node in range(1, self.representation.size + 1):
+                if unvisited[node - 1]:
+                    components.append(self._matrix_component(adjacency, node, unvisited))
+        else:
+            visited = set()
+            for node in range(1, self.representation.size + 1):
+                if node not in visited:
+                    component, _ = self.bfs_distances(node)
+                    visited.update(component)
+                    components.append(list(component))
+
+        components.sort(key=len, reverse=True)
+        return components
+
+    def component(self, start_node: int) -> list:
+        """Lists the nodes in the connected component of a start node, as `connected_components` defines it."""
+        if isinstance(self.representation, AdjacencyMatrix):
+            unvisited = np.ones(self.representation.size, dtype=bool)
+            return self._matrix_component(self._undirected_adjacency(), start_node, unvisited)
+        component, _ = self.bfs_distances(start_node)
+        return list(component)
+
+    def component_labels(self):
+        """Labels every node with its connected component, numbered by decreasing size.
+
+        Returns:
+            numpy.ndarray: Component label of each node (index node id - 1); 0 is the largest component.
+        """
+        labels = np.empty(self.representation.size, dtype=np.int64)
+        for label, component in enumerate(self.connected_components()):
+            labels[np.array(component, dtype=np.int64) - 1] = label
+        return labels
+
+    def undirected_neighbors(self, node: int):
+        """Returns the nodes joined to a node by an edge stored in either direction, as 1-based ids."""
+        if isinstance(self.representation, AdjacencyMatrix):
+            matrix = self.representation.get_representation()
+            row, column = matrix[node - 1], matrix[:, node - 1]
+            joined = ((row != float('inf')) & (row != 0)) | ((column != float('inf')) & (column != 0))
+            return (np.flatnonzero(joined) + 1).tolist()
+        return self.neighbors(node)
+
+    def neighbors(self, node: int):
+        """Returns the neighbors of a node as 1-based ids, for either representation."""
+        if isinstance(self.representation, AdjacencyList):
+            return self.representation.get_representation()[node]
+        elif isinstance(self.representation, AdjacencyMatrix):
+            row = self.representation.get_representation()[node - 1]
+            return (np.flatnonzero((row != float('inf')) & (row != 0)) + 1).tolist()
+        else:
+            raise ValueError("Unsupported graph representation.")
+
+    def _count_scans(self, stats: AlgorithmStats, order: list) -> None:
+        """Derives the traversal counters from the visit order, so the search loops stay untouched."""
+        stats.increment("nodes_visited", len(order))
+        if isinstance(self.representation, AdjacencyList):
+            adj_list = self.representation.get_representation()
+            stats.increment("edges_scanned", sum(len(adj_list[node]) for node in order))
+        else:
+            # Every visited node scans its whole matrix row.
+            stats.increment("edges_scanned", len(order) * self.representation.size)
         
 
 class GraphAlgorithms:
@@ -104,8 +454,373 @@ class GraphAlgorithms:
     def __init__(self, representation):
         self.representation = representation
 
-    def dijkstra(self, start_node: int):
-        """Implements Dijkstra's algorithm for shortest paths."""
+    def dijkstra(self, start_node: int, collect_stats: bool = False):
+        """Implements Dijkstra's algorithm for shortest paths.
+
+        Adjacency Lists use a binary heap; an Adjacency Matrix is searched densely in
+        O(n^2), following edges in the direction the matrix stores them.
+
+        With `collect_stats=True` the result is returned as `((dist, parents), stats)`.
+        """
+        if collect_stats:
+            stats = AlgorithmStats("dijkstra")
+            with stats.track_memory(), stats.phase("search"):
+                result = self._dijkstra(start_node, stats)
+            # The source starts in the heap, so every push comes from a successful relaxation
+            # (the dense matrix search counts its updates itself).
+            stats.increment("distance_updates", stats.counters.get("heap_pushes", 0))
+            return result, stats
+        return self._dijkstra(start_node, None)
+
+    def dijkstra_arrays(self, start_node: int):
+        """Runs Dijkstra's algorithm and returns compact arrays instead of dictionaries.
+
+        Returns:
+            tuple: `(dist, parents)` indexed by node id - 1. `dist` uses the weight
+            dtype of the representation (float64 by default; unreachable nodes get inf,
+            or -1 for integer weights) and `parents` the node dtype (0 means no parent).
+        """
+        dist, parents = self.dijkstra(start_node)
+        size = self.representation.size
+        weight_dtype = getattr(self.representation, "dtype", None) or np.dtype(np.float64)
+        node_dtype = np.dtype(self.representation.node_dtype or np.int64)
+
+        distances = np.fromiter(dist.values(), dtype=np.float64, count=size)
+        if weight_dtype.kind != "f":
+            distances[np.isinf(distances)] = -1
+        parent_ids = np.fromiter((parent or 0 for parent in parents.values()), dtype=node_dtype, count=size)
+        order = np.fromiter(dist.keys(), dtype=np.int64, count=size) - 1
+        dist_array = np.empty(size, dtype=weight_dtype)
+        parent_array = np.empty(size, dtype=node_dtype)
+        dist_array[order] = distances
+        parent_array[order] = parent_ids
+        return dist_array, parent_array
+
+    def shortest_path(self, start_node: int, target_node: int):
+        """Finds a shortest weighted path between two nodes with Dijkstra's algorithm.
+
+        Returns:
+            tuple: `(path, distance)`, or `([], inf)` when the target is unreachable.
+        """
+        dist, parents = self.dijkstra(start_node)
+        return self.build_path(parents, start_node, target_node), dist[target_node]
+
+    def pair_distances(self, sources, targets, weighted: bool = True, paths: bool = False):
+        """Computes the distance of many (source, target) pairs with one search per distinct source.
+
+        Pairs are grouped by source and each group runs one Dijkstra (or BFS, when
+        not `weighted`) that stops as soon as all of its targets are settled. When
+        every edge is stored both ways and there are fewer distinct targets than
+        sources, the searches start from the targets instead. A weighted Adjacency
+        Matrix stores edges one way, so its searches always start from the sources.
+
+        Args:
+            sources: Source node of each pair.
+            targets: Target node of each pair, aligned with `sources`.
+            weighted (bool): Sum edge weights (Adjacency List only) instead of counting hops.
+            paths (bool): Also rebuild the path of every pair.
+
+        Returns:
+            numpy.ndarray: Distance of each pair in input order (inf when unreachable), or
+            `(distances, paths)` with `paths`, where unreachable pairs get an empty path.
+        """
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        if sources.shape != targets.shape or sources.ndim != 1:
+            raise ValueError("Sources and targets must be 1-D arrays of the same length.")
+        if weighted and not isinstance(self.representation, AdjacencyList):
+            raise NotImplementedError("Weighted pair distances need an Adjacency List.")
+
+        groups = [self._group_pairs(sources), self._group_pairs(targets)]
+        reverse = len(groups[1][1]) < len(groups[0][1]) and self._symmetric()
+        (order, starts), origins, goals = groups[reverse], (targets if reverse else sources), (sources if reverse else targets)
+        distances = np.full(len(sources), np.inf)
+        found_paths = [[] for _ in range(len(sources))] if paths else None
+
+        bounds = np.append(starts, len(order)).tolist()
+        for group in range(len(starts)):
+            pairs = order[bounds[group]:bounds[group + 1]]
+            origin = int(origins[pairs[0]])
+            pair_goals = goals[pairs].tolist()
+            dist, parents = self._search_until(origin, set(pair_goals), weighted)
+            for pair, goal in zip(pairs.tolist(), pair_goals):
+                if goal not in dist:
+                    continue
+                distances[pair] = dist[goal]
+                if paths:
+                    path = self.build_path(parents, origin, goal)
+                    found_paths[pair] = path[::-1] if reverse else path
+
+        return (distances, found_paths) if paths else distances
+
+    def _symmetric(self) -> bool:
+        """Checks that every stored edge is also stored in the other direction."""
+        if isinstance(self.representation, AdjacencyMatrix):
+            matrix = self.representation.get_representation()
+            adjacency = (matrix != float('inf')) & (matrix != 0)
+            return bool(np.array_equal(adjacency, adjacency.T))
+        return True
+
+    @staticmethod
+    def _group_pairs(nodes):
+        """Sorts pair indices by node; returns the order and where each distinct node's run starts."""
+        order = np.argsort(nodes, kind="stable")
+        starts = np.flatnonzero(np.diff(nodes[order], prepend=-1))
+        return order, starts
+
+    def _search_until(self, start_node: int, targets: set, weighted: bool):
+        """Dijkstra or BFS from a start node, stopped once every target is settled.
+
+        Returns:
+            tuple: `(dist, parents)` dictionaries; every reachable target is in `dist` with its final distance.
+        """
+        remaining = set(targets)
+        remaining.discard(start_node)
+        dist = {start_node: 0}
+        parents = {start_node: None}
+
+        if weighted:
+            adj_list = self.representation.get_representation()
+            settled = {start_node}
+            queue = [(0, start_node)]
+            while queue and remaining:
+                current_dist, node = heapq.heappop(queue)
+                if current_dist > dist[node]:
+                    continue
+                settled.add(node)
+                remaining.discard(node)
+                for neighbor, weight in adj_list[node].items():
+                    new_dist = current_dist + weight
+                    if new_dist < dist.get(neighbor, float("inf")):
+                        dist[neighbor] = new_dist
+                        parents[neighbor] = node
+                        heapq.heappush(queue, (new_dist, neighbor))
+            # Stopped early: nodes still in the heap only have tentative distances.
+            return {node: dist[node] for node in settled}, parents
+
+        traversal = GraphTraversal(self.representation)
+        queue = deque([start_node])
+        while queue and remaining:
+            node = queue.popleft()
+            next_dist = dist[node] + 1
+            for neighbor in traversal.neighbors(node):
+                if neighbor not in dist:
+                    dist[neighbor] = next_dist
+                    parents[neighbor] = node
+                    remaining.discard(neighbor)
+                    queue.append(neighbor)
+        return dist, parents
+
+    @staticmethod
+    def build_path(parents, start_node: int, target_node: int) -> list:
+        """Walks a parents mapping back from the target to rebuild the path from the start."""
+        if target_node != start_node and parents.get(target_node) is None:
+            return []
+        path = [target_node]
+        while path[-1] != start_node:
+            path.append(parents[path[-1]])
+        path.reverse()
+        return path
+
+    def floyd_warshall(self, dtype=None, block_size: int = 256, predecessors: bool = False):
+        """Computes all-pairs shortest paths with a blocked, vectorized Floyd-Warshall.
+
+        The matrix is processed in block_size x block_size tiles: for each block of
+        intermediate nodes the diagonal tile is solved first, then its row and column
+        panels, then every remaining tile. Each step is one `np.minimum` over a tile
+        small enough to stay in cache.
+
+        Args:
+            dtype: "float32" halves memory and bandwidth; "float64" keeps full precision.
+                Defaults to the matrix dtype when it is a float type, float64 otherwise.
+            block_size (int): Tile edge length.
+            predecessors (bool): Also return the predecessor matrix for path reconstruction.
+
+        Returns:
+            numpy.ndarray | tuple: The n x n distance matrix, plus the predecessor
+            matrix when requested. `pred[i - 1, j - 1]` is the node before j on a shortest
+            path from i, or 0 when there is none.
+
+        Raises:
+            ValueError: If the graph contains a negative cycle.
+        """
+        if not isinstance(self.representation, AdjacencyMatrix):
+            raise NotImplementedError("Floyd-Warshall is only implemented for Adjacency Matrix.")
+
+        if dtype is None:
+            matrix_dtype = self.representation.dtype
+            dtype = matrix_dtype if matrix_dtype.kind == "f" else np.float64
+        dist = np.array(self.representation.weight_matrix(), dtype=dtype)
+        size = len(dist)
+        pred = None
+        if predecessors:
+            has_edge = np.isfinite(dist)
+            np.fill_diagonal(has_edge, False)
+            pred = np.where(has_edge, np.arange(1, size + 1, dtype=np.int32)[:, None], 0).astype(np.int32)
+
+        blocks = [slice(start, min(start + block_size, size)) for start in range(0, size, block_size)]
+        for k_block in blocks:
+            self._relax_tile(dist, pred, k_block, k_block, k_block)
+            for block in blocks:
+                if block != k_block:
+                    self._relax_tile(dist, pred, k_block, block, k_block)
+                    self._relax_tile(dist, pred, block, k_block, k_block)
+            for i_block in blocks:
+                for j_block in blocks:
+                    if i_block != k_block and j_block != k_block:
+                        self._relax_tile(dist, pred, i_block, j_block, k_block)
+
+        if np.any(np.diagonal(dist) < 0):
+            raise ValueError("Graph contains a negative cycle.")
+
+        return (dist, pred) if predecessors else dist
+
+    @staticmethod
+    def _relax_tile(dist, pred, rows: slice, cols: slice, intermediates: slice) -> None:
+        """Relaxes the tile dist[rows, cols] through every node in `intermediates`, in order."""
+        tile = dist[rows, cols]
+        pred_tile = pred[rows, cols] if pred is not None else None
+        candidate = np.empty_like(tile)
+        for k in range(intermediates.start, intermediates.stop):
+            np.add(dist[rows, k][:, None], dist[k, cols][None, :], out=candidate)
+            if pred_tile is None:
+                np.minimum(tile, candidate, out=tile)
+            else:
+                better = candidate < tile
+                tile[better] = candidate[better]
+                pred_tile[better] = np.broadcast_to(pred[k, cols], tile.shape)[better]
+
+    @staticmethod
+    def build_matrix_path(pred, start_node: int, target_node: int) -> list:
+        """Rebuilds a path from a Floyd-Warshall predecessor matrix (1-based node ids)."""
+        if start_node == target_node:
+            return [start_node]
+        if pred[start_node - 1, target_node - 1] == 0:
+            return []
+        path = [target_node]
+        while path[-1] != start_node:
+            path.append(int(pred[start_node - 1, path[-1] - 1]))
+        path.reverse()
+        return path
+
+    def minimum_spanning_forest(self):
+        """Computes a minimum spanning forest, treating every edge as undirected.
+
+        Uses Prim on an Adjacency Matrix and Kruskal on an Adjacency List.
+
+        Returns:
+            tuple: `(u, v, weights, total_weight)`, with the forest edges as 1-based arrays.
+        """
+        if isinstance(self.representation, AdjacencyMatrix):
+            return self.prim()
+        elif isinstance(self.representation, AdjacencyList):
+            return self.kruskal()
+        else:
+            raise ValueError("Unsupported graph representation.")
+
+    def kruskal(self):
+        """Runs Kruskal's algorithm on the edges of either representation."""
+        u, v, weights = self._edge_arrays()
+        return self.kruskal_edges(self.representation.size, u, v, weights)
+
+    @staticmethod
+    def kruskal_edges(size: int, u, v, weights, chunk_size: int = None):
+        """Kruskal's algorithm on edge arrays, without building a representation.
+
+        The edges are sorted once with `argsort` and scanned in chunks. Before a chunk
+        is scanned, the component label of every node is refreshed from the union-find
+        and the edges whose endpoints already share a component are dropped in one
+        vectorized step, so the Python loop only sees edges that may join two trees.
+
+        Args:
+            size (int): Number of nodes.
+            u, v: 1-based endpoint arrays.
+            weights: Edge weights.
+            chunk_size (int): Edges per chunk; defaults to the number of nodes.
+
+        Returns:
+            tuple: `(u, v, weights, total_weight)`, with the forest edges as 1-based arrays.
+        """
+        u, v, weights = np.asarray(u), np.asarray(v), np.asarray(weights)
+        order = np.argsort(weights, kind="stable")
+        chunk_size = chunk_size or max(size, 1)
+        components = UnionFind(size)
+        chosen = []
+
+        for chunk_start in range(0, len(order), chunk_size):
+            if components.count == 1:
+                break
+            chunk = order[chunk_start:chunk_start + chunk_size]
+            labels = components.roots()
+            chunk = chunk[labels[u[chunk] - 1] != labels[v[chunk] - 1]]
+            for edge, tail, head in zip(chunk.tolist(), (u[chunk] - 1).tolist(), (v[chunk] - 1).tolist()):
+                if components.union(tail, head):
+                    chosen.append(edge)
+
+        chosen = np.array(chosen, dtype=np.int64)
+        return u[chosen], v[chosen], weights[chosen], float(weights[chosen].sum())
+
+    def prim(self):
+        """Runs Prim's algorithm on an Adjacency Matrix with a vectorized key array.
+
+        Each step takes the cheapest node outside the forest with `argmin` and lowers
+        the keys of all other nodes with one `minimum` over its matrix row. A node
+        with an infinite key starts a new tree, which yields a forest on disconnected graphs.
+        """
+        if not isinstance(self.representation, AdjacencyMatrix):
+            raise NotImplementedError("Prim's algorithm is only implemented for Adjacency Matrix.")
+        matrix = self.representation.weight_matrix()
+        size = self.representation.size
+        # Single-direction weighted entries still count as undirected edges; zeros are not edges.
+        weights = np.minimum(matrix, matrix.T)
+        weights[weights == 0] = np.inf
+
+        # Unreached nodes sit just below the inf that marks nodes already in the forest.
+        keys = np.full(size, np.finfo(np.float64).max)
+        parents = np.full(size, -1, dtype=np.int64)
+        outside = np.ones(size, dtype=bool)
+        tails, heads = [], []
+
+        for _ in range(size):
+            node = int(np.argmin(keys))
+            keys[node] = np.inf
+            outside[node] = False
+            if parents[node] >= 0:
+                tails.append(parents[node])
+                heads.append(node)
+            row = weights[node]
+            improved = outside & (row < keys)
+            keys[improved] = row[improved]
+            parents[improved] = node
+
+        tails, heads = np.array(tails, dtype=np.int64), np.array(heads, dtype=np.int64)
+        forest_weights = weights[tails, heads]
+        return tails + 1, heads + 1, forest_weights, float(forest_weights.sum())
+
+    def _edge_arrays(self):
+        """Returns the stored edges as 1-based `(u, v, weights)` arrays, each undirected edge once for lists."""
+        if isinstance(self.representation, AdjacencyMatrix):
+            matrix = self.representation.get_representation()
+            tails, heads = np.nonzero((matrix != float('inf')) & (matrix != 0))
+            return tails + 1, heads + 1, matrix[tails, heads].astype(np.float64)
+        elif isinstance(self.representation, AdjacencyList):
+            indptr, indices = self.representation.to_csr()
+            tails = np.repeat(np.arange(1, self.representation.size + 1), np.diff(indptr))
+            heads = indices + 1
+            adj_list = self.representation.get_representation()
+            if self.representation.weighted:
+                weights = np.fromiter(
+                    (weight for node in range(1, self.representation.size + 1) for weight in adj_list[node].values()),
+                    dtype=np.float64, count=len(heads),
+                )
+            else:
+                weights = np.ones(len(heads))
+            keep = tails < heads
+            return tails[keep], heads[keep], weights[keep]
+        else:
+            raise ValueError("Unsupported graph representation.")
+
+    def _dijkstra(self, start_node: int, stats):
         if isinstance(self.representation, AdjacencyList):
             adj_list = self.representation.get_representation()
 
@@ -114,20 +829,59 @@ class GraphAlgorithms:
             priority_queue = [(0, start_node)]
             parents = {node: None for node in adj_list}
 
+            push, pop = heapq.heappush, heapq.heappop
+            if stats is not None:
+                def push(heap, item):
+                    stats.increment("heap_pushes")
+                    heapq.heappush(heap, item)
+
+                def pop(heap):
+                    item = heapq.heappop(heap)
+                    stats.increment("heap_pops")
+                    stats.increment("edges_relaxed", len(adj_list[item[1]]))
+                    return item
+
             while priority_queue:
-                current_dist, current_node = heapq.heappop(priority_queue)
+                current_dist, current_node = pop(priority_queue)
 
                 for neighbor, weight in adj_list[current_node].items():
                     new_dist = current_dist + weight
                     if new_dist < dist[neighbor]:
                         dist[neighbor] = new_dist
                         parents[neighbor] = current_node
-                        heapq.heappush(priority_queue, (new_dist, neighbor))
+                        push(priority_queue, (new_dist, neighbor))
 
             return dist, parents
 
         elif isinstance(self.representation, AdjacencyMatrix):
-            raise NotImplementedError("Dijkstra's algorithm for Adjacency Matrix is not implemented yet.")
+            # Dense Dijkstra: every row holds all n weights, so an O(n) scan for the closest
+            # unsettled node replaces the heap, and each settled row is relaxed in one step.
+            weights = self.representation.weight_matrix()
+            size = self.representation.size
+            distances = np.full(size, np.inf)
+            distances[start_node - 1] = 0
+            parent_ids = np.zeros(size, dtype=np.int64)
+            unsettled = np.ones(size, dtype=bool)
+
+            for _ in range(size):
+                candidates = np.where(unsettled, distances, np.inf)
+                node = int(np.argmin(candidates))
+                if candidates[node] == np.inf:
+                    break
+                unsettled[node] = False
+                relaxed = distances[node] + weights[node]
+                improved = unsettled & (relaxed < distances)
+                distances[improved] = relaxed[improved]
+                parent_ids[improved] = node + 1
+                if stats is not None:
+                    stats.increment("nodes_settled")
+                    stats.increment("edges_relaxed", size)
+                    stats.increment("distance_updates", int(improved.sum()))
+
+            nodes = range(1, size + 1)
+            dist = dict(zip(nodes, distances.tolist()))
+            parents = dict(zip(nodes, (parent or None for parent in parent_ids.tolist())))
+            return dist, parents
         else:
             raise ValueError("Unsupported graph representation.")
         
@@ -143,6 +897,28 @@ class GraphFlowNetwork:
         self.graph[u][v] = {"capacity": capacity, "flow": 0}
         self.graph[v][u] = {"capacity": 0, "flow": 0}  # Reverse edge for residual graph
 
+    def remove_edge(self, u, v):
+        """Removes the edge u -> v and its zero-capacity reverse entry.
+
+        If v -> u is a real edge, u -> v stays behind as that edge's reverse entry.
+        """
+        reverse = self.graph[v].get(u)
+        if reverse is not None and reverse["capacity"] > 0:
+            self.graph[u][v] = {"capacity": 0, "flow": 0}
+        else:
+            self.graph[u].pop(v, None)
+            self.graph[v].pop(u, None)
+
+    def memory_usage(self) -> int:
+        """Returns the bytes held by the capacity and residual dictionaries."""
+        return deep_sizeof(self)
+
+    def reset_flows(self):
+        """Sets every edge flow back to zero, so the network can be solved again."""
+        for u in self.graph:
+            for data in self.graph[u].values():
+                data["flow"] = 0
+
     def build_residual_graph(self):
         """Builds the residual graph."""
         self.residual.clear()
@@ -187,22 +963,59 @@ class GraphFlowNetwork:
             self.graph[u][v]["flow"] += bottleneck
             self.graph[v][u]["flow"] -= bottleneck
 
-    def ford_fulkerson(self, source, target, bottleneck, save_to_file=None):
-        """Executes the Ford-Fulkerson algorithm to find the maximum flow."""
+    def ford_fulkerson(self, source, target, bottleneck, save_to_file=None, collect_stats=False):
+        """Executes the Ford-Fulkerson algorithm to find the maximum flow.
+
+        With `collect_stats=True` the result is returned as `(max_flow, stats)`.
+        """
+        if collect_stats:
+            stats = AlgorithmStats("ford_fulkerson")
+            with stats.track_memory():
+                max_flow = self._ford_fulkerson(source, target, stats)
+        else:
+            max_flow = self._ford_fulkerson(source, target, None)
+
+        if save_to_file:
+            self.save_flows_to_file(save_to_file)
+
+        return (max_flow, stats) if collect_stats else max_flow
+
+    def _ford_fulkerson(self, source, target, stats):
         max_flow = 0
         while True:
-            self.build_residual_graph()
-            path, bottleneck = self.find_augmenting_path(source, target)
+            if stats is None:
+                self.build_residual_graph()
+                path, bottleneck = self.find_augmenting_path(source, target)
+            else:
+                with stats.phase("build_residual_graph"):
+                    self.build_residual_graph()
+                stats.increment("residual_rebuilds")
+                stats.increment("residual_edges", sum(len(edges) for edges in self.residual.values()))
+                with stats.phase("find_augmenting_path"):
+                    path, bottleneck = self.find_augmenting_path(source, target)
+
             if not path or bottleneck == 0:
                 break
-            self.update_flows(path, bottleneck)
-            max_flow += bottleneck
 
-        if save_to_file:
-            self.save_flows_to_file(save_to_file)
+            if stats is None:
+                self.update_flows(path, bottleneck)
+            else:
+                stats.increment("augmenting_paths")
+                stats.increment("path_edges", len(path))
+                with stats.phase("update_flows"):
+                    self.update_flows(path, bottleneck)
+            max_flow += bottleneck
 
         return max_flow
 
+    def flow_arrays(self):
+        """Returns the edges carrying flow as `(u, v, flow)` arrays, the same edges `save_flows_to_file` writes."""
+        edges = [(u, v, data["flow"]) for u in self.graph for v, data in self.graph[u].items() if data["flow"] > 0]
+        if not edges:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0)
+        u, v, flow = zip(*edges)
+        return np.array(u, dtype=np.int64), np.array(v, dtype=np.int64), np.array(flow, dtype=np.float64)
+
     def save_flows_to_file(self, filename):
         """Saves the flow information to a file."""
         with open(filename, "w") as file:
@@ -0,0 +1,163 @@
+import asyncio
+import functools
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+
+from core.graph_server import GraphQueryServer
+from core.graph_server import to_json_value
+
+# Set in each worker process by `_init_worker`, so the graph is shipped once per worker.
+_worker_server = None
+
+class ServiceOverloaded(RuntimeError):
+    """Raised when a query cannot be admitted before its admission timeout."""
+
+class AsyncGraphService:
+    """asyncio front end that runs graph queries in an executor and coalesces duplicates.
+
+    Concurrent queries that need the same computation share one executor call: all
+    `path` queries from a source share a single-source search, and identical
+    `bfs`/`dfs`/`dijkstra`/`flow` queries (same operation and endpoints) share one run.
+
+    Backpressure comes from two limits: at most `max_concurrency` computations run in
+    the executor at once, and at most `max_pending` queries are admitted at a time.
+    Further callers wait for a slot, or get an error reply after `admission_timeout`
+    seconds when one is set.
+    """
+
+    def __init__(self, graph, max_concurrency: int = 4, max_pending: int = 256, processes: bool = False,
+                 coalesce: bool = True, admission_timeout: float = None):
+        self.server = GraphQueryServer(graph)
+        self.coalesce = coalesce
+        self.admission_timeout = admission_timeout
+        self.max_concurrency = max_concurrency
+        self.max_pending = max_pending
+        self.processes = processes
+        self.executor = None
+        self.computations = 0
+        self.coalesced = 0
+        self._in_flight = {}
+        self._running = None
+        self._admitted = None
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def start(self) -> None:
+        """Creates the executor and the concurrency limits; called by `async with`."""
+        if self.processes:
+            self.executor = ProcessPoolExecutor(
+                self.max_concurrency, initializer=_init_worker, initargs=(self.server.graph,)
+            )
+        else:
+            self.executor = ThreadPoolExecutor(self.max_concurrency)
+        self._running = asyncio.Semaphore(self.max_concurrency)
+        self._admitted = asyncio.Semaphore(self.max_pending)
+
+    def close(self) -> None:
+        """Shuts the executor down."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    async def query(self, query: dict) -> dict:
+        """Answers one query, returning a reply shaped like `GraphQueryServer.handle`'s.
+
+        Replies also say whether the query joined a computation already in flight.
+        """
+        start_time = time.perf_counter()
+        reply = {"id": query.get("id"), "op": query.get("op")}
+        try:
+            await self._admit()
+        except ServiceOverloaded as error:
+            reply.update(ok=False, error=f"ServiceOverloaded: {error}")
+            reply["latency_ms"] = (time.perf_counter() - start_time) * 1000
+            return reply
+
+        try:
+            operation = query.get("op")
+            if operation == "path":
+                key = ("sssp", query["source"], None)
+            elif operation in self.server.operations:
+                key = (operation, query.get("source"), query.get("target"))
+            else:
+                raise ValueError(f"Unsupported operation: {operation!r}")
+
+            result, reply["coalesced"] = await self._shared_result(key)
+            if operation == "path":
+                distances, parents = result
+                target = query["target"]
+                path = self.server.graph.algorithms.build_path(parents, query["source"], target)
+                result = {"path": path, "distance": distances.get(target, float("inf"))}
+            reply["result"] = to_json_value(result)
+            reply["ok"] = True
+        except Exception as error:
+            reply["ok"] = False
+            reply["error"] = f"{type(error).__name__}: {error}"
+        finally:
+            self._admitted.release()
+        reply["latency_ms"] = (time.perf_counter() - start_time) * 1000
+        return reply
+
+    async def _admit(self) -> None:
+        if self.admission_timeout is None:
+            await self._admitted.acquire()
+            return
+        try:
+            await asyncio.wait_for(self._admitted.acquire(), self.admission_timeout)
+        except asyncio.TimeoutError:
+            raise ServiceOverloaded(f"more than {self.max_pending} queries pending") from None
+
+    async def _shared_result(self, key: tuple):
+        """Returns `(result, coalesced)`, joining an identical computation when one is running."""
+        if self.coalesce and key in self._in_flight:
+            self.coalesced += 1
+            return await asyncio.shield(self._in_flight[key]), True
+
+        future = asyncio.get_running_loop().create_future()
+        if self.coalesce:
+            self._in_flight[key] = future
+        try:
+            async with self._running:
+                self.computations += 1
+                server = None if self.processes else self.server
+                result = await asyncio.get_running_loop().run_in_executor(
+                    self.executor, functools.partial(_compute, server, *key)
+                )
+            future.set_result(result)
+        except Exception as error:
+            future.set_exception(error)
+            # Mark the exception as retrieved when nobody else joined this computation.
+            future.exception()
+            raise
+        finally:
+            if not future.done():
+                # This caller was cancelled: fail the joiners instead of leaving them waiting forever.
+                future.set_exception(RuntimeError("The shared computation was cancelled."))
+                future.exception()
+            self._in_flight.pop(key, None)
+        return result, False
+
+def _init_worker(graph) -> None:
+    global _worker_server
+    _worker_server = GraphQueryServer(graph)
+
+def _compute(server, operation: str, source, target):
+    """Runs one computation in the executor, on the shared server or the worker's own copy."""
+    server = server or _worker_server
+    graph = server.graph
+    if operation == "sssp":
+        if graph.weighted:
+            return graph.dijkstra(source)
+        return graph.traversal.bfs_distances(source)
+    query = {"source": source, "target": target}
+    if operation == "flow":
+        # Max-flow updates the flows stored on the network.
+        with server.lock:
+            return server.operations[operation](query)
+    return server.operations[operation](query)
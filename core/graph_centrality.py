@@ -0,0 +1,200 @@
+import heapq
+import math
+import os
+import random
+import statistics
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from core.graph_algorithms import GraphTraversal
+from core.graph_representations import AdjacencyList
+
+# Set in each worker process by `_init_worker`, so the representation is shipped once per worker.
+_worker_representation = None
+
+class GraphCentrality:
+    """Approximates closeness and betweenness centrality from a random sample of sources.
+
+    Every sampled source runs one BFS (or Dijkstra on weighted lists) followed by
+    Brandes' dependency accumulation. Its distances feed the closeness estimate of
+    every node it reaches (Eppstein-Wang) and its dependencies the betweenness
+    estimate (Brandes-Pich). Per-node sums and sums of squares of both give normal
+    confidence intervals, so the number of samples trades accuracy for time; with
+    every node as a source the results are exact.
+    """
+
+    def __init__(self, representation):
+        self.representation = representation
+
+    @staticmethod
+    def sample_size(size: int, epsilon: float, delta: float) -> int:
+        """Sources needed for an additive error of `epsilon` (relative to the maximum) on every node,
+        with probability at least 1 - `delta`, by Hoeffding's bound and a union bound over the nodes.
+        """
+        return min(size, math.ceil(math.log(2 * size / delta) / (2 * epsilon ** 2)))
+
+    def estimate(self, samples: int = None, epsilon: float = 0.1, delta: float = 0.1, confidence: float = 0.95,
+                 processes: int = None, seed=None) -> dict:
+        """Estimates closeness and betweenness of every node.
+
+        Args:
+            samples (int): Number of sources; derived from `epsilon` and `delta` when omitted.
+            epsilon (float): Target additive error for the derived sample size.
+            delta (float): Allowed failure probability for the derived sample size.
+            confidence (float): Level of the reported confidence intervals.
+            processes (int): Spread the sources over this many worker processes; 0 uses
+                every CPU. Runs in this process by default.
+            seed: Seed for the source sample.
+
+        Returns:
+            dict: `closeness` and `betweenness` arrays indexed by node id - 1, each with
+            `_low` and `_high` confidence bounds, plus the `samples` used. Betweenness
+            counts each unordered pair once; closeness is the inverse mean distance to
+            the reachable nodes (0 for isolated nodes).
+        """
+        size = self.representation.size
+        if samples is None:
+            samples = self.sample_size(size, epsilon, delta)
+        samples = min(samples, size)
+        sources = random.Random(seed).sample(range(1, size + 1), samples)
+
+        if processes is None:
+            parts = [accumulate_sources(self.representation, sources)]
+        else:
+            workers = processes or os.cpu_count()
+            batches = [batch.tolist() for batch in np.array_split(np.array(sources), workers * 4) if len(batch)]
+            with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(self.representation,)) as pool:
+                parts = list(pool.map(_accumulate_worker, batches))
+        totals = [np.sum(arrays, axis=0) for arrays in zip(*parts)]
+        return self.summarize(size, samples, confidence, *totals)
+
+    def summarize(self, size: int, samples: int, confidence: float, dependency_sum, dependency_squares,
+                  distance_sum, distance_squares, reached) -> dict:
+        """Turns the per-node sums of `accumulate_sources` over `samples` sources into estimates and intervals."""
+        z = statistics.NormalDist().inv_cdf((1 + confidence) / 2)
+        # Sampling without replacement: the spread vanishes once every node is a source.
+        correction = math.sqrt((size - samples) / (size - 1)) if size > 1 else 0.0
+
+        # Each unordered pair is seen from both of its ends over all sources, hence the / 2.
+        mean = dependency_sum / samples
+        spread = np.sqrt(np.maximum(dependency_squares / samples - mean ** 2, 0))
+        half_width = z * spread / math.sqrt(samples) * correction
+        scale = size / 2
+
+        mean_distance = np.divide(distance_sum, reached, out=np.zeros(size), where=reached > 0)
+        distance_spread = np.sqrt(np.maximum(
+            np.divide(distance_squares, reached, out=np.zeros(size), where=reached > 0) - mean_distance ** 2, 0
+        ))
+        distance_half_width = z * np.divide(
+            distance_spread, np.sqrt(reached), out=np.zeros(size), where=reached > 0
+        ) * correction
+
+        def inverse(values):
+            return np.divide(1.0, values, out=np.zeros(size), where=values > 0)
+
+        return {
+            "samples": samples,
+            "closeness": inverse(mean_distance),
+            "closeness_low": inverse(mean_distance + distance_half_width),
+            "closeness_high": np.where(
+                mean_distance - distance_half_width > 0, inverse(mean_distance - distance_half_width),
+                np.where(reached > 0, np.inf, 0.0),
+            ),
+            "betweenness": mean * scale,
+            "betweenness_low": np.maximum(mean - half_width, 0) * scale,
+            "betweenness_high": (mean + half_width) * scale,
+        }
+
+def _init_worker(representation) -> None:
+    global _worker_representation
+    _worker_representation = representation
+
+def _accumulate_worker(sources: list):
+    return accumulate_sources(_worker_representation, sources)
+
+def accumulate_sources(representation, sources: list):
+    """Runs Brandes from each source and sums its dependencies and distances per node.
+
+    Returns:
+        tuple: Arrays indexed by node id - 1: dependency sum and sum of squares,
+        distance sum and sum of squares, and how many sources reached the node.
+    """
+    size = representation.size
+    dependency_sum = np.zeros(size)
+    dependency_squares = np.zeros(size)
+    distance_sum = np.zeros(size)
+    distance_squares = np.zeros(size)
+    reached = np.zeros(size)
+
+    for source in sources:
+        order, dist, dependency = _single_source(representation, source)
+        nodes = np.array(order[1:], dtype=np.int64) - 1
+        distances = np.array([dist[node] for node in order[1:]], dtype=np.float64)
+        distance_sum[nodes] += distances
+        distance_squares[nodes] += distances ** 2
+        reached[nodes] += 1
+
+        values = np.array([dependency[node] for node in order], dtype=np.float64)
+        dependency_sum[np.array(order) - 1] += values
+        dependency_squares[np.array(order) - 1] += values ** 2
+
+    return dependency_sum, dependency_squares, distance_sum, distance_squares, reached
+
+def _single_source(representation, source: int):
+    """One Brandes step: shortest-path counts by BFS or Dijkstra, then dependencies in reverse order.
+
+    Returns:
+        tuple: `(order, dist, dependency)`, with the reached nodes in non-decreasing
+        distance order and the dependency of `source` on each of them.
+    """
+    size = representation.size
+    sigma = [0] * (size + 1)
+    sigma[source] = 1
+    predecessors = {source: []}
+    dist = {source: 0}
+    order = []
+
+    if isinstance(representation, AdjacencyList) and representation.weighted:
+        adj_list = representation.get_representation()
+        queue = [(0, source)]
+        settled = set()
+        while queue:
+            node_dist, node = heapq.heappop(queue)
+            if node in settled:
+                continue
+            settled.add(node)
+            order.append(node)
+            for neighbor, weight in adj_list[node].items():
+                new_dist = node_dist + weight
+                if neighbor not in dist or new_dist < dist[neighbor]:
+                    dist[neighbor] = new_dist
+                    sigma[neighbor] = sigma[node]
+                    predecessors[neighbor] = [node]
+                    heapq.heappush(queue, (new_dist, neighbor))
+                elif new_dist == dist[neighbor] and neighbor not in settled:
+                    sigma[neighbor] += sigma[node]
+                    predecessors[neighbor].append(node)
+    else:
+        traversal = GraphTraversal(representation)
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            next_dist = dist[node] + 1
+            for neighbor in traversal.neighbors(node):
+                if neighbor not in dist:
+                    dist[neighbor] = next_dist
+                    predecessors[neighbor] = []
+                    queue.append(neighbor)
+                if dist[neighbor] == next_dist:
+                    sigma[neighbor] += sigma[node]
+                    predecessors[neighbor].append(node)
+
+    dependency = dict.fromkeys(order, 0.0)
+    for node in reversed(order):
+        for predecessor in predecessors[node]:
+            dependency[predecessor] += sigma[predecessor] / sigma[node] * (1 + dependency[node])
+    dependency[source] = 0.0
+    return order, dist, dependency
@@ -0,0 +1,162 @@
+import os
+import time
+
+import numpy as np
+
+from core.graph_algorithms import GraphTraversal
+from core.graph_centrality import GraphCentrality
+from core.graph_centrality import accumulate_sources
+
+class ResumableSourceJob:
+    """Runs a computation over many BFS/Dijkstra sources in batches and checkpoints it to disk.
+
+    After every batch the partial aggregates are up to date, and at most every
+    `interval` seconds (and when the run stops, even by an exception) they are written
+    to `checkpoint_file` together with the number of completed sources. Writes go to
+    a temporary file that replaces the checkpoint, so a crash never leaves it half
+    written. A new job on the same file resumes after the last saved batch; giving it
+    `sources` or a `seed` that lead to another source order raises ValueError.
+
+    Jobs:
+        "eccentricities": bit-parallel BFS; yields per-source eccentricities, the
+            diameter (largest eccentricity) and the hop distance histogram.
+        "centrality": Brandes steps; yields closeness and betweenness as in
+            `GraphCentrality.estimate`, exact once every node is a source.
+
+    With the `ordering` of a reordered graph, `sources` and the results use the
+    original ids; the checkpoint itself stores the internal ones.
+    """
+
+    JOBS = ("eccentricities", "centrality")
+
+    def __init__(self, representation, job: str, checkpoint_file: str, interval: float = 60.0,
+                 batch_size: int = 64, sources=None, seed=None, ordering=None):
+        if job not in self.JOBS:
+            raise ValueError(f"Unsupported job: {job}")
+        self.representation = representation
+        self.ordering = ordering
+        if sources is not None and ordering is not None:
+            sources = ordering.forward[np.asarray(sources, dtype=np.int64)]
+        self.job = job
+        self.checkpoint_file = checkpoint_file
+        self.interval = interval
+        self.batch_size = batch_size
+        size = representation.size
+
+        if os.path.exists(checkpoint_file):
+            self._load(size)
+            # An explicit source list or seed must describe the job being resumed.
+            if (sources is not None or seed is not None) and not np.array_equal(
+                self._initial_sources(size, sources, seed), self.sources
+            ):
+                raise ValueError("Checkpoint was started with different sources; remove it to start over.")
+        else:
+            self.sources = self._initial_sources(size, sources, seed)
+            self.completed = 0
+            if job == "eccentricities":
+                self.aggregates = {
+                    "eccentricities": np.zeros(len(self.sources), dtype=np.int32),
+                    # Distances never exceed size - 1, so the histogram has a fixed length.
+                    "histogram": np.zeros(max(size, 1), dtype=np.int64),
+                }
+            else:
+                self.aggregates = {name: np.zeros(size) for name in self._centrality_names()}
+        self.last_saved = time.monotonic()
+
+    def run(self, max_batches: int = None) -> dict:
+        """Processes the remaining sources, or at most `max_batches` batches of them.
+
+        Returns:
+            dict: The current result; `completed` and `total` tell how far the job got.
+        """
+        batches = 0
+        try:
+            while self.completed < len(self.sources) and (max_batches is None or batches < max_batches):
+                batch = self.sources[self.completed:self.completed + self.batch_size]
+                # The aggregates and the completed count change together, so a save never sees half a batch.
+                self.aggregates, self.completed = self._process(batch), self.completed + len(batch)
+                batches += 1
+                if time.monotonic() - self.last_saved >= self.interval:
+                    self.save()
+        finally:
+            self.save()
+        return self.result()
+
+    def result(self, confidence: float = 0.95) -> dict:
+        """Builds the result from the aggregates of the completed sources."""
+        result = {"completed": self.completed, "total": len(self.sources)}
+        if self.job == "eccentricities":
+            eccentricities = self.aggregates["eccentricities"][:self.completed]
+            histogram = self.aggregates["histogram"]
+            used = np.flatnonzero(histogram)
+            result.update({
+                "sources": self.sources[:self.completed],
+                "eccentricities": eccentricities,
+                "diameter": int(eccentricities.max()) if len(eccentricities) else 0,
+                "histogram": histogram[:used[-1] + 1 if len(used) else 0].tolist(),
+            })
+        elif self.completed:
+            result.update(GraphCentrality(self.representation).summarize(
+                self.representation.size, self.completed, confidence, *self._centrality_arrays()
+            ))
+        if self.ordering is not None:
+            result = self._translated(result)
+        return result
+
+    def _translated(self, result: dict) -> dict:
+        """Maps the sources and per-node arrays of a result back to original ids."""
+        if "sources" in result:
+            result["sources"] = self.ordering.inverse[result["sources"]]
+        if self.job == "centrality":
+            for key, values in result.items():
+                if key not in ("completed", "total", "samples"):
+                    result[key] = self.ordering.array_to_original(values)
+        return result
+
+    def save(self) -> None:
+        """Writes the progress to the checkpoint file atomically."""
+        temporary_file = f"{self.checkpoint_file}.tmp"
+        with open(temporary_file, "wb") as file:
+            np.savez(
+                file, job=np.array(self.job), size=np.array(self.representation.size), sources=self.sources,
+                completed=np.array(self.completed), **self.aggregates,
+            )
+        os.replace(temporary_file, self.checkpoint_file)
+        self.last_saved = time.monotonic()
+
+    def _load(self, size: int) -> None:
+        with np.load(self.checkpoint_file) as data:
+            if str(data["job"]) != self.job or int(data["size"]) != size:
+                raise ValueError("Checkpoint does not match this job.")
+            self.sources = data["sources"]
+            self.completed = int(data["completed"])
+            reserved = {"job", "size", "sources", "completed"}
+            self.aggregates = {name: data[name] for name in data.files if name not in reserved}
+
+    def _initial_sources(self, size: int, sources, seed):
+        if sources is None:
+            # A random order keeps the partial centrality of an unfinished job an unbiased sample.
+            sources = np.arange(1, size + 1)
+            if self.job == "centrality":
+                sources = np.random.default_rng(seed).permutation(sources)
+        return np.asarray(sources, dtype=np.int64)
+
+    def _process(self, batch) -> dict:
+        """Returns the aggregates with the batch added, leaving the current ones untouched."""
+        aggregates = {name: values.copy() for name, values in self.aggregates.items()}
+        if self.job == "eccentricities":
+            eccentricities, histogram = GraphTraversal(self.representation).bit_parallel_bfs(batch)
+            aggregates["eccentricities"][self.completed:self.completed + len(batch)] = eccentricities
+            aggregates["histogram"][:len(histogram)] += histogram
+        else:
+            sums = accumulate_sources(self.representation, batch.tolist())
+            for name, values in zip(self._centrality_names(), sums):
+                aggregates[name] += values
+        return aggregates
+
+    def _centrality_arrays(self) -> list:
+        return [self.aggregates[name] for name in self._centrality_names()]
+
+    @staticmethod
+    def _centrality_names() -> tuple:
+        return "dependency_sum", "dependency_squares", "distance_sum", "distance_squares", "reached"
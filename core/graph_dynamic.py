@@ -0,0 +1,283 @@
+import heapq
+from collections import deque
+
+from core.graph_algorithms import GraphAlgorithms
+from core.graph_algorithms import GraphTraversal
+from core.graph_representations import AdjacencyList
+from core.union_find import UnionFind
+
+class DynamicGraphState:
+    """Keeps connected components, degree metrics and the edge count current under edge updates.
+
+    Components live in a union-find: an insertion is a union. A deletion searches from
+    both endpoints in lockstep, always growing the smaller side, and stops as soon as
+    the searches meet (still connected) or one side runs out. In that case only the
+    side that ran out is moved into a new set. Either way the work is bounded by the
+    smaller side around the deleted edge, not by the graph size.
+
+    Degrees are kept in a histogram, so degree metrics cost time proportional to
+    the number of distinct degrees.
+    """
+
+    def __init__(self, representation):
+        self.representation = representation
+        self.traversal = GraphTraversal(representation)
+        size = representation.size
+
+        self.components = UnionFind(size)
+        # Maps node id - 1 to its union-find element; split-off nodes get fresh elements.
+        self.element = list(range(size))
+        self.degrees = [0] * (size + 1)
+        self.degree_counts = {}
+        self.num_edges = 0
+
+        for node in range(1, size + 1):
+            degree = representation.degree(node)
+            self.degrees[node] = degree
+            self.degree_counts[degree] = self.degree_counts.get(degree, 0) + 1
+            for neighbor in self.traversal.neighbors(node):
+                self.components.union(node - 1, self.element[neighbor - 1])
+                if neighbor >= node or not representation.has_edge(neighbor, node):
+                    self.num_edges += 1
+
+    def edge_added(self, u: int, v: int) -> None:
+        """Updates the state after the representation gained the edge (u, v)."""
+        u_changed = self._refresh_degree(u)
+        v_changed = self._refresh_degree(v) if v != u else u_changed
+        # A weighted matrix stores only u -> v, so either direction may have been there before.
+        existed = (self._stored(u, v) and not u_changed) or (self._stored(v, u) and not v_changed)
+        if not existed and (self._stored(u, v) or self._stored(v, u)):
+            self.num_edges += 1
+        self.components.union(self.element[u - 1], self.element[v - 1])
+
+    def edge_removed(self, u: int, v: int) -> None:
+        """Updates the state after the representation lost the edge (u, v)."""
+        u_changed = self._refresh_degree(u)
+        v_changed = self._refresh_degree(v) if v != u else u_changed
+        if not (u_changed or v_changed):
+            # Nothing was removed.
+            return
+        self.num_edges -= 1
+        if self._stored(u, v) or self._stored(v, u):
+            # A parallel edge is left and still connects u and v.
+            return
+
+        split_side = self._split_side(u, v)
+        if split_side is not None:
+            self._detach(split_side)
+
+    def connected(self, u: int, v: int) -> bool:
+        """Checks whether two nodes are in the same component."""
+        return self.components.find(self.element[u - 1]) == self.components.find(self.element[v - 1])
+
+    def component_size(self, node: int) -> int:
+        """Returns the size of a node's component."""
+        return self.components.set_size(self.element[node - 1])
+
+    def connected_components(self) -> list:
+        """Lists the components, largest first, like `GraphTraversal.connected_components`."""
+        groups = {}
+        for node in range(1, self.representation.size + 1):
+            groups.setdefault(self.components.find(self.element[node - 1]), []).append(node)
+        return sorted(groups.values(), key=len, reverse=True)
+
+    def degree_metrics(self) -> dict:
+        """Returns the same metrics as `GraphMetrics.calculate_degree_metrics`."""
+        ordered = sorted(self.degree_counts)
+        total = self.representation.size
+        degree_sum = sum(degree * count for degree, count in self.degree_counts.items())
+        return {
+            "min_degree": ordered[0],
+            "max_degree": ordered[-1],
+            "mean_degree": degree_sum / total,
+            "median_degree": self._median(ordered, total),
+        }
+
+    def _median(self, ordered: list, total: int):
+        middle = [(total - 1) // 2, total // 2]
+        values = []
+        seen = 0
+        for degree in ordered:
+            seen += self.degree_counts[degree]
+            while middle and middle[0] < seen:
+                middle.pop(0)
+                values.append(degree)
+            if not middle:
+                break
+        return values[0] if total % 2 else (values[0] + values[1]) / 2
+
+    def _stored(self, u: int, v: int) -> bool:
+        return self.representation.has_edge(u, v)
+
+    def _refresh_degree(self, node: int) -> bool:
+        """Re-reads a node's degree from the representation; returns whether it changed."""
+        old_degree, new_degree = self.degrees[node], self.representation.degree(node)
+        if old_degree == new_degree:
+            return False
+        self.degree_counts[old_degree] -= 1
+        if not self.degree_counts[old_degree]:
+            del self.degree_counts[old_degree]
+        self.degree_counts[new_degree] = self.degree_counts.get(new_degree, 0) + 1
+        self.degrees[node] = new_degree
+        return True
+
+    def _split_side(self, u: int, v: int):
+        """Searches from both endpoints, returning None if they are still connected.
+
+        Otherwise returns the nodes of the side whose search ran out first.
+        """
+        if u == v:
+            return None
+        seen = ({u}, {v})
+        queues = (deque([u]), deque([v]))
+
+        while queues[0] and queues[1]:
+            side = 0 if len(seen[0]) <= len(seen[1]) else 1
+            other = seen[1 - side]
+            node = queues[side].popleft()
+            # A weighted matrix stores an edge one way; either way keeps the endpoints connected.
+            for neighbor in self.traversal.undirected_neighbors(node):
+                if neighbor in other:
+                    return None
+                if neighbor not in seen[side]:
+                    seen[side].add(neighbor)
+                    queues[side].append(neighbor)
+
+        return seen[0] if not queues[0] else seen[1]
+
+    def _detach(self, nodes: set) -> None:
+        """Moves `nodes` out of their union-find set into a new set of their own."""
+        old_root = self.components.find(self.element[next(iter(nodes)) - 1])
+        new_root = self.components.add()
+        for node in nodes:
+            element = self.components.add()
+            self.components.parent[element] = new_root
+            self.element[node - 1] = element
+
+        # The fresh root counts as one element; every node added one more and was merged into it.
+        self.components.sizes[new_root] = len(nodes)
+        self.components.count -= len(nodes)
+        # Nodes of the other side may still hang below an element of a detached node, which
+        # is why old elements are kept in the forest rather than reused.
+        self.components.sizes[old_root] -= len(nodes)
+        # Compact once the stale elements outnumber the nodes: O(n) work for at least n
+        # added elements keeps the amortized cost proportional to the detached sides.
+        if len(self.components.parent) > 2 * self.representation.size:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Rebuilds the union-find with one element per node, dropping the elements of earlier splits."""
+        size = self.representation.size
+        roots = self.components.roots()[self.element].tolist()
+        components = UnionFind(size)
+        first_node = {}
+        for index, root in enumerate(roots):
+            if root in first_node:
+                components.union(first_node[root], index)
+            else:
+                first_node[root] = index
+        self.components = components
+        self.element = list(range(size))
+
+class DynamicShortestPaths:
+    """Keeps a single-source shortest-path tree current under edge updates.
+
+    Takes a `(dist, parents)` result of `GraphAlgorithms.dijkstra` and repairs it in
+    place after an edge weight changes, in the spirit of Ramalingam and Reps. A weight
+    drop or a new edge is pushed forward with a Dijkstra limited to the nodes whose
+    distance improves. A weight increase or removal of a tree edge resets only the
+    subtree below it, seeds those nodes from their neighbors outside the subtree and
+    settles them again.
+
+    `update_edge` returns how many nodes it touched, to compare with a full recompute.
+    """
+
+    def __init__(self, representation, start_node: int, dist: dict = None, parents: dict = None):
+        if not isinstance(representation, AdjacencyList) or not representation.weighted:
+            raise NotImplementedError("Dynamic shortest paths need a weighted Adjacency List.")
+        if dist is None or parents is None:
+            dist, parents = GraphAlgorithms(representation).dijkstra(start_node)
+
+        self.representation = representation
+        self.start_node = start_node
+        self.dist = dist
+        self.parents = parents
+        self.children = {node: set() for node in dist}
+        for node, parent in parents.items():
+            if parent is not None:
+                self.children[parent].add(node)
+        self.last_touched = 0
+        self.total_touched = 0
+
+    def update_edge(self, u: int, v: int) -> int:
+        """Repairs the tree after the weight of (u, v) changed in the representation.
+
+        Call it after the representation was updated; a missing edge counts as removed.
+
+        Returns:
+            int: The number of nodes whose distance or parent was recomputed.
+        """
+        adj_list = self.representation.get_representation()
+        touched = set()
+
+        for tail, head in ((u, v), (v, u)):
+            weight = adj_list[tail].get(head)
+            if self.parents[head] == tail and (weight is None or self.dist[tail] + weight > self.dist[head]):
+                self._reset_subtree(head, touched)
+
+        queue = []
+        for tail, head in ((u, v), (v, u)):
+            weight = adj_list[tail].get(head)
+            if weight is not None and self.dist[tail] + weight < self.dist[head]:
+                self._set_parent(head, tail, self.dist[tail] + weight)
+                heapq.heappush(queue, (self.dist[head], head))
+        self._propagate(queue, touched)
+
+        self.last_touched = len(touched)
+        self.total_touched += len(touched)
+        return self.last_touched
+
+    def _reset_subtree(self, root: int, touched: set) -> None:
+        """Recomputes the distances of every node below `root` in the tree."""
+        adj_list = self.representation.get_representation()
+        subtree = [root]
+        for node in subtree:
+            subtree.extend(self.children[node])
+        in_subtree = set(subtree)
+
+        for node in subtree:
+            self._set_parent(node, None, float("inf"))
+
+        queue = []
+        for node in subtree:
+            for neighbor, weight in adj_list[node].items():
+                if neighbor not in in_subtree and self.dist[neighbor] + weight < self.dist[node]:
+                    self._set_parent(node, neighbor, self.dist[neighbor] + weight)
+            if self.parents[node] is not None:
+                heapq.heappush(queue, (self.dist[node], node))
+
+        touched.update(in_subtree)
+        self._propagate(queue, touched)
+
+    def _propagate(self, queue: list, touched: set) -> None:
+        """Settles queued nodes, relaxing only the edges that improve a distance."""
+        adj_list = self.representation.get_representation()
+        while queue:
+            current_dist, current_node = heapq.heappop(queue)
+            if current_dist > self.dist[current_node]:
+                continue
+            touched.add(current_node)
+            for neighbor, weight in adj_list[current_node].items():
+                new_dist = current_dist + weight
+                if new_dist < self.dist[neighbor]:
+                    self._set_parent(neighbor, current_node, new_dist)
+                    heapq.heappush(queue, (new_dist, neighbor))
+
+    def _set_parent(self, node: int, parent, distance: float) -> None:
+        old_parent = self.parents[node]
+        if old_parent is not None:
+            self.children[old_parent].discard(node)
+        if parent is not None:
+            self.children[parent].add(node)
+        self.parents[node] = parent
+        self.dist[node] = distance
@@ -0,0 +1,250 @@
+import numpy as np
+
+from core.graph_representations import AdjacencyList
+from core.graph_representations import AdjacencyMatrix
+
+class GraphGenerator:
+    """Generates synthetic graphs for scale testing.
+
+    Every generator returns a pair of 1-based NumPy arrays `(u, v)` holding the edge
+    endpoints, which can be turned into a representation with `to_representation`
+    or written in the data file format with `save_to_file`.
+    """
+
+    @staticmethod
+    def erdos_renyi(size: int, num_edges: int, seed=None):
+        """Samples a G(n, m) graph with `num_edges` distinct undirected edges.
+
+        Args:
+            size (int): Number of nodes.
+            num_edges (int): Number of edges, capped at size * (size - 1) / 2.
+            seed: Seed for `numpy.random.default_rng`.
+
+        Returns:
+            tuple: The `(u, v)` endpoint arrays, with u < v.
+        """
+        rng = np.random.default_rng(seed)
+        num_edges = min(num_edges, size * (size - 1) // 2)
+        keys = np.empty(0, dtype=np.int64)
+
+        # Oversample slightly and top up until enough distinct pairs survive deduplication.
+        while len(keys) < num_edges:
+            missing = num_edges - len(keys)
+            batch = int(missing * 1.1) + 16
+            u = rng.integers(0, size, batch, dtype=np.int64)
+            v = rng.integers(0, size, batch, dtype=np.int64)
+            keep = u != v
+            low, high = np.minimum(u[keep], v[keep]), np.maximum(u[keep], v[keep])
+            keys = GraphGenerator._unique(np.concatenate((keys, low * size + high)))
+
+        if len(keys) > num_edges:
+            keys = rng.choice(keys, num_edges, replace=False)
+            keys.sort()
+        return keys // size + 1, keys % size + 1
+
+    @staticmethod
+    def chung_lu(size: int, mean_degree: float, exponent: float = 2.5, seed=None):
+        """Samples a Chung-Lu graph whose expected degrees follow a power law.
+
+        Args:
+            size (int): Number of nodes.
+            mean_degree (float): Target average degree.
+            exponent (float): Power-law exponent of the degree distribution (> 2).
+            seed: Seed for `numpy.random.default_rng`.
+
+        Returns:
+            tuple: The `(u, v)` endpoint arrays, with u < v.
+        """
+        if exponent <= 2:
+            raise ValueError("Exponent must be greater than 2.")
+        rng = np.random.default_rng(seed)
+        weights = np.arange(1, size + 1, dtype=np.float64) ** (-1 / (exponent - 1))
+        cumulative = np.cumsum(weights)
+        cumulative /= cumulative[-1]
+
+        # Both endpoints are drawn proportionally to the node weights, so the expected
+        # degree of node i is proportional to weights[i]. Sorted lookups are far more
+        # cache-friendly; the permutation re-pairs the endpoints independently.
+        num_edges = int(size * mean_degree / 2)
+        u = np.searchsorted(cumulative, np.sort(rng.random(num_edges)), side="right")
+        v = np.searchsorted(cumulative, np.sort(rng.random(num_edges)), side="right")[rng.permutation(num_edges)]
+
+        # Shuffle ids so that hub nodes are not all clustered at the start of the id range.
+        labels = rng.permutation(size)
+        return GraphGenerator._simple_edges(size, labels[np.minimum(u, size - 1)], labels[np.minimum(v, size - 1)])
+
+    @staticmethod
+    def barabasi_albert(size: int, edges_per_node: int, seed=None):
+        """Samples a preferential attachment graph with the Batagelj-Brandes method.
+
+        Each new node attaches `edges_per_node` edges to endpoints picked uniformly from
+        all previous edge endpoints. The copy chains are resolved with vectorized pointer
+        jumping instead of a Python loop. Self-loops and repeated edges are dropped, so
+        the result has slightly fewer than size * edges_per_node edges.
+
+        Returns:
+            tuple: The `(u, v)` endpoint arrays, with u < v.
+        """
+        rng = np.random.default_rng(seed)
+        num_edges = size * edges_per_node
+        slots = np.arange(2 * num_edges, dtype=np.int64)
+
+        # Even slots hold the new node of each edge; odd slots copy a uniformly chosen earlier slot.
+        pointers = slots.copy()
+        odd = slots[1::2]
+        pointers[1::2] = (rng.random(num_edges) * odd).astype(np.int64)
+
+        while True:
+            jumped = pointers[pointers]
+            if np.array_equal(jumped, pointers):
+                break
+            pointers = jumped
+
+        endpoints = (pointers // 2) // edges_per_node
+        return GraphGenerator._simple_edges(size, endpoints[0::2], endpoints[1::2])
+
+    @staticmethod
+    def grid(rows: int, cols: int):
+        """Builds a rows x cols lattice where node (r, c) has id r * cols + c + 1.
+
+        Returns:
+            tuple: The `(u, v)` endpoint arrays, with u < v.
+        """
+        ids = np.arange(rows * cols, dtype=np.int64).reshape(rows, cols) + 1
+        u = np.concatenate((ids[:, :-1].ravel(), ids[:-1, :].ravel()))
+        v = np.concatenate((ids[:, 1:].ravel(), ids[1:, :].ravel()))
+        return u, v
+
+    @staticmethod
+    def flow_network(layers: int, width: int, edges_per_node: int, seed=None):
+        """Builds a layered directed network for max-flow tests.
+
+        Node 1 is the source and the last node is the sink. The source feeds every node
+        of the first layer, each node links to `edges_per_node` random nodes of the
+        next layer, and every node of the last layer feeds the sink.
+
+        Returns:
+            tuple: The `(u, v)` arrays of directed edges u -> v and the number of nodes.
+        """
+        rng = np.random.default_rng(seed)
+        size = layers * width + 2
+        sink = size
+        first_layer = np.arange(2, width + 2, dtype=np.int64)
+        last_layer = first_layer + (layers - 1) * width
+
+        tails = np.repeat(np.arange(2, (layers - 1) * width + 2, dtype=np.int64), edges_per_node)
+        layer_start = (tails - 2) // width * width + 2
+        heads = layer_start + width + rng.integers(0, width, len(tails))
+
+        keys = GraphGenerator._unique(tails * size + heads)
+        u = np.concatenate((np.ones(width, dtype=np.int64), keys // size, last_layer))
+        v = np.concatenate((first_layer, keys % size, np.full(width, sink, dtype=np.int64)))
+        return (u, v), size
+
+    @staticmethod
+    def random_weights(num_edges: int, low: float = 1.0, high: float = 10.0,
+                       negative_fraction: float = 0.0, seed=None):
+        """Draws uniform edge weights in [low, high), negating a random fraction of them.
+
+        Args:
+            num_edges (int): Number of weights to draw.
+            low (float): Lower bound of the weight magnitude.
+            high (float): Upper bound of the weight magnitude.
+            negative_fraction (float): Fraction of the weights that are made negative.
+            seed: Seed for `numpy.random.default_rng`.
+
+        Returns:
+            numpy.ndarray: The float64 weight array.
+        """
+        if not 0 <= negative_fraction <= 1:
+            raise ValueError("Negative fraction must be between 0 and 1.")
+        rng = np.random.default_rng(seed)
+        weights = rng.uniform(low, high, num_edges)
+        if negative_fraction > 0:
+            negative = rng.random(num_edges) < negative_fraction
+            weights[negative] = -weights[negative]
+        return weights
+
+    @staticmethod
+    def to_representation(size: int, u, v, weights=None, representation: str = "Adjacency List",
+                          directed: bool = False):
+        """Builds an adjacency representation from edge arrays.
+
+        Args:
+            size (int): Number of nodes.
+            u, v: 1-based endpoint arrays.
+            weights: Optional weight array aligned with the edges.
+            representation (str): "Adjacency List" or "Adjacency Matrix".
+            directed (bool): Whether edges are only stored as u -> v.
+
+        Returns:
+            AdjacencyList | AdjacencyMatrix: The populated representation.
+        """
+        if representation == "Adjacency Matrix":
+            graph = AdjacencyMatrix(size)
+            values = 1 if weights is None else weights
+            graph.matrix[u - 1, v - 1] = values
+            if not directed:
+                graph.matrix[v - 1, u - 1] = values
+            return graph
+
+        if representation != "Adjacency List":
+            raise ValueError("Unsupported representation type.")
+
+        graph = AdjacencyList(size, weights is not None)
+        adj_list = graph.get_representation()
+        tails, heads = u.tolist(), v.tolist()
+        if weights is None:
+            for tail, head in zip(tails, heads):
+                adj_list[tail].append(head)
+                if not directed:
+                    adj_list[head].append(tail)
+        else:
+            for tail, head, weight in zip(tails, heads, weights.tolist()):
+                adj_list[tail][head] = weight
+                if not directed:
+                    adj_list[head][tail] = weight
+        return graph
+
+    @staticmethod
+    def save_to_file(filename: str, size: int, u, v, weights=None, chunk_size: int = 1_000_000) -> None:
+        """Writes edge arrays in the data file format: the node count, then one edge per line.
+
+        Lines are formatted a chunk at a time, so writing stays fast for tens of millions of edges.
+        """
+        with open(filename, "w", encoding="utf-8") as file:
+            file.write(f"{size}\n")
+            for start in range(0, len(u), chunk_size):
+                stop = start + chunk_size
+                if weights is None:
+                    columns = (u[start:stop], v[start:stop])
+                    line_format = "%d %d\n"
+                else:
+                    columns = (u[start:stop], v[start:stop], weights[start:stop])
+                    line_format = "%d %d %.6g\n"
+                values = np.column_stack(columns).ravel().tolist()
+                file.write((line_format * (len(values) // len(columns))) % tuple(values))
+
+    @staticmethod
+    def _simple_edges(size: int, u, v):
+        """Drops self-loops and duplicates, returning 1-based (u, v) arrays with u < v."""
+        u, v = np.asarray(u, dtype=np.int64), np.asarray(v, dtype=np.int64)
+        keep = u != v
+        low, high = np.minimum(u[keep], v[keep]), np.maximum(u[keep], v[keep])
+        keys = GraphGenerator._unique(low * size + high)
+        return keys // size + 1, keys % size + 1
+
+    @staticmethod
+    def _unique(keys):
+        """Sorted distinct values of an integer array.
+
+        Sorting and masking repeats is several times faster than `np.unique` on the
+        tens of millions of keys these generators handle.
+        """
+        keys = np.sort(keys)
+        if len(keys) == 0:
+            return keys
+        keep = np.empty(len(keys), dtype=bool)
+        keep[0] = True
+        np.not_equal(keys[1:], keys[:-1], out=keep[1:])
+        return keys[keep]
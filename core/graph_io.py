@@ -1,3 +1,7 @@
+import numpy as np
+
+from core.graph_memory import RepresentationCostModel
+from core.graph_ordering import NodeOrdering
 from core.graph_representations import AdjacencyList
 from core.graph_representations import AdjacencyMatrix
 # from core.graph_new import Graph
@@ -6,30 +10,274 @@ class GraphIO:
     """Handles file input and output for the graph."""
 
     @staticmethod
-    def load_graph_from_file(file_name: str, representation: str, size: int, weighted: bool, directed: bool = False):
-        """Loads a graph from a file based on its representation (Adjacency Matrix or List)."""
+    def load_graph_from_file(file_name: str, representation: str, size: int, weighted: bool, directed: bool = False,
+                             reorder: str = None, dtype=None, node_dtype=None, algorithms=None):
+        """Loads a graph from a file based on its representation (Adjacency Matrix or List).
+
+        With `reorder` ("bfs", "rcm" or "degree") the nodes are relabeled for memory
+        locality before the representation is built, and the returned representation
+        carries the `NodeOrdering` used in its `ordering` attribute. `dtype` and
+        `node_dtype` select compact storage types; the weights and node count are
+        checked against them (see `check_dtypes`) before anything is built.
+
+        The "auto" representation is chosen by `RepresentationCostModel().choose` from
+        the node and edge counts, weightedness and the `algorithms` to be run.
+        """
+        # The arrays are read once and serve the auto layout, the dtype checks and the ordering.
+        arrays = None
+        if representation == "auto" or reorder is not None or dtype is not None or node_dtype is not None:
+            arrays = GraphIO.read_edge_arrays(file_name, weighted)
+            GraphIO.check_dtypes(size, arrays[3], dtype, node_dtype)
+        if representation == "auto":
+            representation = RepresentationCostModel().choose(
+                size, len(arrays[1]), weighted, algorithms or ("bfs",), dtype=dtype or "float64"
+            )
+
         if representation == "Adjacency Matrix":
-            graph = AdjacencyMatrix(size)
+            graph = AdjacencyMatrix(size, dtype or "float64", node_dtype)
         elif representation == "Adjacency List":
-            graph = AdjacencyList(size, weighted)
+            graph = AdjacencyList(size, weighted, dtype, node_dtype)
         else:
             raise ValueError("Unsupported representation type.")
 
+        if arrays is None:
+            edges = GraphIO.read_edges(file_name, weighted)
+        else:
+            _, u, v, weights = arrays
+            if reorder is not None:
+                graph.ordering = NodeOrdering.from_edges(size, u, v, reorder)
+                u, v = graph.ordering.forward[u], graph.ordering.forward[v]
+            edges = zip(u.tolist(), v.tolist(), weights.tolist())
+
+        for u, v, weight in edges:
+            graph.add_edge(u, v, weight)
+            if not directed:
+                graph.add_edge(v, u, weight)
+
+        return graph
+
+    @staticmethod
+    def check_dtypes(size: int, weights, dtype=None, node_dtype=None) -> None:
+        """Checks that node ids and weights fit compact storage types without overflow or precision loss.
+
+        Args:
+            size (int): Number of nodes, the largest node id.
+            weights: Edge weight array.
+            dtype: Weight type: a float type, an integer type, or bool/uint8 for
+                unweighted matrices (all weights must be 1). A float type may round a
+                weight to its nearest value (a relative error of at most half its eps,
+                about 6e-8 for float32), but must keep integer weights exact (up to 2**24
+                in float32) and distinct weights distinct.
+            node_dtype: Signed integer type for node ids; hop and parent outputs use -1
+                for unreachable nodes.
+
+        Raises:
+            ValueError: If a value would overflow, round or lose precision in its type.
+        """
+        if node_dtype is not None:
+            node_dtype = np.dtype(node_dtype)
+            if node_dtype.kind != "i":
+                raise ValueError(f"Node dtype must be a signed integer type, not {node_dtype}.")
+            if size > np.iinfo(node_dtype).max:
+                raise ValueError(f"Node ids up to {size} do not fit in {node_dtype}.")
+        if dtype is None or not len(weights):
+            return
+
+        dtype = np.dtype(dtype)
+        weights = np.asarray(weights, dtype=np.float64)
+        if dtype in (np.dtype(bool), np.dtype(np.uint8)) and not np.all(weights == 1):
+            raise ValueError(f"{dtype} storage only holds unweighted graphs, but some weights are not 1.")
+        if dtype.kind in "iu":
+            if not np.all(weights == np.round(weights)):
+                raise ValueError(f"Weights are not all integers and would be rounded in {dtype}.")
+            # Shortest-path distances in the same type sum up to size - 1 weights.
+            largest = float(np.abs(weights).max()) * max(size - 1, 1)
+            if largest > np.iinfo(dtype).max:
+                raise ValueError(f"Path lengths up to {largest:g} could overflow {dtype}.")
+        elif dtype.kind == "f":
+            with np.errstate(over="ignore", under="ignore"):
+                converted = weights.astype(dtype).astype(np.float64)
+            if np.any(np.isinf(converted) & np.isfinite(weights)):
+                raise ValueError(f"Some weights overflow {dtype}.")
+            finite = np.isfinite(weights)
+            if np.any((converted != weights) & finite & (weights == np.round(weights))):
+                raise ValueError(f"Some integer weights are not exact in {dtype}.")
+            distinct = np.unique(weights[finite])
+            if len(np.unique(distinct.astype(dtype))) < len(distinct):
+                raise ValueError(f"Some distinct weights become equal in {dtype}.")
+
+    @staticmethod
+    def read_edge_arrays(file_name: str, weighted: bool):
+        """Reads a data file into NumPy arrays in one pass.
+
+        Returns:
+            tuple: `(size, u, v, weights)`, with 1-based int64 endpoints and float64
+            weights (all 1 for unweighted files).
+        """
+        with open(file_name, "r", encoding="utf-8") as file:
+            size = int(file.readline().strip())
+            first_edge = file.readline()
+            text = first_edge + file.read()
+
+        # Like `read_edges`, ignore a weight column in files read as unweighted.
+        columns = max(len(first_edge.split()), 2)
+        try:
+            values = np.fromstring(text, dtype=np.float64, sep=" ")
+        except ValueError:
+            values = None
+        lines = text.count("\n") + (not text.endswith("\n"))
+        if values is None or len(values) != lines * columns:
+            # Blank lines also land here; only a malformed line is an error.
+            problem = GraphIO._malformed_line(text, columns)
+            if problem is not None or values is None or len(values) % columns:
+                raise ValueError(f"Cannot read {file_name}: {problem or 'malformed edge list'}.")
+        edges = values.reshape(-1, columns)
+        if weighted and columns < 3 and len(edges):
+            raise ValueError(f"Cannot read {file_name}: weighted graphs need a weight column.")
+
+        u, v = edges[:, 0].astype(np.int64), edges[:, 1].astype(np.int64)
+        if len(edges) and (min(u.min(), v.min()) < 1 or max(u.max(), v.max()) > size):
+            raise ValueError(f"Cannot read {file_name}: node ids must be between 1 and {size}.")
+        weights = edges[:, 2].copy() if weighted and len(edges) else np.ones(len(edges))
+        return size, u, v, weights
+
+    @staticmethod
+    def _malformed_line(text: str, columns: int):
+        """Describes the first edge line that does not hold `columns` numbers, or returns None."""
+        for number, line in enumerate(text.splitlines(), start=2):
+            tokens = line.split()
+            if not tokens:
+                continue
+            if len(tokens) != columns:
+                return f"line {number} has {len(tokens)} values instead of {columns}"
+            try:
+                [float(token) for token in tokens]
+            except ValueError:
+                return f"line {number} is not numeric: {line.strip()!r}"
+        return None
+
+    @staticmethod
+    def read_graph_size(file_name: str) -> int:
+        """Reads the node count from the first line of a data file."""
+        with open(file_name, "r", encoding="utf-8") as file:
+            return int(file.readline().strip())
+
+    @staticmethod
+    def read_edges(file_name: str, weighted: bool):
+        """Yields the (u, v, weight) edges of a data file, skipping the node count header.
+
+        Unweighted edges get weight 1, the default of the representations' `add_edge`.
+        """
         with open(file_name, "r", encoding="utf-8") as file:
             for line in file:
                 edge_data = line.strip().split()
+                if len(edge_data) < 2:
+                    # Skips the node count header of the data files and blank lines.
+                    continue
                 if weighted:
-                    u, v, weight = int(edge_data[0]), int(edge_data[1]), float(edge_data[2])
-                    graph.add_edge(u, v, weight)
-                    if not directed:
-                        graph.add_edge(v, u, weight)
+                    yield int(edge_data[0]), int(edge_data[1]), float(edge_data[2])
                 else:
-                    u, v = int(edge_data[0]), int(edge_data[1])
-                    graph.add_edge(u, v)
-                    if not directed:
-                        graph.add_edge(v, u)
+                    yield int(edge_data[0]), int(edge_data[1]), 1
 
-        return graph
+    @staticmethod
+    def result_arrays(size: int, order=None, dist=None, parents=None, components=None, node_dtype=None) -> dict:
+        """Turns traversal and shortest-path results into flat arrays for `save_arrays`.
+
+        Args:
+            size (int): Number of nodes.
+            order: Visit order (list of node ids), kept as an array of that order.
+            dist: Distances, as a node -> distance dictionary (missing nodes get inf) or
+                an array indexed by node id - 1.
+            parents: Parents, as a node -> parent dictionary or an array; 0 means no parent.
+            components: Components as lists of nodes, turned into the component index of every node.
+            node_dtype: Integer type of the node-valued arrays (int64 by default).
+
+        Returns:
+            dict: The given results as `dist`, `parent`, `component` and `order` arrays;
+            all but `order` are indexed by node id - 1.
+        """
+        node_dtype = np.dtype(node_dtype or np.int64)
+        arrays = {}
+        if dist is not None:
+            if isinstance(dist, dict):
+                values = np.full(size, np.inf)
+                values[np.fromiter(dist.keys(), dtype=np.int64, count=len(dist)) - 1] = list(dist.values())
+                dist = values
+            arrays["dist"] = np.asarray(dist)
+        if parents is not None:
+            if isinstance(parents, dict):
+                values = np.zeros(size, dtype=node_dtype)
+                values[np.fromiter(parents.keys(), dtype=np.int64, count=len(parents)) - 1] = [
+                    parent or 0 for parent in parents.values()
+                ]
+                parents = values
+            arrays["parent"] = np.asarray(parents, dtype=node_dtype)
+        if components is not None:
+            labels = np.full(size, -1, dtype=np.int64)
+            for label, component in enumerate(components):
+                labels[np.asarray(component, dtype=np.int64) - 1] = label
+            arrays["component"] = labels
+        if order is not None:
+            arrays["order"] = np.asarray(order, dtype=node_dtype)
+        return arrays
+
+    @staticmethod
+    def save_arrays(file_name: str, arrays: dict, file_format: str = "npy", chunk_size: int = 1_000_000) -> list:
+        """Writes named result arrays in one call, in a binary or CSV format.
+
+        Args:
+            file_name (str): Path prefix of the written files.
+            arrays (dict): Arrays by name, e.g. from `result_arrays`.
+            file_format (str): "npy" writes `<file_name>.<name>.npy` per array, which
+                `load_arrays` (or `np.load(..., mmap_mode="r")`) maps without reading it.
+                "csv" writes the arrays as columns of `<file_name>.csv`, a chunk of rows at
+                a time. `order`, a visit sequence rather than a per-node column, and
+                arrays of another length than the first get their own
+                `<file_name>.<name>.csv`.
+            chunk_size (int): Rows formatted per write in the CSV format.
+
+        Returns:
+            list: The written file names.
+        """
+        if file_format == "npy":
+            written = []
+            for name, values in arrays.items():
+                written.append(f"{file_name}.{name}.npy")
+                np.save(written[-1], np.asarray(values))
+            return written
+        elif file_format == "csv":
+            groups = {}
+            for name, values in arrays.items():
+                # Even when it visits every node, an order must not pass for a per-node column.
+                groups.setdefault(name if name == "order" else len(values), {})[name] = np.asarray(values)
+            written = []
+            for key, columns in groups.items():
+                if key != "order" and f"{file_name}.csv" not in written:
+                    target = f"{file_name}.csv"
+                else:
+                    target = f"{file_name}.{next(iter(columns))}.csv"
+                GraphIO._write_csv(target, columns, chunk_size)
+                written.append(target)
+            return written
+        else:
+            raise ValueError(f"Unsupported file format: {file_format}")
+
+    @staticmethod
+    def load_arrays(file_name: str, names, mmap_mode: str = "r") -> dict:
+        """Opens arrays written by `save_arrays` in the "npy" format, memory-mapped by default."""
+        return {name: np.load(f"{file_name}.{name}.npy", mmap_mode=mmap_mode) for name in names}
+
+    @staticmethod
+    def _write_csv(file_name: str, columns: dict, chunk_size: int) -> None:
+        """Writes equally long arrays as CSV columns under a header of their names."""
+        column_formats = ["%.17g" if values.dtype.kind == "f" else "%d" for values in columns.values()]
+        length = len(next(iter(columns.values())))
+        with open(file_name, "w", encoding="utf-8") as file:
+            file.write(",".join(columns) + "\n")
+            for start in range(0, length, chunk_size):
+                # Mixed columns stack as float64, which holds node ids and labels below 2**53 exactly.
+                rows = np.column_stack([column[start:start + chunk_size] for column in columns.values()])
+                np.savetxt(file, rows, fmt=column_formats, delimiter=",")
 
     @staticmethod
     def save_graph_to_file(filename: str, graph: 'Graph') -> None:
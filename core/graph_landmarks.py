@@ -0,0 +1,186 @@
+import heapq
+import random
+
+import numpy as np
+
+from core.graph_algorithms import GraphAlgorithms
+from core.graph_representations import AdjacencyList
+from core.graph_stats import AlgorithmStats
+
+class LandmarkIndex:
+    """Answers point-to-point distance queries with A*, landmarks and the triangle inequality (ALT).
+
+    The index keeps the exact distances from k landmarks to every node. For any
+    landmark L, |d(L, t) - d(L, v)| never exceeds d(v, t), so the largest of these
+    differences is a lower bound on the remaining distance that steers A* toward the
+    target. Such a bound is consistent, so the search stops when the target is settled.
+    Each query bounds only the nodes it reaches, so its cost follows the explored part
+    of the graph.
+    """
+
+    STRATEGIES = ("farthest", "degree")
+
+    def __init__(self, representation, landmarks, distances):
+        if not isinstance(representation, AdjacencyList) or not representation.weighted:
+            raise NotImplementedError("Landmark indexes need a weighted Adjacency List.")
+        if distances.shape != (representation.size, len(landmarks)):
+            raise ValueError("Landmark distances do not match the graph size.")
+
+        self.representation = representation
+        self.landmarks = list(landmarks)
+        # One row per node (node id - 1), so a node's bound reads a contiguous row.
+        self.distances = distances
+        # float32 rounding may push a bound slightly above the true distance; shave that off.
+        finite = distances[np.isfinite(distances)]
+        self.slack = float(finite.max()) * np.finfo(distances.dtype).eps * 4 if len(finite) else 0.0
+        self.last_settled = 0
+
+    @classmethod
+    def build(cls, representation, num_landmarks: int = 8, strategy: str = "farthest", dtype="float32",
+              seed=None):
+        """Picks the landmarks and runs one Dijkstra from each.
+
+        Args:
+            representation: A weighted, undirected Adjacency List.
+            num_landmarks (int): Number of landmarks (k).
+            strategy (str): "farthest" starts at a well-connected random node and adds the
+                reachable node farthest from the landmarks chosen so far; "degree" takes
+                the k highest-degree nodes.
+            dtype: Storage type of the distance arrays.
+            seed: Seed for the random first landmark.
+
+        Returns:
+            LandmarkIndex: The index.
+        """
+        if strategy not in cls.STRATEGIES:
+            raise ValueError(f"Unsupported landmark strategy: {strategy}")
+
+        size = representation.size
+        num_landmarks = min(num_landmarks, size)
+        algorithms = GraphAlgorithms(representation)
+        distances = np.empty((size, num_landmarks), dtype=dtype)
+
+        if strategy == "degree":
+            degrees = np.array([representation.degree(node) for node in range(1, size + 1)])
+            landmarks = (np.argsort(-degrees, kind="stable")[:num_landmarks] + 1).tolist()
+        else:
+            # Start in the largest component rather than on an isolated node.
+            rng = random.Random(seed)
+            landmarks = [max(rng.sample(range(1, size + 1), min(size, 16)), key=representation.degree)]
+
+        closest = np.full(size, np.inf)
+        for index in range(num_landmarks):
+            if index == len(landmarks):
+                reachable = np.where(np.isfinite(closest), closest, -1)
+                reachable[np.array(landmarks) - 1] = -1
+                landmarks.append(int(np.argmax(reachable)) + 1)
+            dist, _ = algorithms.dijkstra(landmarks[index])
+            column = np.array([dist[node] for node in range(1, size + 1)])
+            distances[:, index] = column
+            np.minimum(closest, column, out=closest)
+
+        return cls(representation, landmarks, distances)
+
+    def save(self, file_name: str) -> None:
+        """Writes the landmarks and their distance arrays to a `.npz` file."""
+        np.savez(file_name, landmarks=np.array(self.landmarks, dtype=np.int64), distances=self.distances)
+
+    @classmethod
+    def load(cls, representation, file_name: str):
+        """Reads an index written by `save` for the same graph."""
+        with np.load(file_name) as data:
+            return cls(representation, data["landmarks"].tolist(), data["distances"])
+
+    def lower_bounds(self, target: int) -> np.ndarray:
+        """Returns the landmark lower bound on the distance from every node (id - 1) to `target`.
+
+        This is a full pass over the n x k distances, meant for bulk analysis; queries
+        bound only the nodes their search reaches (see `lower_bound`).
+        """
+        # Landmarks that reach neither node give nan and are skipped by fmax.
+        with np.errstate(invalid="ignore"):
+            bounds = np.fmax.reduce(np.abs(self.distances - self.distances[target - 1]), axis=1)
+        bounds = np.nan_to_num(bounds, nan=0.0, posinf=np.inf)
+        bounds -= self.slack
+        return np.maximum(bounds, 0, out=bounds)
+
+    def lower_bound(self, node: int, target_row: list) -> float:
+        """Returns max |D[node] - D[target]| over the landmarks, with `target_row` the target's distances as a list."""
+        best = 0.0
+        for landmark_distance, target_distance in zip(self.distances[node - 1].tolist(), target_row):
+            # Equal distances, including a landmark reaching neither node, bound nothing.
+            if landmark_distance != target_distance:
+                difference = abs(landmark_distance - target_distance)
+                if difference > best:
+                    best = difference
+        return max(best - self.slack, 0.0)
+
+    def query(self, start_node: int, target_node: int, collect_stats: bool = False):
+        """Finds a shortest path with landmark-guided A*.
+
+        With `collect_stats=True` the result is returned as `((path, distance), stats)`;
+        the counters include the nodes settled by A* and by a plain Dijkstra stopped at
+        the target, for comparison.
+
+        Returns:
+            tuple: `(path, distance)`, or `([], inf)` when the target is unreachable.
+        """
+        if not collect_stats:
+            return self._search(start_node, target_node, True)
+
+        stats = AlgorithmStats("landmark_query")
+        with stats.track_memory(), stats.phase("search"):
+            result = self._search(start_node, target_node, True, stats)
+        stats.increment("nodes_settled", self.last_settled)
+        with stats.phase("dijkstra"):
+            self._search(start_node, target_node, False)
+        stats.increment("dijkstra_nodes_settled", self.last_settled)
+        self.last_settled = stats.counters["nodes_settled"]
+        return result, stats
+
+    def _search(self, start_node: int, target_node: int, guided: bool, stats=None):
+        """A* from start to target; unguided it is Dijkstra with early exit.
+
+        Bounds are computed when a node is first reached and cached for the query, so
+        the cost follows the explored part of the graph rather than its size.
+        """
+        adj_list = self.representation.get_representation()
+        target_row = self.distances[target_node - 1].tolist()
+        bounds = {}
+
+        def bound(node):
+            if not guided:
+                return 0.0
+            if node not in bounds:
+                bounds[node] = self.lower_bound(node, target_row)
+            return bounds[node]
+
+        dist = {start_node: 0}
+        parents = {start_node: None}
+        settled = set()
+        queue = [(bound(start_node), start_node)]
+
+        while queue:
+            _, node = heapq.heappop(queue)
+            if node in settled:
+                continue
+            settled.add(node)
+            if node == target_node:
+                break
+            for neighbor, weight in adj_list[node].items():
+                new_dist = dist[node] + weight
+                if new_dist < dist.get(neighbor, float("inf")):
+                    estimate = new_dist + bound(neighbor)
+                    if estimate == float("inf"):
+                        # Landmarks put the neighbor in another component than the target.
+                        continue
+                    dist[neighbor] = new_dist
+                    parents[neighbor] = node
+                    heapq.heappush(queue, (estimate, neighbor))
+                    if stats is not None:
+                        stats.increment("heap_pushes")
+
+        self.last_settled = len(settled)
+        if target_node not in settled:
+            return [], float("inf")
+        return GraphAlgorithms.build_path(parents, start_node, target_node), dist[target_node]
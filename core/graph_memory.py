@@ -0,0 +1,185 @@
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+from core.graph_algorithms import GraphAlgorithms
+from core.graph_algorithms import GraphTraversal
+from core.graph_generators import GraphGenerator
+from core.graph_metrics import GraphMetrics
+
+REPRESENTATIONS = ("Adjacency List", "Adjacency Matrix")
+
+class RepresentationCostModel:
+    """Estimates the memory and running time of each representation and picks the cheaper one.
+
+    Memory follows `deep_sizeof` measurements: a matrix is n^2 cells of its dtype,
+    while an Adjacency List pays a fixed cost per node (dictionary entry, list or
+    dict object) and per edge (two list slots or dict entries, plus the int and
+    float objects they point to).
+
+    Running time is `ns_per_unit * work(n, m)` per algorithm and representation. The
+    work terms follow the implementations: list traversals touch every edge once,
+    while matrix traversals scan a full row per visited node in Python. The
+    coefficients were measured on random graphs; `calibrate` measures them on the
+    current machine and returns a model using its own table, leaving `NS_PER_UNIT`
+    untouched. An algorithm missing for a representation (e.g. Floyd-Warshall on a list),
+    or one that would exceed the recursion limit (matrix DFS recurses once per node),
+    rules that representation out.
+    """
+
+    # Bytes per node and per edge of `deep_sizeof` on random Adjacency Lists.
+    LIST_BYTES = {False: (143.0, 66.0), True: (63.0, 165.0)}
+
+    WORK = {
+        "bfs": {"Adjacency List": lambda n, m: n + 2 * m, "Adjacency Matrix": lambda n, m: n * n},
+        "dfs": {"Adjacency List": lambda n, m: n + 2 * m, "Adjacency Matrix": lambda n, m: n * n},
+        "components": {"Adjacency List": lambda n, m: n + 2 * m, "Adjacency Matrix": lambda n, m: n * n},
+        "diameter": {
+            "Adjacency List": lambda n, m: (n + 2 * m) * (1 + n / 64),
+            "Adjacency Matrix": lambda n, m: n * n + 2 * m * n / 64,
+        },
+        "core_numbers": {"Adjacency List": lambda n, m: n + 2 * m, "Adjacency Matrix": lambda n, m: n * n},
+        "triangles": {
+            "Adjacency List": lambda n, m: n + 2 * m * (1 + math.sqrt(m) / 64),
+            "Adjacency Matrix": lambda n, m: n * n + 2 * m * math.sqrt(m) / 64,
+        },
+        "mst": {
+            "Adjacency List": lambda n, m: n + 2 * m * math.log2(m + 2),
+            "Adjacency Matrix": lambda n, m: n * n,
+        },
+        "dijkstra": {
+            "Adjacency List": lambda n, m: (n + 2 * m) * math.log2(n + 2),
+            "Adjacency Matrix": lambda n, m: n * n,
+        },
+        "bfs_frontier": {"Adjacency Matrix": lambda n, m: n * n},
+        "all_pairs": {"Adjacency Matrix": lambda n, m: n * n * n},
+    }
+
+    # Nanoseconds per unit of work, averaged over `calibrate` runs on 500- and 1000-node random graphs.
+    NS_PER_UNIT = {
+        "bfs": {"Adjacency List": 170.0, "Adjacency Matrix": 255.0},
+        "dfs": {"Adjacency List": 165.0, "Adjacency Matrix": 128.0},
+        "components": {"Adjacency List": 140.0, "Adjacency Matrix": 18.0},
+        "diameter": {"Adjacency List": 40.0, "Adjacency Matrix": 12.0},
+        "core_numbers": {"Adjacency List": 260.0, "Adjacency Matrix": 10.0},
+        "triangles": {"Adjacency List": 230.0, "Adjacency Matrix": 20.0},
+        "mst": {"Adjacency List": 30.0, "Adjacency Matrix": 18.0},
+        "dijkstra": {"Adjacency List": 42.0, "Adjacency Matrix": 15.0},
+        "bfs_frontier": {"Adjacency Matrix": 2.2},
+        "all_pairs": {"Adjacency Matrix": 2.6},
+    }
+
+    def __init__(self, ns_per_unit: dict = None):
+        self.ns_per_unit = self.NS_PER_UNIT if ns_per_unit is None else ns_per_unit
+
+    @classmethod
+    def estimate_memory(cls, representation: str, size: int, num_edges: int, weighted: bool = False,
+                        dtype="float64") -> int:
+        """Estimates the bytes held by a representation of `size` nodes and `num_edges` undirected edges."""
+        if representation == "Adjacency Matrix":
+            return size * size * np.dtype(dtype).itemsize + 128
+        elif representation == "Adjacency List":
+            per_node, per_edge = cls.LIST_BYTES[bool(weighted)]
+            return int(per_node * size + per_edge * num_edges)
+        else:
+            raise ValueError("Unsupported representation type.")
+
+    def estimate_time(self, representation: str, algorithm: str, size: int, num_edges: int) -> float:
+        """Estimates the seconds one run of `algorithm` takes; inf when the representation cannot run it."""
+        if algorithm not in self.WORK:
+            raise ValueError(f"Unsupported algorithm: {algorithm}. Choose from {', '.join(self.WORK)}.")
+        work = self.WORK[algorithm].get(representation)
+        if work is None:
+            return float("inf")
+        # Matrix DFS may recurse once per node, on top of the caller's frames.
+        if algorithm == "dfs" and representation == "Adjacency Matrix" and size > sys.getrecursionlimit() - 64:
+            return float("inf")
+        return self.ns_per_unit[algorithm][representation] * work(size, num_edges) * 1e-9
+
+    def choose(self, size: int, num_edges: int, weighted: bool = False, algorithms=("bfs",), memory_limit: int = None,
+               dtype="float64") -> str:
+        """Picks the representation with the lowest estimated time for `algorithms` that fits in memory.
+
+        Args:
+            size (int): Number of nodes.
+            num_edges (int): Number of undirected edges.
+            weighted (bool): Whether the edges carry weights.
+            algorithms: Names of the algorithms to run (keys of `WORK`); with none, the
+                smaller representation wins.
+            memory_limit (int): Bytes available; defaults to half the physical memory
+                when it can be read.
+            dtype: Matrix dtype used for the memory estimate.
+
+        Returns:
+            str: "Adjacency List" or "Adjacency Matrix".
+
+        Raises:
+            ValueError: If no representation supports every algorithm within the memory limit.
+        """
+        if memory_limit is None:
+            memory_limit = self._default_memory_limit()
+
+        candidates = []
+        for representation in REPRESENTATIONS:
+            memory = self.estimate_memory(representation, size, num_edges, weighted, dtype)
+            seconds = sum(self.estimate_time(representation, algorithm, size, num_edges) for algorithm in algorithms)
+            if memory <= memory_limit and seconds < float("inf"):
+                candidates.append((seconds, memory, representation))
+        if not candidates:
+            raise ValueError(f"No representation runs {', '.join(algorithms)} within {memory_limit} bytes.")
+        return min(candidates)[2]
+
+    @classmethod
+    def calibrate(cls, size: int = 500, num_edges: int = 2500, seed=None) -> "RepresentationCostModel":
+        """Times every algorithm on a random graph and builds a model fitted to this machine.
+
+        Kept small by default: matrix traversals scan rows in Python, and matrix DFS recurses
+        once per node; runs the model rules out keep the `NS_PER_UNIT` coefficient.
+
+        Returns:
+            RepresentationCostModel: A model whose `ns_per_unit` holds the measured
+            nanoseconds per unit of work, by algorithm and representation.
+        """
+        default = cls()
+        u, v = GraphGenerator.erdos_renyi(size, num_edges, seed=seed)
+        weights = GraphGenerator.random_weights(len(u), seed=seed)
+        num_edges = len(u)
+        representations = {
+            "Adjacency List": GraphGenerator.to_representation(size, u, v, weights, "Adjacency List"),
+            "Adjacency Matrix": GraphGenerator.to_representation(size, u, v, None, "Adjacency Matrix"),
+        }
+        runners = {
+            "bfs": lambda rep: GraphTraversal(rep).bfs(1),
+            "dfs": lambda rep: GraphTraversal(rep).dfs(1),
+            "components": lambda rep: GraphTraversal(rep).connected_components(),
+            "diameter": lambda rep: GraphMetrics(rep).calculate_diameter(),
+            "core_numbers": lambda rep: GraphMetrics(rep).calculate_core_numbers(),
+            "triangles": lambda rep: GraphMetrics(rep).calculate_triangles(),
+            "mst": lambda rep: GraphAlgorithms(rep).minimum_spanning_forest(),
+            "dijkstra": lambda rep: GraphAlgorithms(rep).dijkstra(1),
+            "bfs_frontier": lambda rep: GraphTraversal(rep).bfs_frontier(1),
+            "all_pairs": lambda rep: GraphAlgorithms(rep).floyd_warshall(),
+        }
+
+        measured = {}
+        for algorithm, work_terms in cls.WORK.items():
+            measured[algorithm] = {}
+            for representation, work in work_terms.items():
+                if default.estimate_time(representation, algorithm, size, num_edges) == float("inf"):
+                    measured[algorithm][representation] = cls.NS_PER_UNIT[algorithm][representation]
+                    continue
+                start_time = time.perf_counter()
+                runners[algorithm](representations[representation])
+                elapsed = time.perf_counter() - start_time
+                measured[algorithm][representation] = elapsed * 1e9 / work(size, num_edges)
+        return cls(measured)
+
+    @staticmethod
+    def _default_memory_limit() -> float:
+        try:
+            return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") / 2
+        except (AttributeError, ValueError, OSError):
+            return float("inf")
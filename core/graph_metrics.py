@@ -1,7 +1,18 @@
+import os
+import random
 import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
 
+import numpy as np
+
+from core.graph_algorithms import GraphTraversal
 from core.graph_representations import AdjacencyList
 from core.graph_representations import AdjacencyMatrix
+from core.graph_views import SubgraphView
+
+# Set in each worker process by `_init_triangle_worker`, so the CSR arrays are shipped once per worker.
+_worker_arrays = None
 
 class GraphMetrics:
     """Calculates metrics for a graph."""
@@ -26,3 +37,304 @@ class GraphMetrics:
             "mean_degree": sum(degrees) / len(degrees),
             "median_degree": statistics.median(degrees),
         }
+
+    def calculate_diameter(self) -> int:
+        """Calculates the diameter as the largest BFS eccentricity (in hops).
+
+        Disconnected graphs report the largest diameter among their components.
+        The BFS runs are bit-parallel, 64 sources per scan of the edges.
+        """
+        eccentricities, _ = GraphTraversal(self.representation).bit_parallel_bfs()
+        return int(eccentricities.max())
+
+    def calculate_approximate_diameter(self, sample_size: int, seed=None) -> int:
+        """Estimates the diameter from the eccentricities of a random sample of nodes.
+
+        The result is a lower bound on the diameter.
+        """
+        rng = random.Random(seed)
+        nodes = range(1, self.representation.size + 1)
+        sample = rng.sample(nodes, min(sample_size, len(nodes)))
+        eccentricities, _ = GraphTraversal(self.representation).bit_parallel_bfs(sample)
+        return int(eccentricities.max())
+
+    def iter_diameter_bounds(self, time_budget: float = None, max_bfs: int = None):
+        """Yields improving lower and upper bounds on the (hop) diameter, one BFS at a time.
+
+        Keeps a lower and an upper bound on every node's eccentricity. A BFS from v
+        gives ecc(v) exactly and, for each reached w at distance d, the bounds
+        max(d, ecc(v) - d) <= ecc(w) <= ecc(v) + d (Takes and Kosters). Sources
+        alternate between the node with the largest upper bound and the one with
+        the smallest lower bound; nodes whose bounds meet are resolved. The
+        diameter lies between the largest lower bound and the largest upper bound
+        still open.
+
+        Stops when the bounds meet, or once `time_budget` seconds or `max_bfs`
+        searches are used up (the check runs between searches).
+
+        Yields:
+            dict: `lower`, `upper`, `bfs_runs`, `elapsed` and `exact` (bounds met).
+        """
+        size = self.representation.size
+        traversal = GraphTraversal(self.representation)
+        start_time = time.perf_counter()
+        lower_ecc = np.zeros(size, dtype=np.int64)
+        # No eccentricity exceeds the size of the node's component minus one.
+        upper_ecc = np.zeros(size, dtype=np.int64)
+        for component in traversal.connected_components():
+            upper_ecc[np.array(component) - 1] = len(component) - 1
+        unresolved = lower_ecc < upper_ecc
+        bfs_runs = 0
+        distances = np.empty(size, dtype=np.int64)
+
+        while unresolved.any():
+            if bfs_runs % 2 == 0:
+                source = int(np.argmax(np.where(unresolved, upper_ecc, -1)))
+            else:
+                source = int(np.argmin(np.where(unresolved, lower_ecc, size)))
+
+            reached, _ = traversal.bfs_distances(source + 1)
+            distances.fill(-1)
+            distances[np.fromiter(reached, dtype=np.int64, count=len(reached)) - 1] = list(reached.values())
+            eccentricity = int(distances.max())
+            bfs_runs += 1
+
+            mask = distances >= 0
+            np.maximum.at(lower_ecc, np.flatnonzero(mask), np.maximum(distances, eccentricity - distances)[mask])
+            upper_ecc[mask] = np.minimum(upper_ecc[mask], eccentricity + distances[mask])
+            lower_ecc[source] = upper_ecc[source] = eccentricity
+            lower = int(lower_ecc.max())
+            unresolved &= lower_ecc < upper_ecc
+            # Nodes that cannot beat the best known eccentricity no longer matter.
+            unresolved &= upper_ecc > lower
+
+            upper = max(lower, int(upper_ecc[unresolved].max())) if unresolved.any() else lower
+            elapsed = time.perf_counter() - start_time
+            yield {"lower": lower, "upper": upper, "bfs_runs": bfs_runs, "elapsed": elapsed, "exact": lower == upper}
+            if lower == upper:
+                return
+            if (time_budget is not None and elapsed >= time_budget) or (max_bfs is not None and bfs_runs >= max_bfs):
+                return
+
+        if bfs_runs == 0:
+            yield {"lower": 0, "upper": 0, "bfs_runs": 0, "elapsed": 0.0, "exact": True}
+
+    def estimate_diameter(self, time_budget: float = None, max_bfs: int = None) -> dict:
+        """Runs `iter_diameter_bounds` until the bounds meet or the budget runs out; returns the last bounds."""
+        bounds = None
+        for bounds in self.iter_diameter_bounds(time_budget, max_bfs):
+            pass
+        return bounds
+
+    def calculate_eccentricities(self, sources=None) -> dict:
+        """Maps each source (every node by default) to its BFS eccentricity in hops."""
+        sources = list(range(1, self.representation.size + 1)) if sources is None else list(sources)
+        eccentricities, _ = GraphTraversal(self.representation).bit_parallel_bfs(sources)
+        return dict(zip(sources, eccentricities.tolist()))
+
+    def calculate_distance_histogram(self, sources=None) -> list:
+        """Counts the (source, node) pairs at each hop distance; index 0 holds the sources."""
+        _, histogram = GraphTraversal(self.representation).bit_parallel_bfs(sources)
+        return histogram
+
+    def calculate_average_distance(self) -> float:
+        """Averages the hop distance over all ordered pairs of distinct, connected nodes."""
+        histogram = self.calculate_distance_histogram()
+        pairs = sum(histogram[1:])
+        return sum(distance * count for distance, count in enumerate(histogram)) / pairs if pairs else 0.0
+
+    def calculate_core_numbers(self):
+        """Computes the k-core decomposition with the O(n + m) bucket algorithm of Batagelj and Zaversnik.
+
+        Nodes are kept in an array sorted by current degree, with the start of every
+        degree bucket tracked. Taking nodes in that order fixes their core number;
+        each neighbor with a larger degree moves to the front of its bucket and the
+        bucket boundary shifts, so removing a node costs one swap per edge.
+
+        Returns:
+            tuple: `(core_numbers, degeneracy, ordering)`, where `core_numbers[node - 1]`
+            is the core number of a node, `degeneracy` the largest one and `ordering`
+            the 1-based degeneracy ordering (the order the nodes were removed in).
+        """
+        indptr, indices = self.representation.to_csr()
+        size = self.representation.size
+        if size == 0:
+            return np.zeros(0, dtype=np.int64), 0, np.zeros(0, dtype=np.int64)
+        degrees = np.diff(indptr)
+
+        # Counting sort of the nodes by degree.
+        vert = np.argsort(degrees, kind="stable")
+        bucket_start = np.zeros(int(degrees.max()) + 2, dtype=np.int64)
+        np.cumsum(np.bincount(degrees), out=bucket_start[1:])
+        pos = np.empty(size, dtype=np.int64)
+        pos[vert] = np.arange(size)
+
+        indptr, indices = indptr.tolist(), indices.tolist()
+        degree, vert, pos, bucket_start = degrees.tolist(), vert.tolist(), pos.tolist(), bucket_start.tolist()
+
+        for node in vert:
+            node_degree = degree[node]
+            for neighbor in indices[indptr[node]:indptr[node + 1]]:
+                neighbor_degree = degree[neighbor]
+                if neighbor_degree > node_degree:
+                    # Swap the neighbor with the first node of its bucket, then shrink the bucket.
+                    neighbor_pos, first_pos = pos[neighbor], bucket_start[neighbor_degree]
+                    first = vert[first_pos]
+                    if first != neighbor:
+                        vert[neighbor_pos], vert[first_pos] = first, neighbor
+                        pos[neighbor], pos[first] = first_pos, neighbor_pos
+                    bucket_start[neighbor_degree] += 1
+                    degree[neighbor] = neighbor_degree - 1
+
+        core_numbers = np.array(degree, dtype=np.int64)
+        return core_numbers, int(core_numbers.max()), np.array(vert, dtype=np.int64) + 1
+
+    def k_core(self, k: int, core_numbers=None) -> SubgraphView:
+        """Returns the k-core as a view over the representation, without copying the adjacency.
+
+        Args:
+            k (int): Minimum core number of the nodes kept.
+            core_numbers: A `calculate_core_numbers` result to reuse, if available.
+        """
+        if core_numbers is None:
+            core_numbers, _, _ = self.calculate_core_numbers()
+        return SubgraphView(self.representation, core_numbers >= k)
+
+    def calculate_triangles(self, processes: int = None, batch_size: int = 1 << 20):
+        """Counts the triangles at every node and the local clustering coefficients.
+
+        Edges are oriented from lower to higher (degree, id) rank, so every triangle is
+        found exactly once, from its lowest-ranked node, and no node has more than
+        O(sqrt(m)) out-neighbors. The out-neighbor pairs of a range of nodes are built
+        as arrays and closed with a binary search in the sorted edge keys, which
+        intersects the sorted neighbor arrays a batch at a time.
+
+        Args:
+            processes (int): Spread the node ranges over this many worker processes;
+                0 uses every CPU. Runs in this process by default.
+            batch_size (int): Approximate number of neighbor pairs checked per batch.
+
+        Returns:
+            tuple: `(triangles, local_clustering)` arrays indexed by node id - 1.
+        """
+        triangles, degrees = self._count_triangles(processes, batch_size)
+        return triangles, _local_clustering(triangles, degrees)
+
+    def calculate_clustering(self, processes: int = None) -> dict:
+        """Summarizes triangles into the triangle count and the global and average clustering coefficients."""
+        triangles, degrees = self._count_triangles(processes)
+        local_clustering = _local_clustering(triangles, degrees)
+        total = int(triangles.sum()) // 3
+        pairs = float((degrees * (degrees - 1) // 2).sum())
+        return {
+            "triangles": total,
+            "global_clustering": 3 * total / pairs if pairs else 0.0,
+            "average_clustering": float(local_clustering.mean()) if len(local_clustering) else 0.0,
+        }
+
+    def _count_triangles(self, processes: int = None, batch_size: int = 1 << 20):
+        """Returns the per-node triangle counts and simple-graph degrees, indexed by node id - 1."""
+        size = self.representation.size
+        indptr, heads, rank_to_node = _oriented_csr(*self.representation.to_csr())
+        edge_keys = np.repeat(np.arange(size), np.diff(indptr)) * size + heads
+        ranges = _balanced_ranges(indptr, batch_size)
+
+        # Range results are summed as they arrive, so only one length-n array is kept at a time.
+        counts = np.zeros(size, dtype=np.int64)
+        if processes is None:
+            for start, stop in ranges:
+                counts += _count_range_triangles(indptr, heads, edge_keys, start, stop)
+        else:
+            with ProcessPoolExecutor(processes or os.cpu_count(), initializer=_init_triangle_worker,
+                                     initargs=(indptr, heads, edge_keys)) as pool:
+                for range_counts in pool.map(_count_triangle_worker, ranges):
+                    counts += range_counts
+
+        triangles = np.zeros(size, dtype=np.int64)
+        degrees = np.zeros(size, dtype=np.int64)
+        triangles[rank_to_node] = counts
+        degrees[rank_to_node] = np.diff(indptr) + np.bincount(heads, minlength=size)
+        return triangles, degrees
+
+def _local_clustering(triangles, degrees):
+    """Divides each node's triangles by its neighbor pairs; 0 for nodes with fewer than two neighbors."""
+    pairs = degrees * (degrees - 1) / 2
+    return np.divide(triangles, pairs, out=np.zeros(len(triangles)), where=pairs > 0)
+
+def _init_triangle_worker(indptr, heads, edge_keys) -> None:
+    global _worker_arrays
+    _worker_arrays = (indptr, heads, edge_keys)
+
+def _count_triangle_worker(bounds):
+    start, stop = bounds
+    return _count_range_triangles(*_worker_arrays, start, stop)
+
+def _oriented_csr(indptr, indices):
+    """Orients every undirected edge from lower to higher (degree, id) rank.
+
+    Returns CSR arrays over ranks, each out-neighbor list sorted, without self-loops
+    or duplicates, plus the 0-based node at every rank.
+    """
+    size = len(indptr) - 1
+    tails = np.repeat(np.arange(size), np.diff(indptr))
+    heads = indices
+    loops = tails == heads
+    tails, heads = tails[~loops], heads[~loops]
+
+    # Degrees in the simple undirected graph, counting each pair once.
+    low, high = np.minimum(tails, heads), np.maximum(tails, heads)
+    keys = np.sort(low * size + high)
+    keys = keys[np.r_[True, keys[1:] != keys[:-1]]] if len(keys) else keys
+    low, high = keys // size, keys % size
+    degrees = np.bincount(low, minlength=size) + np.bincount(high, minlength=size)
+
+    rank_to_node = np.lexsort((np.arange(size), degrees))
+    rank = np.empty(size, dtype=np.int64)
+    rank[rank_to_node] = np.arange(size)
+    low, high = rank[low], rank[high]
+    low, high = np.minimum(low, high), np.maximum(low, high)
+
+    order = np.lexsort((high, low))
+    oriented_indptr = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(low, minlength=size), out=oriented_indptr[1:])
+    return oriented_indptr, high[order], rank_to_node
+
+def _balanced_ranges(indptr, batch_size: int) -> list:
+    """Splits the ranks into consecutive ranges holding about `batch_size` out-neighbor pairs each."""
+    out_degrees = np.diff(indptr)
+    cumulative = np.cumsum(out_degrees * (out_degrees - 1) // 2)
+    if not len(cumulative):
+        return []
+    cuts = np.searchsorted(cumulative, np.arange(batch_size, int(cumulative[-1]), batch_size), side="right")
+    bounds = np.unique(np.r_[0, cuts, len(out_degrees)])
+    return list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+
+def _count_range_triangles(indptr, heads, edge_keys, start: int, stop: int):
+    """Counts, per rank, the triangles closed by the out-neighbor pairs of ranks [start, stop).
+
+    Module-level so worker processes can run it.
+    """
+    size = len(indptr) - 1
+    counts = np.zeros(size, dtype=np.int64)
+    begin, end = indptr[start], indptr[stop]
+    if end == begin:
+        return counts
+
+    # Pair every out-neighbor position with each later position of the same list.
+    positions = np.arange(begin, end)
+    list_ends = np.repeat(indptr[start + 1:stop + 1], np.diff(indptr[start:stop + 1]))
+    later = list_ends - positions - 1
+    first = np.repeat(positions, later)
+    group_offsets = np.repeat(np.cumsum(later) - later, later)
+    second = first + 1 + np.arange(len(first)) - group_offsets
+    owners = np.repeat(np.repeat(np.arange(start, stop), np.diff(indptr[start:stop + 1])), later)
+
+    # Out-neighbor lists are sorted, so v < w and the pair closes a triangle when the edge v -> w exists.
+    v, w = heads[first], heads[second]
+    pair_keys = v * size + w
+    found = np.minimum(np.searchsorted(edge_keys, pair_keys), len(edge_keys) - 1)
+    closed = edge_keys[found] == pair_keys
+
+    for nodes in (owners[closed], v[closed], w[closed]):
+        counts += np.bincount(nodes, minlength=size)
+    return counts
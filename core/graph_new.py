@@ -1,55 +1,481 @@
+import numpy as np
+
 from core.graph_algorithms import GraphAlgorithms
 from core.graph_algorithms import GraphFlowNetwork
 from core.graph_algorithms import GraphTraversal
+from core.graph_centrality import GraphCentrality
+from core.graph_checkpoint import ResumableSourceJob
+from core.graph_dynamic import DynamicGraphState
+from core.graph_dynamic import DynamicShortestPaths
 from core.graph_io import GraphIO
+from core.graph_landmarks import LandmarkIndex
+from core.graph_memory import RepresentationCostModel
 from core.graph_metrics import GraphMetrics
+from core.graph_ordering import NodeOrdering
 from core.graph_representations import AdjacencyList
 from core.graph_representations import AdjacencyMatrix
+from core.graph_stats import deep_sizeof
+from core.graph_views import SubgraphView
 
 class Graph:
     """High-level class managing the graph by delegating tasks to appropriate classes."""
 
-    def __init__(self, size: int, representation: str, weighted: bool = False, directed: bool = False):
+    def __init__(self, size: int, representation: str, weighted: bool = False, directed: bool = False,
+                 ordering: NodeOrdering = None, dtype=None, node_dtype=None, num_edges: int = None,
+                 algorithms=None):
         self.size = size
         self.weighted = weighted
         self.is_directed = directed
+        if node_dtype is not None:
+            GraphIO.check_dtypes(size, (), node_dtype=node_dtype)
+        if representation == "auto":
+            # Chosen from the cost models; `algorithms` names the workload, see `RepresentationCostModel.WORK`.
+            if num_edges is None:
+                raise ValueError("The auto representation needs the number of edges.")
+            representation = RepresentationCostModel().choose(
+                size, num_edges, weighted, algorithms or ("bfs",), dtype=dtype or "float64"
+            )
+        self.representation_name = representation
+        # `dtype` and `node_dtype` pick compact storage, e.g. "float32" weights, "bool" unweighted matrices, "int32" ids.
         self.representation = (
-            AdjacencyMatrix(size) if representation == "Adjacency Matrix" else AdjacencyList(size, weighted)
+            AdjacencyMatrix(size, dtype or "float64", node_dtype) if representation == "Adjacency Matrix"
+            else AdjacencyList(size, weighted, dtype, node_dtype)
         )
         self.metrics = GraphMetrics(self.representation)
         self.traversal = GraphTraversal(self.representation)
         self.algorithms = GraphAlgorithms(self.representation)
+        self.centrality = GraphCentrality(self.representation)
         self.file_io = GraphIO
+        # Node relabeling for locality; callers always use (and get back) the original ids.
+        self.ordering = ordering
+        self.representation.ordering = ordering
+
+        self.dynamic = None
+        self.shortest_path_trees = {}
+        self.landmark_index = None
 
         if directed:
             self.flow_network = GraphFlowNetwork()
 
+    @classmethod
+    def from_file(cls, file_name: str, representation: str, weighted: bool = False, directed: bool = False,
+                  reorder: str = None, dtype=None, node_dtype=None, algorithms=None):
+        """Builds a graph from a data file: the node count, then one edge per line.
+
+        With `reorder` ("bfs", "rcm" or "degree") the representation is built with the
+        nodes relabeled for memory locality. Inputs and results of the facade methods
+        keep using the original ids; objects taken from the representation level (such
+        as tracked shortest-path trees) use the internal ids of `graph.ordering`.
+
+        `dtype` and `node_dtype` select compact storage; the file's weights and node
+        count are checked against them first (see `GraphIO.check_dtypes`).
+
+        With `representation="auto"` the layout is picked from the file's node and
+        edge counts and the `algorithms` to be run; see `RepresentationCostModel`.
+        """
+        if reorder is None and dtype is None and node_dtype is None and representation != "auto":
+            graph = cls(GraphIO.read_graph_size(file_name), representation, weighted, directed)
+            edges = GraphIO.read_edges(file_name, weighted)
+        else:
+            size, u, v, weights = GraphIO.read_edge_arrays(file_name, weighted)
+            GraphIO.check_dtypes(size, weights, dtype, node_dtype)
+            ordering = None if reorder is None else NodeOrdering.from_edges(size, u, v, reorder)
+            graph = cls(size, representation, weighted, directed, ordering, dtype, node_dtype, len(u), algorithms)
+            edges = zip(u.tolist(), v.tolist(), weights.tolist())
+
+        for u, v, weight in edges:
+            graph.add_edge(u, v, weight)
+        return graph
+
+    def memory_usage(self) -> dict:
+        """Reports the bytes held by the graph, following every referenced object (unlike `sys.getsizeof`).
+
+        Returns:
+            dict: Bytes of the `representation`, the duplicate `flow_network` of
+            directed graphs, the `landmark_index` and the `total`, in which objects
+            shared between them are counted once.
+        """
+        parts = {
+            "representation": self.representation,
+            "flow_network": getattr(self, "flow_network", None),
+            "landmark_index": self.landmark_index and self.landmark_index.distances,
+        }
+        usage = {name: deep_sizeof(part) if part is not None else 0 for name, part in parts.items()}
+        usage["total"] = deep_sizeof([part for part in parts.values() if part is not None])
+        return usage
+
     def add_edge(self, u: int, v: int, weight: float = 1):
         """Adds an edge to the graph."""
-        self.representation.add_edge(u, v, weight)
         if self.is_directed:
             self.flow_network.add_edge(u, v, weight)  
+        u, v = self._internal(u), self._internal(v)
+        self.representation.add_edge(u, v, weight)
+        self.landmark_index = None
+        if self.dynamic is not None:
+            self.dynamic.edge_added(u, v)
+        for tree in self.shortest_path_trees.values():
+            tree.update_edge(u, v)
+
+    def remove_edge(self, u: int, v: int):
+        """Removes an edge from the graph."""
+        if self.is_directed:
+            self.flow_network.remove_edge(u, v)
+        u, v = self._internal(u), self._internal(v)
+        self.representation.remove_edge(u, v)
+        self.landmark_index = None
+        if self.dynamic is not None:
+            self.dynamic.edge_removed(u, v)
+        for tree in self.shortest_path_trees.values():
+            tree.update_edge(u, v)
+
+    def track_changes(self):
+        """Starts maintaining components, degree metrics and the edge count incrementally.
+
+        Builds the state once from the current graph; afterwards every `add_edge` and
+        `remove_edge` only updates the neighborhood of the changed edge.
+        """
+        if self.dynamic is None:
+            self.dynamic = DynamicGraphState(self.representation)
+        return self.dynamic
+
+    def track_shortest_paths(self, start_node: int, dist: dict = None, parents: dict = None):
+        """Keeps the shortest-path tree from `start_node` repaired on every edge update.
+
+        Reuses a previous `dijkstra(start_node)` result when one is given.
+
+        Returns:
+            DynamicShortestPaths: The tree, whose `dist` and `parents` stay current.
+        """
+        start_node = self._internal(start_node)
+        if start_node not in self.shortest_path_trees:
+            self.shortest_path_trees[start_node] = DynamicShortestPaths(self.representation, start_node, dist, parents)
+        return self.shortest_path_trees[start_node]
+
+    def num_edges(self) -> int:
+        """Counts the edges, in constant time once `track_changes` is on."""
+        return self.track_changes().num_edges
+
+    def connected(self, u: int, v: int) -> bool:
+        """Checks whether two nodes are in the same connected component."""
+        return self.track_changes().connected(self._internal(u), self._internal(v))
 
     def get_degree_metrics(self):
         """Fetches degree metrics."""
+        if self.dynamic is not None:
+            return self.dynamic.degree_metrics()
         return self.metrics.calculate_degree_metrics()
 
-    def bfs(self, start_node: int):
+    def bfs(self, start_node: int, collect_stats: bool = False):
         """Delegates BFS to the traversal class."""
-        return self.traversal.bfs(start_node)
+        result = self.traversal.bfs(self._internal(start_node), collect_stats)
+        return self._translated(result, self.ordering and self.ordering.nodes_to_original, collect_stats)
 
-    def dfs(self, start_node: int):
+    def dfs(self, start_node: int, collect_stats: bool = False):
         """Delegates DFS to the traversal class."""
-        return self.traversal.dfs(start_node)
+        result = self.traversal.dfs(self._internal(start_node), collect_stats)
+
+        def translate(dfs_result):
+            if isinstance(dfs_result, tuple):
+                order, parents = dfs_result
+                return self.ordering.nodes_to_original(order), self.ordering.mapping_to_original(parents, True)
+            return self.ordering.nodes_to_original(dfs_result)
+        return self._translated(result, translate, collect_stats)
+
+    def iter_bfs(self, start_node: int, max_depth: int = None):
+        """Delegates the lazy BFS, yielding `(node, depth, parent)`, to the traversal class."""
+        return self._translated_walk(self.traversal.iter_bfs(self._internal(start_node), max_depth))
+
+    def iter_dfs(self, start_node: int, max_depth: int = None):
+        """Delegates the lazy DFS, yielding `(node, depth, parent)`, to the traversal class."""
+        return self._translated_walk(self.traversal.iter_dfs(self._internal(start_node), max_depth))
+
+    def neighborhood(self, start_node: int, radius: int) -> dict:
+        """Returns the hop distance of every node within `radius` hops of a start node."""
+        return {node: depth for node, depth, _ in self.iter_bfs(start_node, radius)}
+
+    def bfs_frontier(self, start_node: int):
+        """Delegates frontier-at-a-time BFS (Adjacency Matrix only) to the traversal class."""
+        result = self.traversal.bfs_frontier(self._internal(start_node))
+        return self._translated(
+            result, lambda frontier_result: (self.ordering.nodes_to_original(frontier_result[0]),
+                                             self.ordering.array_to_original(frontier_result[1]))
+        )
+
+    def multi_source_bfs(self, sources, batch_size: int = 256):
+        """Delegates batched multi-source BFS (Adjacency Matrix only) to the traversal class."""
+        if self.ordering is None:
+            return self.traversal.multi_source_bfs(sources, batch_size)
+        distances = self.traversal.multi_source_bfs(self.ordering.forward[sources], batch_size)
+        return self.ordering.array_to_original(distances, axis=1)
+
+    def dijkstra(self, start_node: int, collect_stats: bool = False):
+        """Delegates Dijkstra's algorithm to the algorithms class.
+
+        Distances and parents are Python dicts whatever the dtypes; `dijkstra_arrays`
+        returns them in the graph's weight and node dtypes.
+        """
+        result = self.algorithms.dijkstra(self._internal(start_node), collect_stats)
+        return self._translated(
+            result, lambda dijkstra_result: (self.ordering.mapping_to_original(dijkstra_result[0]),
+                                             self.ordering.mapping_to_original(dijkstra_result[1], True)),
+            collect_stats,
+        )
+
+    def dijkstra_arrays(self, start_node: int):
+        """Delegates Dijkstra's algorithm with compact `(dist, parents)` array outputs to the algorithms class."""
+        dist, parents = self.algorithms.dijkstra_arrays(self._internal(start_node))
+        if self.ordering is None:
+            return dist, parents
+        return self.ordering.array_to_original(dist), self.ordering.inverse[self.ordering.array_to_original(parents)].astype(parents.dtype)
+
+    def shortest_path(self, start_node: int, target_node: int):
+        """Finds a shortest path, weighted with Dijkstra or in hops with BFS.
+
+        Returns:
+            tuple: `(path, distance)`, or `([], inf)` when the target is unreachable.
+        """
+        start_node, target_node = self._internal(start_node), self._internal(target_node)
+        if self.weighted:
+            path, distance = self.algorithms.shortest_path(start_node, target_node)
+        else:
+            path, distance = self.traversal.hop_path(start_node, target_node)
+        return self._translated(path, self.ordering and self.ordering.nodes_to_original), distance
+
+    def pair_distances(self, sources, targets, paths: bool = False):
+        """Delegates bulk (source, target) distance queries, grouped by source, to the algorithms class.
+
+        Distances are weighted on weighted graphs and in hops otherwise, as in
+        `shortest_path`, and come back aligned with the input pairs.
+
+        Returns:
+            numpy.ndarray: Distance of each pair, or `(distances, paths)` with `paths`.
+        """
+        if self.ordering is not None:
+            sources = self.ordering.forward[np.asarray(sources, dtype=np.int64)]
+            targets = self.ordering.forward[np.asarray(targets, dtype=np.int64)]
+        result = self.algorithms.pair_distances(sources, targets, self.weighted, paths)
+        if not paths or self.ordering is None:
+            return result
+        distances, found_paths = result
+        return distances, [self.ordering.nodes_to_original(path) for path in found_paths]
+
+    def build_landmark_index(self, num_landmarks: int = 8, strategy: str = "farthest", file_name: str = None,
+                             seed=None):
+        """Precomputes a landmark index for `landmark_query`, optionally saving it to `file_name`.
 
-    def dijkstra(self, start_node: int):
-        """Delegates Dijkstra's algorithm to the algorithms class."""
-        return self.algorithms.dijkstra(start_node)
+        The index is dropped on the next edge update, since its bounds would go stale.
+        """
+        self.landmark_index = LandmarkIndex.build(self.representation, num_landmarks, strategy, seed=seed)
+        if file_name is not None:
+            self.landmark_index.save(file_name)
+        return self.landmark_index
 
-    def ford_fulkerson(self, source: int, target: int, bottleneck: float = float('inf'), save_to_file=None):
+    def load_landmark_index(self, file_name: str):
+        """Loads a landmark index saved by `build_landmark_index` for this graph."""
+        self.landmark_index = LandmarkIndex.load(self.representation, file_name)
+        return self.landmark_index
+
+    def landmark_query(self, start_node: int, target_node: int, collect_stats: bool = False):
+        """Finds a shortest weighted path with landmark-guided A*, building a default index if needed."""
+        if self.landmark_index is None:
+            self.build_landmark_index()
+        result = self.landmark_index.query(self._internal(start_node), self._internal(target_node), collect_stats)
+        return self._translated(
+            result, lambda query_result: (self.ordering.nodes_to_original(query_result[0]), query_result[1]),
+            collect_stats,
+        )
+
+    def all_pairs_shortest_paths(self, dtype="float64", block_size: int = 256, predecessors: bool = False):
+        """Delegates blocked Floyd-Warshall (Adjacency Matrix only) to the algorithms class."""
+        result = self.algorithms.floyd_warshall(dtype, block_size, predecessors)
+        if self.ordering is None:
+            return result
+        dist, pred = result if predecessors else (result, None)
+        dist = self.ordering.array_to_original(self.ordering.array_to_original(dist, axis=0), axis=1)
+        if not predecessors:
+            return dist
+        pred = self.ordering.array_to_original(self.ordering.array_to_original(pred, axis=0), axis=1)
+        return dist, self.ordering.inverse[pred].astype(pred.dtype)
+
+    def minimum_spanning_forest(self):
+        """Delegates the minimum spanning forest (Prim on matrices, Kruskal on lists) to the algorithms class.
+
+        Returns:
+            tuple: `(u, v, weights, total_weight)`, with the forest edges as 1-based arrays.
+        """
+        u, v, weights, total_weight = self.algorithms.minimum_spanning_forest()
+        if self.ordering is not None:
+            u, v = self.ordering.inverse[u], self.ordering.inverse[v]
+        return u, v, weights, total_weight
+
+    def find_connected_components(self):
+        """Delegates connected components to the traversal class."""
+        if self.dynamic is not None:
+            components = self.dynamic.connected_components()
+        else:
+            components = self.traversal.connected_components()
+        return self._translated(
+            components, lambda found: [self.ordering.nodes_to_original(component) for component in found]
+        )
+
+    def calculate_diameter(self, checkpoint_file: str = None, checkpoint_interval: float = 60.0):
+        """Delegates the (hop) diameter to the metrics class.
+
+        With a `checkpoint_file`, progress is saved every `checkpoint_interval` seconds
+        and a rerun after an interruption resumes from it.
+        """
+        if checkpoint_file is None:
+            return self.metrics.calculate_diameter()
+        return self.resumable_job("eccentricities", checkpoint_file, checkpoint_interval).run()["diameter"]
+
+    def resumable_job(self, job: str, checkpoint_file: str, interval: float = 60.0, sources=None, seed=None):
+        """Creates (or resumes) a checkpointed multi-source job; see `ResumableSourceJob`."""
+        return ResumableSourceJob(
+            self.representation, job, checkpoint_file, interval, sources=sources, seed=seed, ordering=self.ordering
+        )
+
+    def calculate_core_numbers(self):
+        """Delegates the k-core decomposition to the metrics class.
+
+        Returns:
+            tuple: `(core_numbers, degeneracy, ordering)`; see `GraphMetrics.calculate_core_numbers`.
+        """
+        core_numbers, degeneracy, ordering = self.metrics.calculate_core_numbers()
+        if self.ordering is not None:
+            core_numbers, ordering = self.ordering.array_to_original(core_numbers), self.ordering.inverse[ordering]
+        return core_numbers, degeneracy, ordering
+
+    def k_core(self, k: int):
+        """Returns the k-core as a `SubgraphView` sharing this graph's adjacency."""
+        core_numbers, _, _ = self.metrics.calculate_core_numbers()
+        return SubgraphView(self.representation, core_numbers >= k, self.ordering)
+
+    def subgraph(self, nodes):
+        """Returns the subgraph induced by `nodes` (a list of node ids, or a boolean mask by node id - 1) as a `SubgraphView`."""
+        nodes = np.asarray(nodes)
+        if nodes.dtype == bool:
+            mask = nodes if self.ordering is None else nodes[self.ordering.inverse[1:] - 1]
+        else:
+            mask = np.zeros(self.size, dtype=bool)
+            internal = nodes if self.ordering is None else self.ordering.forward[nodes]
+            mask[np.asarray(internal, dtype=np.int64) - 1] = True
+        return SubgraphView(self.representation, mask, self.ordering)
+
+    def component(self, node: int):
+        """Returns the connected component containing `node` as a `SubgraphView`."""
+        component = self.traversal.component(self._internal(node))
+        mask = np.zeros(self.size, dtype=bool)
+        mask[np.asarray(component, dtype=np.int64) - 1] = True
+        return SubgraphView(self.representation, mask, self.ordering)
+
+    def largest_component(self):
+        """Returns the largest connected component as a `SubgraphView`."""
+        return SubgraphView.largest_component(self.representation, self.ordering)
+
+    def calculate_triangles(self, processes: int = None):
+        """Delegates per-node triangle counts and local clustering coefficients to the metrics class."""
+        triangles, local_clustering = self.metrics.calculate_triangles(processes)
+        if self.ordering is not None:
+            triangles = self.ordering.array_to_original(triangles)
+            local_clustering = self.ordering.array_to_original(local_clustering)
+        return triangles, local_clustering
+
+    def calculate_clustering(self, processes: int = None) -> dict:
+        """Delegates the triangle count and global/average clustering coefficients to the metrics class."""
+        return self.metrics.calculate_clustering(processes)
+
+    def estimate_centrality(self, samples: int = None, epsilon: float = 0.1, delta: float = 0.1,
+                            confidence: float = 0.95, processes: int = None, seed=None) -> dict:
+        """Delegates sampled closeness and betweenness, with confidence intervals, to the centrality class."""
+        result = self.centrality.estimate(samples, epsilon, delta, confidence, processes, seed)
+        if self.ordering is not None:
+            result = {
+                key: value if key == "samples" else self.ordering.array_to_original(value)
+                for key, value in result.items()
+            }
+        return result
+
+    def calculate_approximate_diameter(self, sample_size: int, seed=None) -> int:
+        """Delegates the sampled (lower bound) diameter to the metrics class."""
+        return self.metrics.calculate_approximate_diameter(sample_size, seed)
+
+    def iter_diameter_bounds(self, time_budget: float = None, max_bfs: int = None):
+        """Delegates the anytime diameter bounds (a generator of dicts) to the metrics class."""
+        return self.metrics.iter_diameter_bounds(time_budget, max_bfs)
+
+    def estimate_diameter(self, time_budget: float = None, max_bfs: int = None) -> dict:
+        """Delegates the budgeted diameter bounds to the metrics class."""
+        return self.metrics.estimate_diameter(time_budget, max_bfs)
+
+    def calculate_eccentricities(self, sources=None) -> dict:
+        """Delegates the bit-parallel eccentricities to the metrics class."""
+        if self.ordering is None:
+            return self.metrics.calculate_eccentricities(sources)
+        if sources is not None:
+            sources = [self._internal(node) for node in sources]
+        return self.ordering.mapping_to_original(self.metrics.calculate_eccentricities(sources))
+
+    def calculate_distance_histogram(self, sources=None) -> list:
+        """Delegates the hop distance histogram to the metrics class."""
+        if self.ordering is not None and sources is not None:
+            sources = [self._internal(node) for node in sources]
+        return self.metrics.calculate_distance_histogram(sources)
+
+    def calculate_average_distance(self) -> float:
+        """Delegates the average hop distance to the metrics class."""
+        return self.metrics.calculate_average_distance()
+
+    def ford_fulkerson(self, source: int, target: int, bottleneck: float = float('inf'), save_to_file=None,
+                       collect_stats: bool = False):
         """Runs the Ford-Fulkerson algorithm to find the maximum flow in a directed graph."""
         if not self.is_directed:
             raise ValueError("Ford-Fulkerson is only applicable for directed graphs.")
 
-        max_flow = self.flow_network.ford_fulkerson(source, target, bottleneck, save_to_file)
+        max_flow = self.flow_network.ford_fulkerson(source, target, bottleneck, save_to_file, collect_stats)
         return max_flow
+
+    def export_results(self, file_name: str, file_format: str = "npy", order=None, dist=None, parents=None,
+                       components=None) -> list:
+        """Saves traversal, shortest-path or component results as arrays in one call.
+
+        Takes results as the facade methods return them (lists, dictionaries or
+        arrays, in original ids) and writes them with `GraphIO.save_arrays`, e.g.
+        `graph.export_results("run", order=order, parents=parents)` after `bfs`.
+
+        Returns:
+            list: The written file names.
+        """
+        arrays = GraphIO.result_arrays(
+            self.size, order, dist, parents, components, getattr(self.representation, "node_dtype", None)
+        )
+        return GraphIO.save_arrays(file_name, arrays, file_format)
+
+    def export_flows(self, file_name: str, file_format: str = "npy") -> list:
+        """Saves the edges carrying flow after `ford_fulkerson` as `u`, `v` and `flow` arrays."""
+        if not self.is_directed:
+            raise ValueError("Flows are only available for directed graphs.")
+        u, v, flow = self.flow_network.flow_arrays()
+        return GraphIO.save_arrays(file_name, {"u": u, "v": v, "flow": flow}, file_format)
+
+    def _internal(self, node: int) -> int:
+        """Maps an original node id to the id used by the representation."""
+        return node if self.ordering is None else self.ordering.to_internal(node)
+
+    def _translated(self, result, translate, collect_stats: bool = False):
+        """Maps a representation-level result back to original ids when the graph is reordered."""
+        if self.ordering is None:
+            return result
+        if collect_stats:
+            result, stats = result
+            return translate(result), stats
+        return translate(result)
+
+    def _translated_walk(self, walk):
+        """Maps the nodes of a lazy traversal back to original ids when the graph is reordered."""
+        if self.ordering is None:
+            return walk
+        to_original = self.ordering.to_original
+        return (
+            (to_original(node), depth, None if parent is None else to_original(parent))
+            for node, depth, parent in walk
+        )
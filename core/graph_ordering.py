@@ -0,0 +1,111 @@
+from collections import deque
+
+import numpy as np
+
+class NodeOrdering:
+    """A relabeling of the nodes, kept as forward and inverse permutation arrays.
+
+    `forward[original_id]` is the internal id of a node and `inverse[internal_id]` its
+    original id. Both arrays are 1-based (index 0 is unused), like the node ids.
+    """
+
+    STRATEGIES = ("bfs", "rcm", "degree")
+
+    def __init__(self, forward):
+        self.forward = np.asarray(forward, dtype=np.int64)
+        self.inverse = np.zeros_like(self.forward)
+        self.inverse[self.forward[1:]] = np.arange(1, len(self.forward))
+
+    @classmethod
+    def from_edges(cls, size: int, u, v, strategy: str):
+        """Computes an ordering from undirected edge arrays.
+
+        Args:
+            size (int): Number of nodes.
+            u, v: 1-based endpoint arrays.
+            strategy (str): "bfs" numbers nodes in BFS order, "rcm" uses reverse
+                Cuthill-McKee (BFS from a low-degree node, visiting neighbors by
+                increasing degree, then reversed), and "degree" puts high-degree nodes first.
+
+        Returns:
+            NodeOrdering: The relabeling.
+        """
+        if strategy not in cls.STRATEGIES:
+            raise ValueError(f"Unsupported ordering strategy: {strategy}")
+
+        indptr, indices = _undirected_csr(size, u, v)
+        degrees = np.diff(indptr)
+        if strategy == "degree":
+            order = np.argsort(-degrees, kind="stable")
+        else:
+            order = _traversal_order(indptr, indices, degrees, by_degree=strategy == "rcm")
+            if strategy == "rcm":
+                order = order[::-1]
+
+        forward = np.zeros(size + 1, dtype=np.int64)
+        forward[order + 1] = np.arange(1, size + 1)
+        return cls(forward)
+
+    def to_internal(self, node: int) -> int:
+        """Maps an original node id to its internal id."""
+        return int(self.forward[node])
+
+    def to_original(self, node: int) -> int:
+        """Maps an internal node id back to its original id."""
+        return int(self.inverse[node])
+
+    def nodes_to_original(self, nodes) -> list:
+        """Maps a list of internal ids back to original ids."""
+        return self.inverse[np.asarray(nodes, dtype=np.int64)].tolist() if len(nodes) else []
+
+    def mapping_to_original(self, mapping: dict, node_values: bool = False) -> dict:
+        """Maps the keys (and node-valued entries, when `node_values`) of a dictionary back to original ids."""
+        inverse = self.inverse
+        if node_values:
+            return {int(inverse[key]): (None if value is None else int(inverse[value])) for key, value in mapping.items()}
+        return {int(inverse[key]): value for key, value in mapping.items()}
+
+    def array_to_original(self, values, axis: int = 0):
+        """Reorders an array indexed by internal id - 1 so it is indexed by original id - 1."""
+        return np.take(values, self.forward[1:] - 1, axis=axis)
+
+def _undirected_csr(size: int, u, v):
+    """Builds 0-based CSR arrays holding both directions of every edge."""
+    u, v = np.asarray(u, dtype=np.int64) - 1, np.asarray(v, dtype=np.int64) - 1
+    tails = np.concatenate((u, v))
+    heads = np.concatenate((v, u))
+    order = np.argsort(tails, kind="stable")
+    indptr = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(tails, minlength=size), out=indptr[1:])
+    return indptr, heads[order]
+
+def _traversal_order(indptr, indices, degrees, by_degree: bool):
+    """BFS order over all components, each started from its lowest-degree node.
+
+    With `by_degree`, neighbors are visited by increasing degree (Cuthill-McKee).
+    """
+    size = len(degrees)
+    indptr_list, indices_list, degree_list = indptr.tolist(), indices.tolist(), degrees.tolist()
+    visited = [False] * size
+    order = []
+
+    for start in np.argsort(degrees, kind="stable").tolist():
+        if visited[start]:
+            continue
+        visited[start] = True
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            neighbors = [
+                neighbor for neighbor in indices_list[indptr_list[node]:indptr_list[node + 1]]
+                if not visited[neighbor]
+            ]
+            if by_degree:
+                neighbors.sort(key=degree_list.__getitem__)
+            for neighbor in neighbors:
+                if not visited[neighbor]:
+                    visited[neighbor] = True
+                    queue.append(neighbor)
+
+    return np.array(order, dtype=np.int64)
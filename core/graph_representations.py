@@ -1,34 +1,96 @@
+import numpy as np
+
+from core.graph_stats import deep_sizeof
+
 class AdjacencyMatrix:
-    """Manages the adjacency matrix representation of a graph."""
+    """Manages the adjacency matrix representation of a graph.
+
+    `dtype` is a float type (missing edges are inf), or "bool"/"uint8" for compact
+    unweighted matrices (missing edges are 0). `node_dtype` sets the integer type of
+    node-valued outputs such as CSR indices and hop distances.
+    """
 
-    def __init__(self, size: int):
+    def __init__(self, size: int, dtype="float64", node_dtype=None):
         self.size = size
+        self.dtype = np.dtype(dtype)
+        if self.dtype.kind == "f":
+            self.missing = float('inf')
+        elif self.dtype in (np.dtype(bool), np.dtype(np.uint8)):
+            self.missing = 0
+        else:
+            raise ValueError("Adjacency Matrix dtype must be a float type, or bool/uint8 for unweighted graphs.")
+        self.node_dtype = node_dtype
         self.matrix = self._initialize_matrix()
+        self.ordering = None
 
     def _initialize_matrix(self):
-        """Initializes an adjacency matrix with infinite weights."""
-        import numpy as np
-        matrix = np.full((self.size, self.size), float('inf'))
+        """Initializes an adjacency matrix with infinite weights (zeros for compact unweighted matrices)."""
+        matrix = np.full((self.size, self.size), self.missing, dtype=self.dtype)
         np.fill_diagonal(matrix, 0)
         return matrix
 
     def add_edge(self, u_node: int, v_node: int, weight: float = 1):
         """Adds an edge to the adjacency matrix."""
+        if self.missing == 0 and weight != 1:
+            raise ValueError(f"A {self.dtype} Adjacency Matrix cannot store weighted edges.")
         self.matrix[u_node - 1][v_node - 1] = weight
         if weight == 1:
             self.matrix[v_node - 1][u_node - 1] = weight
 
+    def remove_edge(self, u_node: int, v_node: int):
+        """Removes an edge (in both directions) from the adjacency matrix."""
+        self.matrix[u_node - 1][v_node - 1] = self.missing
+        self.matrix[v_node - 1][u_node - 1] = self.missing
+
+    def has_edge(self, u_node: int, v_node: int) -> bool:
+        """Checks whether the matrix stores an edge from u to v."""
+        weight = self.matrix[u_node - 1][v_node - 1]
+        return weight != float('inf') and weight != 0
+
+    def degree(self, node: int) -> int:
+        """Counts the edges stored in a node's row."""
+        row = self.matrix[node - 1]
+        return int(((row != float('inf')) & (row != 0)).sum())
+
+    def to_csr(self):
+        """Returns the stored edges as 0-based CSR arrays `(indptr, indices)`."""
+        mask = (self.matrix != float('inf')) & (self.matrix != 0)
+        indptr = np.zeros(self.size + 1, dtype=np.int64)
+        np.cumsum(mask.sum(axis=1), out=indptr[1:])
+        return indptr, np.nonzero(mask)[1].astype(self.node_dtype or np.int64)
+
+    def weight_matrix(self):
+        """Returns the weights as floats with inf for missing edges; no copy for float matrices."""
+        if self.dtype.kind == "f":
+            return self.matrix
+        weights = np.where(self.matrix != 0, 1.0, float('inf'))
+        np.fill_diagonal(weights, 0)
+        return weights
+
+    def memory_usage(self) -> int:
+        """Returns the bytes held by the representation, matrix buffer included."""
+        return deep_sizeof(self)
+
     def get_representation(self):
         return self.matrix
 
 
 class AdjacencyList:
-    """Manages the adjacency list representation of a graph."""
+    """Manages the adjacency list representation of a graph.
+
+    With a `dtype`, weights are converted to that type when added: float types round
+    them, integer types reject fractional weights. Array outputs such as
+    `dijkstra_arrays` distances use it.
+    `node_dtype` sets the integer type of node-valued outputs.
+    """
 
-    def __init__(self, size: int, weighted: bool):
+    def __init__(self, size: int, weighted: bool, dtype=None, node_dtype=None):
         self.size = size
         self.weighted = weighted
+        self.dtype = None if dtype is None else np.dtype(dtype)
+        self.node_dtype = node_dtype
         self.list = self._initialize_list()
+        self.ordering = None
 
     def _initialize_list(self):
         """Initializes an adjacency list."""
@@ -40,11 +102,48 @@ class AdjacencyList:
     def add_edge(self, u_node: int, v_node: int, weight: float = 1):
         """Adds an edge to the adjacency list."""
         if self.weighted:
+            if self.dtype is not None:
+                if self.dtype.kind in "iu" and not float(weight).is_integer():
+                    raise ValueError(f"Weight {weight} is not an integer and would be truncated in {self.dtype}.")
+                weight = self.dtype.type(weight).item()
             self.list[u_node][v_node] = weight
             self.list[v_node][u_node] = weight
         else:
             self.list[u_node].append(v_node)
             self.list[v_node].append(u_node)
 
+    def remove_edge(self, u_node: int, v_node: int):
+        """Removes an edge from the adjacency list."""
+        if self.weighted:
+            self.list[u_node].pop(v_node, None)
+            self.list[v_node].pop(u_node, None)
+        else:
+            if v_node in self.list[u_node]:
+                self.list[u_node].remove(v_node)
+            if u_node in self.list[v_node]:
+                self.list[v_node].remove(u_node)
+
+    def has_edge(self, u_node: int, v_node: int) -> bool:
+        """Checks whether the adjacency list stores an edge from u to v."""
+        return v_node in self.list[u_node]
+
+    def degree(self, node: int) -> int:
+        """Counts a node's neighbors."""
+        return len(self.list[node])
+
+    def to_csr(self):
+        """Returns the stored edges as 0-based CSR arrays `(indptr, indices)`."""
+        indptr = np.zeros(self.size + 1, dtype=np.int64)
+        np.cumsum([len(self.list[node]) for node in range(1, self.size + 1)], out=indptr[1:])
+        indices = np.fromiter(
+            (neighbor for node in range(1, self.size + 1) for neighbor in self.list[node]),
+            dtype=np.int64, count=int(indptr[-1]),
+        )
+        return indptr, (indices - 1).astype(self.node_dtype or np.int64, copy=False)
+
+    def memory_usage(self) -> int:
+        """Returns the bytes held by the representation: the dictionary, every neighbor list or dict and their entries."""
+        return deep_sizeof(self)
+
     def get_representation(self):
         return self.list
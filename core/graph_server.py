@@ -0,0 +1,109 @@
+import json
+import math
+import os
+import socketserver
+import threading
+import time
+
+class GraphQueryServer:
+    """Answers newline-delimited JSON queries against a graph that stays loaded in memory.
+
+    Each request is one JSON object per line, for example
+    `{"id": 1, "op": "path", "source": 1, "target": 5}`, and each reply is one JSON
+    line carrying the same `id`, the `result` (or an `error`) and `latency_ms`.
+
+    Supported operations: bfs, dfs, dijkstra, path, components, diameter, flow, metrics.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.lock = threading.Lock()
+        self.operations = {
+            "bfs": lambda query: self.graph.bfs(query["source"]),
+            "dfs": lambda query: self.graph.dfs(query["source"]),
+            "dijkstra": lambda query: self.graph.dijkstra(query["source"]),
+            "path": self._path,
+            "components": lambda query: self.graph.find_connected_components(),
+            "diameter": lambda query: self.graph.calculate_diameter(),
+            "flow": self._flow,
+            "metrics": lambda query: self.graph.get_degree_metrics(),
+        }
+
+    def handle(self, query: dict) -> dict:
+        """Runs one query and builds its reply, turning failures into error replies."""
+        start_time = time.perf_counter()
+        reply = {"id": query.get("id"), "op": query.get("op")}
+        try:
+            operation = self.operations.get(query.get("op"))
+            if operation is None:
+                raise ValueError(f"Unsupported operation: {query.get('op')!r}")
+            with self.lock:
+                reply["result"] = to_json_value(operation(query))
+            reply["ok"] = True
+        except Exception as error:
+            # Any failure of one query, e.g. an out-of-range node on a matrix, must not stop the server.
+            reply["ok"] = False
+            reply["error"] = f"{type(error).__name__}: {error}"
+        reply["latency_ms"] = (time.perf_counter() - start_time) * 1000
+        return reply
+
+    def handle_line(self, line: str) -> str:
+        """Parses a JSON request line and returns the JSON reply line."""
+        try:
+            query = json.loads(line)
+            if not isinstance(query, dict):
+                raise ValueError("Queries must be JSON objects.")
+        except ValueError as error:
+            return json.dumps({"id": None, "ok": False, "error": f"Invalid query: {error}"}) + "\n"
+        return json.dumps(self.handle(query)) + "\n"
+
+    def serve_stream(self, input_stream, output_stream) -> None:
+        """Answers queries from a text stream until it ends, flushing every reply as it is ready."""
+        for line in input_stream:
+            if line.strip():
+                output_stream.write(self.handle_line(line))
+                output_stream.flush()
+
+    def serve_unix_socket(self, socket_path: str) -> None:
+        """Serves queries on a local Unix socket, one connection per thread."""
+        server = self
+
+        class QueryHandler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for raw_line in self.rfile:
+                    line = raw_line.decode("utf-8")
+                    if line.strip():
+                        self.wfile.write(server.handle_line(line).encode("utf-8"))
+                        self.wfile.flush()
+
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        with socketserver.ThreadingUnixStreamServer(socket_path, QueryHandler) as unix_server:
+            unix_server.daemon_threads = True
+            try:
+                unix_server.serve_forever()
+            finally:
+                os.remove(socket_path)
+
+    def _path(self, query: dict) -> dict:
+        path, distance = self.graph.shortest_path(query["source"], query["target"])
+        return {"path": path, "distance": distance}
+
+    def _flow(self, query: dict) -> float:
+        if not self.graph.is_directed:
+            raise ValueError("Ford-Fulkerson is only applicable for directed graphs.")
+        # Flows are kept on the network, so start every query from an empty flow.
+        self.graph.flow_network.reset_flows()
+        return self.graph.ford_fulkerson(query["source"], query["target"])
+
+def to_json_value(value):
+    """Converts algorithm results into JSON-safe values; unreachable (infinite) distances become null."""
+    if isinstance(value, dict):
+        return {str(key): to_json_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_json_value(item) for item in value]
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
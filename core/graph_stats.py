@@ -0,0 +1,98 @@
+import sys
+import time
+import tracemalloc
+import types
+from contextlib import contextmanager
+
+import numpy as np
+
+class AlgorithmStats:
+    """Collects operation counters, phase timings and the memory peak of one algorithm run.
+
+    Algorithms only create this object when called with `collect_stats=True`, and
+    return it next to their usual result.
+    """
+
+    def __init__(self, algorithm: str):
+        self.algorithm = algorithm
+        self.counters = {}
+        self.timings = {}
+        self.peak_memory = 0
+
+    def increment(self, counter: str, amount: int = 1) -> None:
+        """Adds `amount` to an operation counter."""
+        self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    @contextmanager
+    def phase(self, name: str):
+        """Adds the wall-clock time spent inside the block to the `name` phase."""
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start_time
+
+    @contextmanager
+    def track_memory(self):
+        """Records the peak memory allocated inside the block, in bytes.
+
+        Starts `tracemalloc` when it is not already running. Under an outer trace the
+        peak is measured relative to the memory in use when the block starts.
+        """
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        else:
+            tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        try:
+            yield
+        finally:
+            _, peak = tracemalloc.get_traced_memory()
+            self.peak_memory = max(self.peak_memory, peak - baseline)
+            if started:
+                tracemalloc.stop()
+
+    def as_dict(self) -> dict:
+        """Returns the collected statistics as a plain dictionary."""
+        return {
+            "algorithm": self.algorithm,
+            "counters": dict(self.counters),
+            "timings": dict(self.timings),
+            "peak_memory": self.peak_memory,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"AlgorithmStats(algorithm={self.algorithm!r}, counters={self.counters}, "
+            f"timings={self.timings}, peak_memory={self.peak_memory})"
+        )
+
+def deep_sizeof(obj) -> int:
+    """Returns the memory held by an object and everything it references, in bytes.
+
+    `sys.getsizeof` only counts the outer container, so a dict of lists reports a
+    few kilobytes however many edges it holds. This walks dictionaries, lists,
+    tuples, sets and object attributes, counts every object once even when it is
+    shared, and adds the data buffer of NumPy arrays that own their memory (views
+    only count their header, the buffer belongs to the base array).
+    """
+    seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        if isinstance(current, np.ndarray):
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif hasattr(current, "__dict__") and not callable(current) and not isinstance(current, types.ModuleType):
+            stack.append(vars(current))
+    return total
@@ -0,0 +1,162 @@
+from collections.abc import Mapping
+
+import numpy as np
+
+from core.graph_algorithms import GraphAlgorithms
+from core.graph_algorithms import GraphTraversal
+from core.graph_representations import AdjacencyList
+from core.graph_representations import AdjacencyMatrix
+
+class SubgraphView:
+    """Read-only view of the subgraph induced by a set of nodes.
+
+    Keeps a reference to the parent representation and a boolean node mask; the
+    adjacency itself is not copied, neighbors are filtered when they are read.
+    `nodes`, `neighbors`, `degree` and `in` use the parent's node ids.
+
+    `subgraph` presents the same nodes as a representation of its own, renumbered
+    1..k, which the traversal, algorithm and metric classes accept directly (see
+    `traversal`, `algorithms` and `metrics`). Over an Adjacency List it shares the
+    parent's lists through the `index` remapping; an Adjacency Matrix is sliced to a
+    k x k copy, as a dense matrix cannot skip rows in place. `to_parent` and
+    `from_parent` translate between the two numberings.
+
+    With the `ordering` of a reordered graph, the parent ids taken and returned by
+    the methods above are the original ids; `mask`, `node_ids` and `index` keep the
+    representation's internal ids.
+    """
+
+    def __init__(self, representation, mask, ordering=None):
+        self.representation = representation
+        self.ordering = ordering
+        # mask[node - 1] says whether the (internal) node belongs to the view.
+        self.mask = np.asarray(mask, dtype=bool)
+        self.size = representation.size
+        # node_ids[view id - 1] is the parent id; index[parent id] the view id, 0 outside the view.
+        self.node_ids = np.flatnonzero(self.mask) + 1
+        self.index = np.zeros(self.size + 1, dtype=np.int64)
+        self.index[self.node_ids] = np.arange(1, len(self.node_ids) + 1)
+        self.subgraph = self._build_subgraph()
+        self.traversal = GraphTraversal(self.subgraph)
+        self.algorithms = GraphAlgorithms(self.subgraph)
+        self._metrics = None
+
+    @classmethod
+    def from_labels(cls, representation, labels, label: int, ordering=None):
+        """Builds the view of the nodes whose entry in `labels` (indexed by internal node id - 1) equals `label`."""
+        return cls(representation, np.asarray(labels) == label, ordering)
+
+    @classmethod
+    def largest_component(cls, representation, ordering=None):
+        """Builds the view of the largest connected component."""
+        return cls.from_labels(representation, GraphTraversal(representation).component_labels(), 0, ordering)
+
+    @property
+    def metrics(self):
+        """Metrics over the view's subgraph."""
+        if self._metrics is None:
+            from core.graph_metrics import GraphMetrics
+            self._metrics = GraphMetrics(self.subgraph)
+        return self._metrics
+
+    def nodes(self) -> list:
+        """Lists the nodes of the view, in view id order."""
+        return self._original(self.node_ids).tolist()
+
+    def num_nodes(self) -> int:
+        return len(self.node_ids)
+
+    def __contains__(self, node: int) -> bool:
+        return bool(self.mask[self._internal(node) - 1])
+
+    def neighbors(self, node: int) -> list:
+        """Returns the neighbors of a node that are inside the view."""
+        mask = self.mask
+        neighbors = [
+            neighbor for neighbor in GraphTraversal(self.representation).neighbors(self._internal(node))
+            if mask[neighbor - 1]
+        ]
+        return self._original(np.asarray(neighbors, dtype=np.int64)).tolist()
+
+    def degree(self, node: int) -> int:
+        """Counts a node's neighbors inside the view."""
+        return len(self.neighbors(node))
+
+    def to_parent(self, nodes):
+        """Maps view ids (an id, or an array or list of them) to parent ids."""
+        if isinstance(nodes, (int, np.integer)):
+            return int(self._original(self.node_ids[nodes - 1]))
+        return self._original(self.node_ids[np.asarray(nodes, dtype=np.int64) - 1]).tolist() if len(nodes) else []
+
+    def from_parent(self, nodes):
+        """Maps parent ids to view ids; nodes outside the view map to 0."""
+        if isinstance(nodes, (int, np.integer)):
+            return int(self.index[self._internal(nodes)])
+        if not len(nodes):
+            return []
+        return self.index[self._internal(np.asarray(nodes, dtype=np.int64))].tolist()
+
+    def _internal(self, nodes):
+        """Maps parent ids (an id or an array) to the representation's ids."""
+        return nodes if self.ordering is None else self.ordering.forward[nodes]
+
+    def _original(self, nodes):
+        """Maps the representation's ids (an id or an array) to parent ids."""
+        return nodes if self.ordering is None else self.ordering.inverse[nodes]
+
+    def _build_subgraph(self):
+        if isinstance(self.representation, AdjacencyList):
+            return InducedAdjacencyList(self.representation, self.node_ids, self.index)
+        elif isinstance(self.representation, AdjacencyMatrix):
+            parent = self.representation
+            subgraph = AdjacencyMatrix(len(self.node_ids), parent.dtype, parent.node_dtype)
+            positions = self.node_ids - 1
+            subgraph.matrix = parent.matrix[np.ix_(positions, positions)]
+            return subgraph
+        else:
+            raise ValueError("Unsupported graph representation.")
+
+
+class InducedAdjacencyList(AdjacencyList):
+    """Adjacency List over a subset of a parent list's nodes, renumbered 1..k, without copying it.
+
+    Read-only: edges are added to and removed from the parent, and show up here.
+    """
+
+    def __init__(self, parent: AdjacencyList, node_ids, index):
+        self.size = len(node_ids)
+        self.weighted = parent.weighted
+        self.dtype = parent.dtype
+        self.node_dtype = parent.node_dtype
+        self.list = InducedAdjacency(parent.list, node_ids.tolist(), index.tolist())
+        self.ordering = None
+
+    def add_edge(self, u_node: int, v_node: int, weight: float = 1):
+        raise NotImplementedError("Subgraph views are read-only; change the parent graph instead.")
+
+    def remove_edge(self, u_node: int, v_node: int):
+        raise NotImplementedError("Subgraph views are read-only; change the parent graph instead.")
+
+
+class InducedAdjacency(Mapping):
+    """Mapping from view id to neighbors in view ids, read through the parent's adjacency dictionary."""
+
+    def __init__(self, parent_list: dict, node_ids: list, index: list):
+        self.parent_list = parent_list
+        self.node_ids = node_ids
+        self.index = index
+
+    def __getitem__(self, node: int):
+        if not 1 <= node <= len(self.node_ids):
+            raise KeyError(node)
+        index = self.index
+        neighbors = self.parent_list[self.node_ids[node - 1]]
+        if isinstance(neighbors, dict):
+            return {index[neighbor]: weight for neighbor, weight in neighbors.items() if index[neighbor]}
+        return [index[neighbor] for neighbor in neighbors if index[neighbor]]
+
+    def __iter__(self):
+        return iter(range(1, len(self.node_ids) + 1))
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
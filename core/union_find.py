@@ -0,0 +1,49 @@
+import numpy as np
+
+class UnionFind:
+    """Disjoint-set forest with union by size and path halving, backed by flat lists."""
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+        self.sizes = [1] * size
+        self.count = size
+
+    def add(self) -> int:
+        """Adds a new singleton set and returns its element."""
+        self.parent.append(len(self.parent))
+        self.sizes.append(1)
+        self.count += 1
+        return len(self.parent) - 1
+
+    def find(self, element: int) -> int:
+        """Returns the root of the set containing `element`."""
+        parent = self.parent
+        while parent[element] != element:
+            parent[element] = parent[parent[element]]
+            element = parent[element]
+        return element
+
+    def union(self, a: int, b: int) -> bool:
+        """Merges the sets of `a` and `b`; returns False when they were already the same set."""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        if self.sizes[root_a] < self.sizes[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.sizes[root_a] += self.sizes[root_b]
+        self.count -= 1
+        return True
+
+    def set_size(self, element: int) -> int:
+        """Returns the size of the set containing `element`."""
+        return self.sizes[self.find(element)]
+
+    def roots(self) -> np.ndarray:
+        """Returns the root of every element as an array, resolved with vectorized pointer jumping."""
+        roots = np.array(self.parent, dtype=np.int64)
+        while True:
+            jumped = roots[roots]
+            if np.array_equal(jumped, roots):
+                return roots
+            roots = jumped
@@ -1,9 +1,18 @@
 import os
+import random
 import sys
+import tempfile
+
+import numpy as np
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core import Graph
+from core import GraphGenerator
+from core import RepresentationCostModel
+from core.graph_dynamic import DynamicGraphState
+from core.graph_io import GraphIO
+from core.graph_ordering import NodeOrdering
 
 def test_read(filename: str, representation: str, weighted: bool, directed: bool) -> Graph:
     """Initializes a graph from a text file."""
@@ -58,6 +67,542 @@ def test_ford_fulkerson(graph: Graph, source: int, sink: int) -> None:
     else:
         print("Ford-Fulkerson algorithm is only applicable to directed graphs.")
 
+def test_dynamic_updates(graph: Graph, u: int, v: int) -> None:
+    """Tests incremental components and metrics across an edge removal and re-insertion."""
+    graph.track_changes()
+    weight = graph.representation.get_representation()[u][v]
+    graph.remove_edge(u, v)
+    print(f"Without edge ({u}, {v}): {graph.num_edges()} edges, components {graph.find_connected_components()}")
+    print(f"Degree metrics: {graph.get_degree_metrics()}")
+    graph.add_edge(u, v, weight)
+    print(f"With edge ({u}, {v}): {graph.num_edges()} edges, components {graph.find_connected_components()}")
+
+def random_graph(size: int, num_edges: int, representation: str = "Adjacency List", weighted: bool = True,
+                 seed: int = 0) -> Graph:
+    """Builds a G(n, m) graph through the facade, with weights in [1, 10) when weighted."""
+    u, v = GraphGenerator.erdos_renyi(size, num_edges, seed=seed)
+    weights = GraphGenerator.random_weights(len(u), seed=seed) if weighted else [1] * len(u)
+    graph = Graph(size, representation, weighted)
+    for tail, head, weight in zip(u.tolist(), v.tolist(), list(weights)):
+        graph.add_edge(tail, head, float(weight))
+    return graph
+
+def test_landmark_queries(graph: Graph, num_landmarks: int = 4) -> None:
+    """Checks landmark A* distances against plain Dijkstra for pairs spread over the graph."""
+    for strategy in ("farthest", "degree"):
+        graph.build_landmark_index(num_landmarks, strategy, seed=0)
+        for source in range(1, graph.size + 1, 7):
+            distances, _ = graph.dijkstra(source)
+            for target in range(1, graph.size + 1, 3):
+                path, distance = graph.landmark_query(source, target)
+                assert distance == distances[target] or abs(distance - distances[target]) < 1e-6
+                assert not path or (path[0], path[-1]) == (source, target)
+    print(f"Landmark queries ({num_landmarks} landmarks) match Dijkstra")
+
+def test_triangles(graph: Graph, processes: int = None, batch_size: int = 64) -> None:
+    """Checks triangle counts and clustering against testing every pair of neighbors."""
+    neighbors = {node: set(graph.traversal.neighbors(node)) - {node} for node in range(1, graph.size + 1)}
+    expected = [
+        sum(1 for v in neighbors[u] for w in neighbors[u] if v < w and w in neighbors[v])
+        for u in range(1, graph.size + 1)
+    ]
+    triangles, local_clustering = graph.metrics.calculate_triangles(processes, batch_size)
+    assert triangles.tolist() == expected
+    for node, count in enumerate(expected, start=1):
+        degree = len(neighbors[node])
+        assert abs(local_clustering[node - 1] - (2 * count / (degree * (degree - 1)) if degree > 1 else 0.0)) < 1e-12
+    assert graph.calculate_clustering(processes)["triangles"] == sum(expected) // 3
+    print(f"Triangles (processes={processes}) match a brute-force count: {sum(expected) // 3}")
+
+def test_checkpoint_resume(graph: Graph, job: str, batch_size: int = 16) -> None:
+    """Checks that a job stopped after two batches and resumed from its checkpoint matches an uninterrupted run."""
+    with tempfile.TemporaryDirectory() as directory:
+        full = graph.resumable_job(job, os.path.join(directory, "full.npz"), seed=1)
+        full.batch_size = batch_size
+        expected = full.run()
+
+        checkpoint_file = os.path.join(directory, "resumed.npz")
+        first = graph.resumable_job(job, checkpoint_file, seed=1)
+        first.batch_size = batch_size
+        partial = first.run(max_batches=2)
+        assert partial["completed"] == 2 * batch_size
+        resumed = graph.resumable_job(job, checkpoint_file, seed=1)
+        assert resumed.completed == partial["completed"]
+        result = resumed.run()
+        try:
+            graph.resumable_job(job, checkpoint_file, sources=[1, 2, 3])
+            raise AssertionError("Resuming with other sources should fail")
+        except ValueError:
+            pass
+
+    for key, value in expected.items():
+        if hasattr(value, "__len__"):
+            assert len(value) == len(result[key]) and all(
+                a == b or abs(a - b) < 1e-9 for a, b in zip(list(value), list(result[key]))
+            ), key
+        else:
+            assert value == result[key] or abs(value - result[key]) < 1e-9, key
+    print(f"Resumed {job} job matches an uninterrupted run")
+
+def test_export_round_trip(graph: Graph) -> None:
+    """Checks that exported DFS, Dijkstra and component results read back unchanged from npy and CSV."""
+    order, _ = graph.dfs(1)
+    dist, parents = graph.dijkstra(1)
+    components = graph.find_connected_components()
+    expected = graph.file_io.result_arrays(graph.size, order, dist, parents, components)
+    with tempfile.TemporaryDirectory() as directory:
+        prefix = os.path.join(directory, "run")
+        graph.export_results(prefix, "npy", order, dist, parents, components)
+        loaded = graph.file_io.load_arrays(prefix, expected)
+        assert all(np.array_equal(loaded[name], values) for name, values in expected.items())
+
+        written = graph.export_results(prefix, "csv", order, dist, parents, components)
+        assert written == [f"{prefix}.csv", f"{prefix}.order.csv"]
+        table = np.genfromtxt(written[0], delimiter=",", names=True)
+        assert all(np.array_equal(table[name], expected[name]) for name in ("dist", "parent", "component"))
+        assert np.array_equal(np.loadtxt(written[1], skiprows=1, ndmin=1), expected["order"])
+    print("Exported results read back unchanged")
+
+def test_compact_dtypes(filename: str) -> None:
+    """Checks that compact weight and node types load the test graph and reject values they cannot hold."""
+    reference, _ = Graph.from_file(filename, "Adjacency List", weighted=True).dijkstra(1)
+    compact, _ = Graph.from_file(filename, "Adjacency List", weighted=True, dtype="float32").dijkstra(1)
+    assert all(abs(compact[node] - distance) < 1e-6 for node, distance in reference.items())
+
+    order, distances = Graph.from_file(filename, "Adjacency Matrix", node_dtype="int32").bfs_frontier(1)
+    assert distances.dtype == np.int32 and order[0] == 1
+    for weights, dtype, node_dtype in (([16777217.0], "float32", None), ([1.0, 1.00000001], "float32", None),
+                                       ([2.5], "int32", None), ([1.0], None, "uint32")):
+        try:
+            GraphIO.check_dtypes(5, weights, dtype, node_dtype)
+        except ValueError:
+            continue
+        raise AssertionError(f"{weights} should not fit {dtype or node_dtype}")
+    print("Compact dtypes load the test graph and reject values they cannot hold")
+
+def test_reordered_results(size: int = 60, num_edges: int = 90, reorder: str = "rcm") -> None:
+    """Checks that views and checkpointed jobs of a reordered graph report the same original ids as the plain graph."""
+    u, v = GraphGenerator.erdos_renyi(size, num_edges, seed=3)
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "graph.txt")
+        with open(filename, "w", encoding="utf-8") as file:
+            file.write(f"{size}\n" + "".join(f"{a} {b}\n" for a, b in zip(u.tolist(), v.tolist())))
+        plain = Graph.from_file(filename, "Adjacency List")
+        reordered = Graph.from_file(filename, "Adjacency List", reorder=reorder)
+
+        views = [
+            (plain.k_core(2), reordered.k_core(2)),
+            (plain.largest_component(), reordered.largest_component()),
+            (plain.component(1), reordered.component(1)),
+            (plain.subgraph(range(1, 30)), reordered.subgraph(range(1, 30))),
+        ]
+        for expected, view in views:
+            assert sorted(view.nodes()) == sorted(expected.nodes())
+            for node in expected.nodes():
+                assert node in view and sorted(view.neighbors(node)) == sorted(expected.neighbors(node))
+                assert view.to_parent(view.from_parent(node)) == node
+
+        for job in ("eccentricities", "centrality"):
+            expected = plain.resumable_job(job, os.path.join(directory, f"plain-{job}.npz")).run()
+            result = reordered.resumable_job(job, os.path.join(directory, f"reordered-{job}.npz")).run()
+            if job == "eccentricities":
+                assert dict(zip(result["sources"].tolist(), result["eccentricities"].tolist())) == dict(
+                    zip(expected["sources"].tolist(), expected["eccentricities"].tolist())
+                )
+            else:
+                assert np.allclose(result["betweenness"], expected["betweenness"])
+                assert np.allclose(result["closeness"], expected["closeness"])
+    print(f"Views and checkpointed jobs of a {reorder}-reordered graph use the original ids")
+
+def test_weighted_matrix_components(size: int = 40, num_edges: int = 30) -> None:
+    """Checks that a weighted matrix, which stores each edge one way, has the components of the matching list."""
+    u, v = GraphGenerator.erdos_renyi(size, num_edges, seed=5)
+    weights = GraphGenerator.random_weights(len(u), seed=5)
+    expected = sorted(map(sorted, random_graph(size, num_edges, seed=5).find_connected_components()))
+    for reorder in (None, "rcm", "bfs", "degree"):
+        ordering = None if reorder is None else NodeOrdering.from_edges(size, u, v, reorder)
+        graph = Graph(size, "Adjacency Matrix", True, ordering=ordering)
+        for tail, head, weight in zip(u.tolist(), v.tolist(), list(weights)):
+            graph.add_edge(tail, head, float(weight))
+        assert sorted(map(sorted, graph.find_connected_components())) == expected
+        assert sorted(graph.component(tail).nodes()) == next(c for c in expected if tail in c)
+    print("Weighted matrix components match the list under every node ordering")
+
+def test_pair_distances(graph: Graph, weighted: bool, num_pairs: int = 200, seed: int = 0) -> None:
+    """Checks bulk pair distances, from many sources to a few targets, against one full search per pair."""
+    rng = random.Random(seed)
+    sources = [rng.randint(1, graph.size) for _ in range(num_pairs)]
+    targets = [rng.choice([1, 2, 3]) for _ in range(num_pairs)]
+    distances = graph.algorithms.pair_distances(sources, targets, weighted)
+    for source, target, distance in zip(sources, targets, distances.tolist()):
+        if weighted:
+            expected = graph.algorithms.dijkstra(source)[0][target]
+        else:
+            expected = graph.traversal.bfs_distances(source)[0].get(target, float("inf"))
+        assert distance == expected or abs(distance - expected) < 1e-9
+    print(f"Pair distances ({graph.representation_name}, weighted={weighted}) match one search per pair")
+
+def test_shortest_path_repair(size: int = 40, updates: int = 400, seed: int = 0) -> None:
+    """Checks a tracked shortest-path tree against a fresh Dijkstra after random weight changes, inserts and removals."""
+    rng = random.Random(seed)
+    graph = random_graph(size, 60, seed=seed)
+    tree = graph.track_shortest_paths(1)
+    for step in range(updates):
+        u, v = rng.sample(range(1, size + 1), 2)
+        if rng.random() < 0.6:
+            graph.add_edge(u, v, float(rng.randint(1, 9)))
+        else:
+            graph.remove_edge(u, v)
+        if step % 20 == 0:
+            expected, _ = graph.dijkstra(1)
+            adj_list = graph.representation.get_representation()
+            for node, distance in expected.items():
+                repaired = tree.dist.get(node, float("inf"))
+                assert repaired == distance or abs(repaired - distance) < 1e-9
+                parent = tree.parents.get(node)
+                if parent is not None:
+                    assert abs(tree.dist[parent] + adj_list[parent][node] - distance) < 1e-9
+    print(f"Repaired shortest-path tree matches Dijkstra over {updates} updates")
+
+def test_floyd_warshall(size: int = 30, num_edges: int = 60, block_size: int = 7) -> None:
+    """Checks blocked Floyd-Warshall against Dijkstra from every node, its paths, and negative-cycle detection."""
+    reference = random_graph(size, num_edges)
+    graph = Graph(size, "Adjacency Matrix", weighted=True)
+    for node, neighbors in reference.representation.get_representation().items():
+        for neighbor, weight in neighbors.items():
+            graph.add_edge(node, neighbor, weight)
+
+    dist, pred = graph.all_pairs_shortest_paths(block_size=block_size, predecessors=True)
+    compact = graph.all_pairs_shortest_paths("float32", block_size)
+    matrix = graph.representation.get_representation()
+    for source in range(1, size + 1):
+        expected, _ = reference.dijkstra(source)
+        for target in range(1, size + 1):
+            distance = dist[source - 1, target - 1]
+            assert distance == expected[target] or abs(distance - expected[target]) < 1e-9
+            assert distance == compact[source - 1, target - 1] or abs(distance - compact[source - 1, target - 1]) < 1e-4
+            if source != target and distance < float("inf"):
+                # Walk the predecessors back and add up the edge weights.
+                length, node = 0.0, target
+                while node != source:
+                    previous = int(pred[source - 1, node - 1])
+                    length += matrix[previous - 1, node - 1]
+                    node = previous
+                assert abs(length - distance) < 1e-9
+
+    graph.add_edge(1, 2, -1)
+    graph.add_edge(2, 1, -1)
+    try:
+        graph.all_pairs_shortest_paths(block_size=block_size)
+    except ValueError:
+        print("Floyd-Warshall matches Dijkstra from every node and detects negative cycles")
+        return
+    raise AssertionError("A negative cycle should be reported")
+
+def test_matrix_dijkstra(size: int = 30, num_edges: int = 60) -> None:
+    """Checks dense matrix Dijkstra against list Dijkstra and Floyd-Warshall, and that its parents are tight."""
+    reference = random_graph(size, num_edges)
+    graph = Graph(size, "Adjacency Matrix", weighted=True)
+    for node, neighbors in reference.representation.get_representation().items():
+        for neighbor, weight in neighbors.items():
+            graph.add_edge(node, neighbor, weight)
+
+    # A weighted matrix stores add_edge(u, v, w) one way, so Floyd-Warshall covers the directed case.
+    one_way = Graph(size, "Adjacency Matrix", weighted=True)
+    for node, neighbors in reference.representation.get_representation().items():
+        for neighbor, weight in neighbors.items():
+            if node < neighbor:
+                one_way.add_edge(node, neighbor, weight)
+    all_pairs = one_way.all_pairs_shortest_paths()
+
+    matrix = graph.representation.get_representation()
+    for source in range(1, size + 1, 3):
+        expected, _ = reference.dijkstra(source)
+        distances, parents = graph.dijkstra(source)
+        assert distances.keys() == expected.keys()
+        assert all(abs(distances[node] - expected[node]) < 1e-9 for node in expected)
+        assert parents[source] is None
+        for node, parent in parents.items():
+            assert parent is None or abs(distances[parent] + matrix[parent - 1, node - 1] - distances[node]) < 1e-9
+
+        directed, _ = one_way.dijkstra(source)
+        for node, distance in directed.items():
+            expected_distance = all_pairs[source - 1, node - 1]
+            assert distance == expected_distance or abs(distance - expected_distance) < 1e-9
+    print("Matrix Dijkstra matches list Dijkstra and Floyd-Warshall")
+
+def test_matrix_bfs(graph: Graph, batch_size: int = 16) -> None:
+    """Checks frontier and multi-source BFS on a matrix against a queue BFS from each node."""
+    sources = list(range(1, graph.size + 1))
+    all_distances = graph.multi_source_bfs(sources, batch_size)
+    for source in sources:
+        expected, _ = graph.traversal.bfs_distances(source)
+        expected = [expected.get(node, -1) for node in range(1, graph.size + 1)]
+        order, distances = graph.bfs_frontier(source)
+        assert distances.tolist() == expected and all_distances[source - 1].tolist() == expected
+        assert sorted(order) == [node for node in sources if expected[node - 1] >= 0]
+        assert [expected[node - 1] for node in order] == sorted(expected[node - 1] for node in order)
+    print("Frontier and multi-source BFS match a queue BFS from every node")
+
+def test_lazy_traversals(graph: Graph, radius: int = 2) -> None:
+    """Checks lazy BFS/DFS walks, depth limits and early-stopping paths against a full BFS."""
+    for start in range(1, graph.size + 1, 5):
+        expected, _ = graph.traversal.bfs_distances(start)
+        walk = list(graph.iter_bfs(start))
+        assert {node: depth for node, depth, _ in walk} == expected and len(walk) == len(expected)
+        assert graph.neighborhood(start, radius) == {node: d for node, d in expected.items() if d <= radius}
+
+        depths = {}
+        for node, depth, parent in graph.iter_dfs(start):
+            assert node not in depths
+            assert parent is None or (depth == depths[parent] + 1 and node in graph.traversal.neighbors(parent))
+            depths[node] = depth
+        assert depths.keys() == expected.keys()
+        assert all(depth <= radius for _, depth, _ in graph.iter_dfs(start, radius))
+
+        for target, distance in list(expected.items())[::7]:
+            path, hops = graph.traversal.hop_path(start, target)
+            assert hops == distance and len(path) == distance + 1 and path[-1] == target
+    print(f"Lazy traversals ({graph.representation_name}) match a full BFS")
+
+def test_bit_parallel_bfs(graph: Graph) -> None:
+    """Checks bit-parallel eccentricities and distance histograms against one BFS per source."""
+    eccentricities, histogram = {}, {}
+    for source in range(1, graph.size + 1):
+        distances, _ = graph.traversal.bfs_distances(source)
+        eccentricities[source] = max(distances.values())
+        for distance in distances.values():
+            histogram[distance] = histogram.get(distance, 0) + 1
+    expected_histogram = [histogram.get(distance, 0) for distance in range(max(histogram) + 1)]
+
+    assert graph.calculate_eccentricities() == eccentricities
+    assert graph.calculate_distance_histogram() == expected_histogram
+    assert graph.calculate_diameter() == max(eccentricities.values())
+    sources = list(range(3, graph.size + 1, 4))
+    assert graph.calculate_eccentricities(sources) == {source: eccentricities[source] for source in sources}
+    print(f"Bit-parallel BFS over {graph.size} sources matches one BFS per source")
+
+def test_spanning_forest(size: int = 60, num_edges: int = 70, seed: int = 0) -> None:
+    """Checks Kruskal, chunked Kruskal and Prim forests against a plain Kruskal over sorted edges."""
+    graph = random_graph(size, num_edges, seed=seed)
+    edges = sorted(
+        (weight, node, neighbor)
+        for node, neighbors in graph.representation.get_representation().items()
+        for neighbor, weight in neighbors.items() if node < neighbor
+    )
+    leader = list(range(size + 1))
+
+    def find(node):
+        while leader[node] != node:
+            node = leader[node]
+        return node
+
+    expected_weight, expected_edges = 0.0, 0
+    for weight, node, neighbor in edges:
+        if find(node) != find(neighbor):
+            leader[find(node)] = find(neighbor)
+            expected_weight += weight
+            expected_edges += 1
+
+    u, v, weights = zip(*((node, neighbor, weight) for weight, node, neighbor in edges))
+    forests = [
+        graph.minimum_spanning_forest(),
+        random_graph(size, num_edges, "Adjacency Matrix", seed=seed).minimum_spanning_forest(),
+        graph.algorithms.kruskal_edges(size, np.array(u), np.array(v), np.array(weights), chunk_size=5),
+    ]
+    for forest_u, forest_v, forest_weights, total_weight in forests:
+        assert len(forest_u) == expected_edges and abs(total_weight - expected_weight) < 1e-9
+        assert abs(float(np.sum(forest_weights)) - total_weight) < 1e-9
+        leader = list(range(size + 1))
+        for node, neighbor in zip(np.asarray(forest_u).tolist(), np.asarray(forest_v).tolist()):
+            assert find(node) != find(neighbor) and graph.representation.has_edge(node, neighbor)
+            leader[find(node)] = find(neighbor)
+    print(f"Spanning forests weigh {expected_weight:.3f} like a plain Kruskal")
+
+def test_core_numbers(graph: Graph) -> None:
+    """Checks core numbers, the degeneracy ordering and k-core views against naive peeling."""
+    neighbors = {node: set(graph.traversal.neighbors(node)) - {node} for node in range(1, graph.size + 1)}
+    expected = {node: 0 for node in neighbors}
+    remaining = set(neighbors)
+    k = 1
+    while remaining:
+        # Peel nodes of degree below k until none is left; the survivors form the k-core.
+        peeled = True
+        while peeled:
+            peeled = {node for node in remaining if len(neighbors[node] & remaining) < k}
+            remaining -= peeled
+        for node in remaining:
+            expected[node] = k
+        k += 1
+
+    core_numbers, degeneracy, ordering = graph.calculate_core_numbers()
+    assert core_numbers.tolist() == [expected[node] for node in range(1, graph.size + 1)]
+    assert degeneracy == max(expected.values()) and sorted(ordering.tolist()) == list(range(1, graph.size + 1))
+    position = {node: index for index, node in enumerate(ordering.tolist())}
+    for node in neighbors:
+        later = sum(1 for neighbor in neighbors[node] if position[neighbor] > position[node])
+        assert later <= expected[node]
+    for k in range(1, degeneracy + 1):
+        view = graph.k_core(k)
+        assert sorted(view.nodes()) == sorted(node for node in neighbors if expected[node] >= k)
+        assert all(view.degree(node) >= k for node in view.nodes())
+    print(f"Core numbers (degeneracy {degeneracy}) match naive peeling")
+
+def test_centrality(graph: Graph, samples: int = 20) -> None:
+    """Checks exact and sampled centrality against brute-force shortest-path counting."""
+    size = graph.size
+    distances, path_counts = {}, {}
+    for source in range(1, size + 1):
+        dist, _ = graph.traversal.bfs_distances(source)
+        counts = {source: 1}
+        for node in sorted(dist, key=dist.get)[1:]:
+            counts[node] = sum(counts[n] for n in graph.traversal.neighbors(node) if dist.get(n) == dist[node] - 1)
+        distances[source], path_counts[source] = dist, counts
+
+    betweenness, closeness = np.zeros(size), np.zeros(size)
+    for s in range(1, size + 1):
+        for t in range(s + 1, size + 1):
+            if t not in distances[s]:
+                continue
+            for v in range(1, size + 1):
+                if v not in (s, t) and v in distances[s] and distances[s][v] + distances[v][t] == distances[s][t]:
+                    betweenness[v - 1] += path_counts[s][v] * path_counts[v][t] / path_counts[s][t]
+        reached = [distance for distance in distances[s].values() if distance > 0]
+        closeness[s - 1] = len(reached) / sum(reached) if reached else 0.0
+
+    exact = graph.estimate_centrality(samples=size, seed=0)
+    assert np.allclose(exact["betweenness"], betweenness) and np.allclose(exact["closeness"], closeness)
+    # With every node as a source there is nothing left to sample: the intervals collapse.
+    assert np.allclose(exact["betweenness_low"], exact["betweenness_high"])
+
+    sampled = graph.estimate_centrality(samples=samples, seed=0)
+    parallel = graph.estimate_centrality(samples=samples, seed=0, processes=2)
+    assert all(np.allclose(sampled[key], parallel[key]) for key in sampled)
+    for name, truth in (("betweenness", betweenness), ("closeness", closeness)):
+        low, estimate, high = sampled[f"{name}_low"], sampled[name], sampled[f"{name}_high"]
+        assert np.all(low <= estimate + 1e-9) and np.all(estimate <= high + 1e-9)
+        covered = np.mean((low <= truth + 1e-9) & (truth <= high + 1e-9))
+        assert covered >= 0.75, (name, covered)
+    print(f"Centrality is exact with every source and its {samples}-source intervals cover the true values")
+
+def test_diameter_bounds(graph: Graph) -> None:
+    """Checks that every anytime diameter bound brackets the diameter from one BFS per node."""
+    diameter = max(
+        max(graph.traversal.bfs_distances(source)[0].values()) for source in range(1, graph.size + 1)
+    )
+    previous = None
+    for bounds in graph.iter_diameter_bounds():
+        assert bounds["lower"] <= diameter <= bounds["upper"]
+        if previous is not None:
+            assert previous["lower"] <= bounds["lower"] and bounds["upper"] <= previous["upper"]
+        previous = bounds
+    assert previous["exact"] and previous["lower"] == diameter
+
+    budgeted = graph.estimate_diameter(max_bfs=1)
+    assert budgeted["bfs_runs"] == 1 and budgeted["lower"] <= diameter <= budgeted["upper"]
+    assert graph.calculate_approximate_diameter(5, seed=0) <= diameter == graph.calculate_diameter()
+    print(f"Diameter bounds bracket the diameter {diameter} and meet after {previous['bfs_runs']} BFS runs")
+
+def test_subgraph_views(graph: Graph, seed: int = 0) -> None:
+    """Checks induced subgraph views against the parent adjacency filtered to the kept nodes."""
+    rng = random.Random(seed)
+    kept = set(rng.sample(range(1, graph.size + 1), graph.size // 2))
+    view = graph.subgraph(sorted(kept))
+    assert sorted(view.nodes()) == sorted(kept) and view.num_nodes() == len(kept)
+    for node in range(1, graph.size + 1):
+        assert (node in view) == (node in kept)
+    for node in kept:
+        expected = sorted(neighbor for neighbor in graph.traversal.neighbors(node) if neighbor in kept)
+        assert sorted(view.neighbors(node)) == expected
+        # The renumbered subgraph holds the same edges in view ids.
+        inner = view.traversal.neighbors(view.from_parent(node))
+        assert sorted(view.to_parent(list(inner))) == expected
+
+    # BFS on the view equals a BFS that never leaves the kept nodes.
+    start = min(kept)
+    distances, _ = view.traversal.bfs_distances(view.from_parent(start))
+    expected, queue = {start: 0}, [start]
+    for node in queue:
+        for neighbor in graph.traversal.neighbors(node):
+            if neighbor in kept and neighbor not in expected:
+                expected[neighbor] = expected[node] + 1
+                queue.append(neighbor)
+    assert {view.to_parent(node): distance for node, distance in distances.items()} == expected
+
+    largest = max(graph.find_connected_components(), key=len)
+    assert sorted(graph.largest_component().nodes()) == sorted(largest)
+    assert sorted(graph.component(largest[0]).nodes()) == sorted(largest)
+    if graph.representation_name == "Adjacency List":
+        # List views share the parent's lists: parent edits show through, and the view is read-only.
+        u, v = sorted(kept)[:2]
+        graph.add_edge(u, v)
+        assert v in view.neighbors(u)
+        try:
+            view.subgraph.add_edge(1, 2)
+            raise AssertionError("List views should be read-only")
+        except NotImplementedError:
+            pass
+    print(f"Subgraph views ({graph.representation_name}) match the filtered parent adjacency")
+
+def test_cost_model(size: int = 2000, num_edges: int = 10000) -> None:
+    """Checks memory estimates against measured sizes and the representation choices of the cost model."""
+    model = RepresentationCostModel()
+    for representation in ("Adjacency List", "Adjacency Matrix"):
+        for weighted in (False, True):
+            graph = random_graph(size, num_edges, representation, weighted)
+            measured = graph.memory_usage()
+            estimate = model.estimate_memory(representation, size, num_edges, weighted)
+            assert abs(estimate - measured["representation"]) <= 0.15 * measured["representation"]
+            assert measured["total"] >= measured["representation"]
+
+    # Floyd-Warshall only runs on matrices, dense Dijkstra pays off on small graphs only,
+    # matrix DFS recurses once per node, and a memory limit rules out the matrix.
+    assert model.estimate_time("Adjacency List", "all_pairs", size, num_edges) == float("inf")
+    assert model.choose(100, 4000, True, ("dijkstra",)) == "Adjacency Matrix"
+    assert model.choose(2000, 4000, True, ("dijkstra",)) == "Adjacency List"
+    assert model.choose(1500, 600000, algorithms=("components", "dfs")) == "Adjacency List"
+    assert model.choose(500, 60000, algorithms=("components", "dfs")) == "Adjacency Matrix"
+    assert model.choose(2000, 200000, algorithms=("diameter",)) == "Adjacency Matrix"
+    list_bytes = model.estimate_memory("Adjacency List", 2000, 200000)
+    assert model.choose(2000, 200000, algorithms=("diameter",), memory_limit=list_bytes) == "Adjacency List"
+    try:
+        model.choose(500, 60000, memory_limit=1000)
+        raise AssertionError("No representation fits in 1000 bytes")
+    except ValueError:
+        pass
+    assert Graph(500, "auto", num_edges=60000, algorithms=("components",)).representation_name == "Adjacency Matrix"
+
+    table = {algorithm: dict(costs) for algorithm, costs in RepresentationCostModel.NS_PER_UNIT.items()}
+    calibrated = RepresentationCostModel.calibrate(200, 600, seed=0)
+    assert RepresentationCostModel.NS_PER_UNIT == table and calibrated.ns_per_unit.keys() == table.keys()
+    assert calibrated.choose(200, 600) in ("Adjacency List", "Adjacency Matrix")
+    print("Cost model estimates match measured memory and rule out what cannot run")
+
+def test_dynamic_components(representation: str, weighted: bool, size: int = 40, updates: int = 2000,
+                            seed: int = 0) -> None:
+    """Checks incremental components, edge count and degree metrics against a rebuilt state and the traversal."""
+    rng = random.Random(seed)
+    graph = Graph(size, representation, weighted)
+    graph.track_changes()
+    for step in range(updates):
+        u, v = rng.sample(range(1, size + 1), 2)
+        if rng.random() < 0.5:
+            # Weights other than 1 make a matrix store the edge one way only.
+            graph.add_edge(u, v, rng.choice([2, 2.5]) if weighted else 1)
+        else:
+            graph.remove_edge(u, v)
+        if step % 50 == 0:
+            fresh = DynamicGraphState(graph.representation)
+            assert graph.num_edges() == fresh.num_edges
+            components = sorted(map(sorted, graph.find_connected_components()))
+            assert components == sorted(map(sorted, fresh.connected_components()))
+            # Without tracking, the facade falls back to the traversal; both must agree.
+            assert components == sorted(map(sorted, graph.traversal.connected_components()))
+            assert graph.get_degree_metrics() == fresh.degree_metrics()
+    # Splits add union-find elements; compaction keeps them proportional to the graph.
+    assert len(graph.dynamic.components.parent) <= 2 * size + 1
+    print(f"Dynamic components ({representation}, weighted={weighted}) match a rebuild over {updates} updates")
+
 if __name__ == "__main__":
     test_graph_path = os.path.join("data", "part_2", "test_graph.txt")
     test_info_path = os.path.join("data", "part_2", "test_graph_info.txt")
@@ -78,6 +623,47 @@ if __name__ == "__main__":
     # Test Ford-Fulkerson algorithm
     test_ford_fulkerson(graph_list, source=1, sink=5)
 
+    # Test incremental updates
+    test_dynamic_updates(graph_list, u=3, v=5)
+    for representation in ("Adjacency List", "Adjacency Matrix"):
+        for weighted in (False, True):
+            test_dynamic_components(representation, weighted)
+
+    # Brute-force checks of the faster algorithms
+    test_landmark_queries(random_graph(200, 300))
+    test_shortest_path_repair()
+    test_floyd_warshall()
+    test_matrix_dijkstra()
+    test_matrix_bfs(random_graph(70, 90, "Adjacency Matrix", weighted=False))
+    for representation in ("Adjacency List", "Adjacency Matrix"):
+        test_lazy_traversals(random_graph(60, 80, representation, weighted=False))
+    # More than 64 sources, so the bit-parallel BFS needs several passes.
+    test_bit_parallel_bfs(random_graph(150, 200, weighted=False))
+    test_spanning_forest()
+    for representation in ("Adjacency List", "Adjacency Matrix"):
+        test_core_numbers(random_graph(80, 240, representation, weighted=False))
+    test_centrality(random_graph(50, 100, weighted=False))
+    # A sparse graph has several components and long paths; a denser one a small diameter.
+    for num_edges in (90, 300):
+        test_diameter_bounds(random_graph(100, num_edges, weighted=False))
+    for representation in ("Adjacency List", "Adjacency Matrix"):
+        test_subgraph_views(random_graph(60, 120, representation, weighted=False))
+    test_cost_model()
+    for representation in ("Adjacency List", "Adjacency Matrix"):
+        test_triangles(random_graph(80, 600, representation, weighted=False))
+    test_triangles(random_graph(80, 600), processes=2)
+    for job in ("eccentricities", "centrality"):
+        test_checkpoint_resume(random_graph(100, 250), job)
+    # A sparse graph leaves unreachable nodes; a dense one visits every node, so the order spans the graph.
+    test_export_round_trip(random_graph(100, 80))
+    test_export_round_trip(random_graph(60, 400))
+    test_compact_dtypes(test_graph_path)
+    test_reordered_results()
+    test_weighted_matrix_components()
+    test_pair_distances(random_graph(60, 90), weighted=True)
+    # A weighted matrix stores each edge one way, so hop searches must not start from the targets.
+    test_pair_distances(random_graph(60, 90, "Adjacency Matrix"), weighted=False)
+
 '''
 test_graph
 #1_0.1>_#2